@@ -1,54 +1,62 @@
-from .adapters import (  # noqa
-    DynawoParserJOBS,
-    DynawoParserDYD,
-    DynawoParserIIDM,
-    DynawoParserPAR,
-    DynawoParserCRV,
-    DynawoSerializerJOBS,
-    DynawoSerializerIIDM,
-    DynawoSerializerDYD,
-    DynawoSerializerPAR,
-    DynawoSerializerCRV,
-    HelicsParserXML,
-    DynawoSimulation,
-    DynawoParameter,
-    DynawoParameterType,
-    DynawoReference,
-    DynawoParameterSet,
-    DynawoSimulationParameters,
-    HelicsSerializerJSON,
-    DynawoCurves,
-    Curve,
-)
+from cycosim.utils.lazy_loading import lazy_attributes
 
-from .domain import (  # noqa
-    Parser,
-    ParsedFileObject,
-    Serializer,
-    ObjectToSerialize,
-    FileType,
-    Bus,
-    Switch,
-    Generator,
-    Load,
-    ShuntCompensator,
-    StaticVARCompensator,
-    Edge,
-    ACLine,
-    Transformer,
-    PowerSystemModel,
-    SimulationModel,
-    InputFile,
-    DynamicComponent,
-    StaticReference,
-    Connection,
-    Connector,
-    DynamicModel,
-    ExternalElement,
-    Cosimulation,
-    SimulationConnection,
+# The attributes are imported from their module on first access, see lazy_attributes
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "DynawoParserJOBS": ".adapters",
+        "DynawoParserDYD": ".adapters",
+        "DynawoParserIIDM": ".adapters",
+        "DynawoParserPAR": ".adapters",
+        "DynawoParserCRV": ".adapters",
+        "DynawoSerializerJOBS": ".adapters",
+        "DynawoSerializerIIDM": ".adapters",
+        "DynawoSerializerDYD": ".adapters",
+        "DynawoSerializerPAR": ".adapters",
+        "DynawoSerializerCRV": ".adapters",
+        "HelicsParserXML": ".adapters",
+        "DynawoSimulation": ".adapters",
+        "DynawoParameter": ".adapters",
+        "DynawoParameterType": ".adapters",
+        "DynawoReference": ".adapters",
+        "DynawoParameterSet": ".adapters",
+        "DynawoParameterStore": ".adapters",
+        "DynawoSimulationParameters": ".adapters",
+        "HelicsSerializerJSON": ".adapters",
+        "HelicsSerializerIndexMap": ".adapters",
+        "DynawoCurves": ".adapters",
+        "Curve": ".adapters",
+        "SymbolTable": ".adapters",
+        "SymbolKind": ".adapters",
+        "Parser": ".domain",
+        "ParsedFileObject": ".domain",
+        "Serializer": ".domain",
+        "ObjectToSerialize": ".domain",
+        "FileType": ".domain",
+        "Bus": ".domain",
+        "Switch": ".domain",
+        "Generator": ".domain",
+        "Load": ".domain",
+        "ShuntCompensator": ".domain",
+        "StaticVARCompensator": ".domain",
+        "Edge": ".domain",
+        "ACLine": ".domain",
+        "Transformer": ".domain",
+        "PowerSystemModel": ".domain",
+        "SimulationModel": ".domain",
+        "InputFile": ".domain",
+        "DynamicComponent": ".domain",
+        "StaticReference": ".domain",
+        "Connection": ".domain",
+        "Connector": ".domain",
+        "DynamicModel": ".domain",
+        "ExternalElement": ".domain",
+        "Cosimulation": ".domain",
+        "SimulationConnection": ".domain",
+        "DynawoGlobalParser": ".services",
+        "HelicsGlobalParser": ".services",
+        "GlobalSerializer": ".services",
+        "ParseCache": ".services",
+        "remove_superfluous": ".utils",
+    },
 )
-
-from .services import DynawoGlobalParser, HelicsGlobalParser, GlobalSerializer  # noqa
-
-from .utils import remove_superfluous  # noqa
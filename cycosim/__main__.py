@@ -2,10 +2,30 @@
 Entry point of CYPRESS Co-Simulation Platform
 """
 import os
+import sys
+import cProfile
+import importlib
 import argparse
-from cycosim.services.input_files import DynawoGlobalParser, HelicsGlobalParser
-from cycosim.domain.ports import FileType, Simulation
-from cycosim.adapters.simulations import DynawoSimulation
+from cycosim.services.input_files import (
+    DynawoGlobalParser,
+    HelicsGlobalParser,
+    ParseCache,
+    parse_dynawo_files,
+    intern_simulation,
+)
+from cycosim.services.input_files.parse_cache import DEFAULT_CACHE_DIRECTORY, DEFAULT_MAX_SIZE
+from cycosim.domain.ports import FileType, Simulation, Cosimulation
+from cycosim.adapters.registry import power_system_simulators, cosimulators
+from cycosim.utils import Profiler, profile_stage
+
+# The module of every command, whose main function is given the arguments following the command
+commands = {
+    "diff": "cycosim.services.power_system.diff",
+    "contingencies": "cycosim.services.power_system.contingencies",
+    "run": "cycosim.services.batch.job_runner",
+    "topology": "cycosim.services.power_system.topology",
+    "dc_flow": "cycosim.services.power_system.dc_power_flow",
+}
 
 
 def make_valid_path(path: str):
@@ -17,25 +37,42 @@ def make_valid_path(path: str):
         return os.path.join(os.getcwd(), path)
 
 
-def configure_dynawo_simulation(args) -> Simulation:
+def configure_parse_cache(args) -> ParseCache:
+    """_summary_
+    Returns the cache of the parsed files to use, None if it has been disabled.
+    The cache is emptied first if asked in the command line.
+    """
+    cache = ParseCache(args.cache_dir, int(args.cache_max_size * 1024 * 1024))
+    if args.clear_cache:
+        cache.clear()
+
+    if args.no_cache:
+        return None
+    return cache
+
+
+def configure_dynawo_simulation(args, simulation: Simulation, cache: ParseCache = None) -> Simulation:
     """_summary_
     Takes as input the arguments given in the command line, checks the validity of
-    dynawo related files and parse them to return a DynawoSimulation object.
+    dynawo related files and parse them to fill the given DynawoSimulation object.
+    The parsed files are loaded from the given cache when possible.
+    Once the JOBS file is parsed, the other files can be parsed in parallel.
     """
-    simulation = DynawoSimulation()
+    args.dynawo_data = make_valid_path(args.dynawo_data)
 
     # Retrieve the JOBS data
     parser = None
-    if args.jobs is not None:
-        if os.path.exists(os.path.join(args.dynawo_data, args.jobs)):
-            parser = DynawoGlobalParser(os.path.join(args.dynawo_data, args.jobs))
-        else:
-            raise FileNotFoundError(f"The given jobs file '{args.jobs}' does not exist.")
+    with profile_stage("discovery"):
+        if args.jobs is not None:
+            if os.path.exists(os.path.join(args.dynawo_data, args.jobs)):
+                parser = DynawoGlobalParser(os.path.join(args.dynawo_data, args.jobs), _cache=cache)
+            else:
+                raise FileNotFoundError(f"The given jobs file '{args.jobs}' does not exist.")
 
-    else:
-        for file in os.listdir(args.dynawo_data):
-            if file.endswith(".jobs"):
-                parser = DynawoGlobalParser(os.path.join(args.dynawo_data, file))
+        else:
+            for file in os.listdir(args.dynawo_data):
+                if file.endswith(".jobs"):
+                    parser = DynawoGlobalParser(os.path.join(args.dynawo_data, file), _cache=cache)
 
     if parser is None:
         raise FileNotFoundError(
@@ -43,43 +80,85 @@ def configure_dynawo_simulation(args) -> Simulation:
             "You can specify the folder where the dynawo files are with "
             "the flag '--dynawo_data path/to/dynawo/files/'."
         )
-    simulation.simulation_parameters = parser.parse()
+    with profile_stage("parsing"):
+        simulation.simulation_parameters = parser.parse()
+    if not args.rewrite_all:
+        simulation.source_keys["simulation_parameters"] = parser.get_cache_key()
+
+    with profile_stage("discovery"):
+        # Retrieve the three other mandatory files (IIDM, PAR, DYD)
+        file_types = [FileType.IIDM, FileType.PAR, FileType.DYD]
+        jobs_param = [
+            simulation.simulation_parameters.iidm_file,
+            simulation.simulation_parameters.network_parameter_file,
+            simulation.simulation_parameters.dyd_file,
+        ]
 
-    # Retrieve the three other mandatory files (IIDM, PAR, DYD)
-    file_types = [FileType.IIDM, FileType.PAR, FileType.DYD]
-    jobs_param = [
-        simulation.simulation_parameters.iidm_file,
-        simulation.simulation_parameters.network_parameter_file,
-        simulation.simulation_parameters.dyd_file,
-    ]
+        # The simulation attribute and the path of every file to parse
+        files_to_parse = {}
 
-    for cnt, f_t, j_p in zip(range(len(file_types)), file_types, jobs_param):
-        if j_p is None:
-            raise AttributeError(f"No {f_t} file has been specified in the JOBS file.")
+        for cnt, f_t, j_p in zip(range(len(file_types)), file_types, jobs_param):
+            if j_p is None:
+                raise AttributeError(f"No {f_t} file has been specified in the JOBS file.")
 
-        if not os.path.exists(os.path.join(args.dynawo_data, j_p)):
-            raise FileNotFoundError(f"The specified {f_t} file does not exist in folder '{args.dynawo_data}'.")
+            if not os.path.exists(os.path.join(args.dynawo_data, j_p)):
+                raise FileNotFoundError(f"The specified {f_t} file does not exist in folder '{args.dynawo_data}'.")
 
-        if f_t == FileType.IIDM:
-            simulation.static_network = DynawoGlobalParser(os.path.join(args.dynawo_data, j_p)).parse()
-        elif f_t == FileType.PAR:
-            simulation.parameter_sets = DynawoGlobalParser(os.path.join(args.dynawo_data, j_p)).parse()
-        elif f_t == FileType.DYD:
-            simulation.dynamic_network = DynawoGlobalParser(os.path.join(args.dynawo_data, j_p)).parse()
+            if f_t == FileType.IIDM:
+                files_to_parse["static_network"] = os.path.join(args.dynawo_data, j_p)
+            elif f_t == FileType.PAR:
+                files_to_parse["parameter_sets"] = os.path.join(args.dynawo_data, j_p)
+            elif f_t == FileType.DYD:
+                files_to_parse["dynamic_network"] = os.path.join(args.dynawo_data, j_p)
 
-    # Check for non-mandatory files and parse them
-    file_types = [FileType.CRV]
-    jobs_param = [simulation.simulation_parameters.crv_file]
+        # Check for non-mandatory files and parse them
+        file_types = [FileType.CRV]
+        jobs_param = [simulation.simulation_parameters.crv_file]
 
-    for cnt, f_t, j_p in zip(range(len(file_types)), file_types, jobs_param):
-        if j_p is None:
-            continue
+        for cnt, f_t, j_p in zip(range(len(file_types)), file_types, jobs_param):
+            if j_p is None:
+                continue
 
-        if not os.path.exists(os.path.join(args.dynawo_data, j_p)):
-            raise FileNotFoundError(f"The specified {f_t} file does not exist in folder '{args.dynawo_data}'.")
+            if not os.path.exists(os.path.join(args.dynawo_data, j_p)):
+                raise FileNotFoundError(f"The specified {f_t} file does not exist in folder '{args.dynawo_data}'.")
 
-        if f_t == FileType.CRV:
-            simulation.curves = DynawoGlobalParser(os.path.join(args.dynawo_data, j_p)).parse()
+            if f_t == FileType.CRV:
+                files_to_parse["curves"] = os.path.join(args.dynawo_data, j_p)
+
+    with profile_stage("parsing"):
+        # The keys of the parsed files tell which serialized files are up to date without serializing them
+        parsed_objects = parse_dynawo_files(
+            list(files_to_parse.values()), args.streaming, cache, args.parallel, args.compact, not args.rewrite_all
+        )
+        for attribute, parsed_obj in zip(files_to_parse, parsed_objects):
+            if not args.rewrite_all:
+                parsed_obj, simulation.source_keys[attribute] = parsed_obj
+            setattr(simulation, attribute, parsed_obj)
+
+    if args.intern:
+        with profile_stage("interning"):
+            report = intern_simulation(simulation)
+        print(
+            f"Interning : {report['bytes_saved'] / (1024 * 1024):.1f} MB saved, "
+            f"{report.get('parameter_sets', {}).get('shared_sets', 0)} parameter sets sharing their parameters."
+        )
+
+    if args.topology:
+        with profile_stage("topology"):
+            from cycosim.services.power_system.topology import Topology, get_summary_lines
+
+            for line in get_summary_lines(Topology.from_network(simulation.static_network)):
+                print(line)
+
+    if args.dc_screening:
+        with profile_stage("dc_screening"):
+            from cycosim.services.power_system.dc_power_flow import DCPowerFlow
+
+            for line in DCPowerFlow.from_network(simulation.static_network).screen()[0].get_lines():
+                print(line)
+
+    with profile_stage("symbol_table"):
+        simulation.build_symbol_table()
 
     # Create the folder where we gonna store the serialized files used for the dynawo simulation
     out_path = os.path.join(args.dynawo_data, "serialized/")
@@ -89,12 +168,21 @@ def configure_dynawo_simulation(args) -> Simulation:
     return simulation
 
 
-def configure_helics_cosimulation(args, pw_sys_sim: Simulation):
+def configure_helics_cosimulation(
+    args, cosimulation: Cosimulation, pw_sys_sim: Simulation, cache: ParseCache = None
+) -> Cosimulation:
+    """_summary_
+    Parses the HELICS file of the folder given in the command line and fills the given
+    HelicsCosimulation object with the federate it describes, attached to the power system simulation.
+    """
+    args.helics_data = make_valid_path(args.helics_data)
+
     # Retrieve the Helics data
     parser = None
-    for file in os.listdir(args.helics_data):
-        if file.endswith(".xml"):
-            parser = HelicsGlobalParser(os.path.join(args.helics_data, file))
+    with profile_stage("discovery"):
+        for file in os.listdir(args.helics_data):
+            if file.endswith(".xml"):
+                parser = HelicsGlobalParser(os.path.join(args.helics_data, file), cache)
 
     if parser is None:
         raise FileNotFoundError(
@@ -102,34 +190,93 @@ def configure_helics_cosimulation(args, pw_sys_sim: Simulation):
             "You can specify the folder where the helics files are with "
             "the flag '--helics_data path/to/helics/files/'."
         )
-    cosimulation = parser.parse()
+    with profile_stage("parsing"):
+        cosimulation.power_system_federate = parser.parse().power_system_federate
+    if not args.rewrite_all:
+        cosimulation.power_system_federate.source_key = parser.get_cache_key()
 
     # Attach the power system simulation to the cosimulation
+    cosimulation.power_system_federate.name = args.pow_sys_sim.capitalize()
     cosimulation.power_system_federate.simulation = pw_sys_sim
 
+    if args.packed:
+        cosimulation.power_system_federate.packed = True
+    if args.vector_size is not None:
+        cosimulation.power_system_federate.vector_size = args.vector_size
+
+    # The packed mode may also be asked in the HELICS file
+    if cosimulation.power_system_federate.packed and not getattr(pw_sys_sim, "reads_vector_publications", False):
+        raise ValueError(
+            f"The packed mode can not be used with the {args.pow_sys_sim} simulation, which does not read the "
+            "vector publications."
+        )
+
     return cosimulation
 
 
+# The function filling every registered simulator and cosimulator from the command line arguments
+simulation_configurations = {"dynawo": configure_dynawo_simulation}
+cosimulation_configurations = {"helics": configure_helics_cosimulation}
+
+
+def run_profiled(args):
+    """_summary_
+    Runs main while measuring the time and the memory spent in every stage and on every file.
+    The report is written in the JSON file given with '--profile' and, if '--profile_stats'
+    is given, the statistics of cProfile are dumped in a pstats file.
+    """
+    profiler = Profiler(not args.no_memory_profile)
+    stats_profiler = cProfile.Profile() if args.profile_stats is not None else None
+
+    profiler.start()
+    if stats_profiler is not None:
+        stats_profiler.enable()
+    try:
+        with profiler.stage("total"):
+            main(args)
+    finally:
+        if stats_profiler is not None:
+            stats_profiler.disable()
+            stats_profiler.dump_stats(args.profile_stats)
+        profiler.stop()
+        profiler.save(args.profile)
+
+    for name, stage in profiler.stages.items():
+        print(
+            f"{name:<14} {stage['wall_time']:9.3f} s wall {stage['cpu_time']:9.3f} s cpu "
+            f"{stage['peak_memory_mb']:9.1f} MB peak"
+        )
+    print(f"Profiling report written in '{args.profile}'.")
+
+
 def main(args):
-    if args.pow_sys_sim == "dynawo":
-        args.dynawo_data = make_valid_path(args.dynawo_data)
-        pw_sys_sim = configure_dynawo_simulation(args)
+    cache = configure_parse_cache(args)
+
+    pw_sys_sim = power_system_simulators.get(args.pow_sys_sim)()
+    simulation_configurations[args.pow_sys_sim](args, pw_sys_sim, cache)
 
-    if args.cosim == "helics":
-        args.helics_data = make_valid_path(args.helics_data)
-        cosimulation = configure_helics_cosimulation(args, pw_sys_sim)
-        cosimulation.power_system_federate.name = "Dynawo"
+    cosimulation = cosimulators.get(args.cosim)()
+    cosimulation_configurations[args.cosim](args, cosimulation, pw_sys_sim, cache)
 
     cosimulation.initialize(
-        {"output_path": os.path.join(args.dynawo_data, "serialized/"), "cosimulation": cosimulation}
+        {
+            "output_path": os.path.join(args.dynawo_data, "serialized/"),
+            "cosimulation": cosimulation,
+            "incremental": not args.rewrite_all,
+        }
     )
 
 
 if __name__ == "__main__":
+    # The tools run as 'python -m cycosim <command>', each with its own arguments
+    if len(sys.argv) > 1 and sys.argv[1] in commands:
+        raise SystemExit(importlib.import_module(commands[sys.argv[1]]).main(sys.argv[2:]))
+
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "--cosim",
-        help="Name of the cosimulator to use, option are : helics",
+        help="Name of the cosimulator to use.",
+        choices=cosimulators.get_names(),
         default="helics",
     )
     parser.add_argument(
@@ -139,7 +286,8 @@ if __name__ == "__main__":
     )
     parser.add_argument(
         "--pow_sys_sim",
-        help="Name of the cosimulator to use for the power system simulation part, option are : dynawo",
+        help="Name of the simulator to use for the power system simulation part.",
+        choices=power_system_simulators.get_names(),
         default="dynawo",
     )
 
@@ -155,6 +303,45 @@ if __name__ == "__main__":
         "file is used.",
     )
 
+    parser.add_argument(
+        "--streaming",
+        help="Parse the IIDM file as a stream of xml events, which bounds the memory used on large networks.",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--compact",
+        help="Hold the static network in slotted components whose info and children containers are only "
+        "created when needed, which reduces the memory used on large networks.",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--parallel",
+        help="Parse the IIDM, PAR, DYD and CRV files at the same time, each in its own process.",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--intern",
+        help="Once parsed, share the identical parameter sets and intern the strings repeated in the "
+        "static network and in the parameter sets, which reduces the memory used on large networks.",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--topology",
+        help="Print the islands of the static network, with their buses, branches, generators and loads.",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--dc_screening",
+        help="Solve a DC power flow on the static network and print the branches loaded over their current "
+        "limits and the infeasible islands, before anything is serialized.",
+        action="store_true",
+    )
+
     parser.add_argument(
         "--helics_data",
         help="The path to the folder where all the needed Helics files are.",
@@ -165,5 +352,71 @@ if __name__ == "__main__":
         "--con",
         help="Path to the connection file for linking variables in the cosimulation.",
     )
+
+    parser.add_argument(
+        "--packed",
+        help="Group the publications of the power system federate in native HELICS vector publications, described "
+        "by an index map written next to the HELICS configuration. Only available with a power system simulation "
+        "whose co-simulation interface reads the vectors, which Dynawo does not yet.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--vector_size",
+        help="The maximum number of values of a vector publication in packed mode.",
+        type=int,
+    )
+
+    parser.add_argument(
+        "--rewrite_all",
+        help="Write every serialized file, even those whose content did not change since the previous run.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--no_cache",
+        help="Always parse the input files instead of loading them from the cache of parsed files.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--clear_cache",
+        help="Remove every entry of the cache of parsed files before running.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--cache_dir",
+        help="The folder where the parsed files are cached.",
+        default=DEFAULT_CACHE_DIRECTORY,
+    )
+    parser.add_argument(
+        "--cache_max_size",
+        help="The maximum size of the cache of parsed files, in MB. The least recently used files are removed first.",
+        type=float,
+        default=DEFAULT_MAX_SIZE / (1024 * 1024),
+    )
+    parser.add_argument(
+        "--profile",
+        help="Measure the wall time, cpu time and peak memory of every stage and of every parsed or serialized "
+        "file, and write them in the given JSON report (profile.json if no file is given). With '--parallel', "
+        "the files parsed in the worker processes are only measured as a part of the parsing stage.",
+        nargs="?",
+        const="profile.json",
+    )
+    parser.add_argument(
+        "--profile_stats",
+        help="With '--profile', also run cProfile and dump its statistics in the given pstats file.",
+    )
+    parser.add_argument(
+        "--no_memory_profile",
+        help="With '--profile', do not trace the memory, which makes the measured times closer to a normal run.",
+        action="store_true",
+    )
     args = parser.parse_args()
-    main(args)
+    simulator = power_system_simulators.get(args.pow_sys_sim)
+    if args.packed and not getattr(simulator, "reads_vector_publications", False):
+        parser.error(f"'--packed' can not be used with '{args.pow_sys_sim}', which does not read vector publications.")
+    if args.profile_stats is not None and args.profile is None:
+        parser.error("'--profile_stats' can only be used with '--profile'.")
+
+    if args.profile is not None:
+        run_profiled(args)
+    else:
+        main(args)
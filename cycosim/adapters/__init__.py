@@ -1,28 +1,31 @@
-from .parsers import (  # noqa
-    DynawoParserDYD,
-    DynawoParserIIDM,
-    DynawoParserJOBS,
-    DynawoParserPAR,
-    DynawoParserCRV,
-    HelicsParserXML,
-)
-
-from .serializers import (  # noqa
-    DynawoSerializerIIDM,
-    DynawoSerializerJOBS,
-    DynawoSerializerDYD,
-    DynawoSerializerPAR,
-    DynawoSerializerCRV,
-    HelicsSerializerJSON,
-)
+from cycosim.utils.lazy_loading import lazy_attributes
 
-from .simulations import (  # noqa
-    DynawoSimulation,
-    DynawoParameterSet,
-    DynawoParameter,
-    DynawoParameterType,
-    DynawoReference,
-    DynawoSimulationParameters,
-    DynawoCurves,
-    Curve,
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "DynawoParserDYD": ".parsers",
+        "DynawoParserIIDM": ".parsers",
+        "DynawoParserJOBS": ".parsers",
+        "DynawoParserPAR": ".parsers",
+        "DynawoParserCRV": ".parsers",
+        "HelicsParserXML": ".parsers",
+        "DynawoSerializerIIDM": ".serializers",
+        "DynawoSerializerJOBS": ".serializers",
+        "DynawoSerializerDYD": ".serializers",
+        "DynawoSerializerPAR": ".serializers",
+        "DynawoSerializerCRV": ".serializers",
+        "HelicsSerializerJSON": ".serializers",
+        "HelicsSerializerIndexMap": ".serializers",
+        "DynawoSimulation": ".simulations",
+        "DynawoParameterSet": ".simulations",
+        "DynawoParameterStore": ".simulations",
+        "DynawoParameter": ".simulations",
+        "DynawoParameterType": ".simulations",
+        "DynawoReference": ".simulations",
+        "DynawoSimulationParameters": ".simulations",
+        "DynawoCurves": ".simulations",
+        "Curve": ".simulations",
+        "SymbolTable": ".simulations",
+        "SymbolKind": ".simulations",
+    },
 )
@@ -1 +1,15 @@
-from .helics_cosimulation import HelicsCosimulation, HelicsCosimulationFederate  # noqa
+from cycosim.utils.lazy_loading import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "HelicsCosimulation": ".helics_cosimulation",
+        "HelicsCosimulationFederate": ".helics_cosimulation",
+        "VectorPublication": ".packing",
+        "pack_publications": ".packing",
+        "encode_vector": ".packing",
+        "decode_vector": ".packing",
+        "encode_scalar": ".packing",
+        "decode_scalar": ".packing",
+    },
+)
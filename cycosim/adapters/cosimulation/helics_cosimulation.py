@@ -3,7 +3,14 @@ from typing import List
 from cycosim.domain.ports.cosimulation import Cosimulation, SimulationConnection
 from cycosim.domain.ports.simulation import Simulation
 
-from cycosim.adapters.serializers.helics import HelicsSerializerJSON
+from cycosim.adapters.serializers.helics import HelicsSerializerJSON, HelicsSerializerIndexMap
+from cycosim.adapters.cosimulation.packing import (
+    VectorPublication,
+    pack_publications,
+    DEFAULT_VECTOR_SIZE,
+)
+
+from cycosim.utils import OutputManifest, get_model_digest, serialize_output, profile_stage
 
 
 class HelicsVariable:
@@ -13,8 +20,7 @@ class HelicsVariable:
 
 
 class Publication:
-    key: str = None
-    info: str = None
+    __slots__ = ("key", "info")
 
     def __init__(self, _key: str, _info: str = None):
         self.key = _key
@@ -25,8 +31,7 @@ class Publication:
 
 
 class Subscription:
-    key: str = None
-    info: str = None
+    __slots__ = ("key", "info")
 
     def __init__(self, _key: str, _info: str = None):
         self.key = _key
@@ -52,6 +57,18 @@ class HelicsCosimulationFederate:
     uninterruptible: bool = True
     period: float = 1.0
 
+    # In packed mode, the publications are grouped in vector publications of at most vector_size values
+    packed: bool = False
+    vector_size: int = DEFAULT_VECTOR_SIZE
+
+    # The key of the parsed file the federate has been read from
+    source_key: str = None
+
+    def __init__(self):
+        self.publications = []
+        self.subscriptions = []
+        self.variables = []
+
     def add_publication(self, key: str, info: str = None):
         self.publications.append(Publication(key, info))
 
@@ -61,6 +78,22 @@ class HelicsCosimulationFederate:
     def get_parameter(self, parameter_name: str):
         return self.simulation.get_parameter(parameter_name)
 
+    def get_vector_publications(self) -> List[VectorPublication]:
+        """_summary_
+        Returns the vector publications sent in packed mode, built from the current publications.
+        """
+        return pack_publications(self.name, self.publications, self.vector_size)
+
+    def get_index_map(self) -> dict:
+        """_summary_
+        Returns the position of every publication in the vector publications, used by both sides
+        of the cosimulation to encode and decode the vectors.
+        """
+        return {
+            "federate": self.name,
+            "vectors": [vec.get_index_map() for vec in self.get_vector_publications()],
+        }
+
     def has_variable(self, var_name: str):
         for var in self.variables:
             if var.name == var_name:
@@ -69,7 +102,19 @@ class HelicsCosimulationFederate:
 
     def initialize(self, arguments: dict = {}):
         self.simulation.initialize(arguments)
-        HelicsSerializerJSON(arguments["output_path"] + self.name + ".json", self).serialize()
+        digest = get_model_digest(self.source_key, self.packed, self.vector_size)
+        with profile_stage("serialization"):
+            serialize_output(
+                HelicsSerializerJSON(arguments["output_path"] + self.name + ".json", self),
+                digest,
+                arguments.get("manifest"),
+            )
+            if self.packed:
+                serialize_output(
+                    HelicsSerializerIndexMap(arguments["output_path"] + self.name + "_index_map.json", self),
+                    digest,
+                    arguments.get("manifest"),
+                )
 
 
 class HelicsCosimulation(Cosimulation):
@@ -111,11 +156,21 @@ class HelicsCosimulation(Cosimulation):
             return SimulationConnection(pub.key, pub.info)
 
     def initialize(self, arguments: dict = {}):
+        """_summary_
+        Serializes the files of every federate in the output path. The files whose model did not
+        change since the previous initialization are not serialized again, unless 'incremental' is False.
+        """
         if "output_path" not in arguments:
             raise ValueError("No output path has been given for the serialized files.")
 
+        if arguments.get("incremental", True):
+            arguments["manifest"] = OutputManifest(arguments["output_path"])
+
         self.power_system_federate.initialize(arguments)
 
+        if "manifest" in arguments:
+            arguments["manifest"].save()
+
     def start(self):
         pass
 
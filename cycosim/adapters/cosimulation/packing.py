@@ -0,0 +1,87 @@
+import struct
+from typing import List
+
+SCALAR = struct.Struct("<d")
+
+DEFAULT_VECTOR_SIZE = 256
+
+
+def encode_vector(values: list) -> bytes:
+    """_summary_
+    Returns the values of a vector publication as the 64-bit floats of a HELICS vector of doubles,
+    the type header being added by HELICS itself.
+    """
+    return struct.pack(f"<{len(values)}d", *values)
+
+
+def decode_vector(data: bytes) -> tuple:
+    """_summary_
+    Decodes the values of a vector publication encoded with encode_vector.
+    """
+    if len(data) % SCALAR.size:
+        raise ValueError(f"The vector publication holds {len(data)} bytes, not a whole number of doubles.")
+    return struct.unpack(f"<{len(data) // SCALAR.size}d", data)
+
+
+def encode_scalar(value: float) -> bytes:
+    return SCALAR.pack(value)
+
+
+def decode_scalar(data: bytes) -> float:
+    return SCALAR.unpack(data)[0]
+
+
+class VectorPublication:
+    """_summary_
+    A group of publications sent in a single HELICS message, as a native HELICS vector of doubles.
+    The value of the publication at position 'index' of the 'publications' list is the value at the
+    same index of the vector.
+
+    Attributes:
+        key (str) : The key of the vector publication.
+        publications (list) : The scalar publications packed in the vector.
+    """
+
+    def __init__(self, _key: str, _publications: list):
+        self.key = _key
+        self.publications = _publications
+
+    def __len__(self):
+        return len(self.publications)
+
+    def to_dict(self):
+        return {"key": self.key, "type": "vector"}
+
+    def get_index_map(self) -> dict:
+        return {
+            "key": self.key,
+            "size": len(self.publications),
+            "variables": [
+                {"index": index, "name": pub.key, "variable": pub.info} for index, pub in enumerate(self.publications)
+            ],
+        }
+
+    def encode(self, values: dict) -> bytes:
+        """_summary_
+        Encodes the values of the packed publications, given by publication key.
+        """
+        return encode_vector([values[pub.key] for pub in self.publications])
+
+    def decode(self, data: bytes) -> dict:
+        """_summary_
+        Returns the values of the packed publications, by publication key.
+        """
+        return {pub.key: val for pub, val in zip(self.publications, decode_vector(data))}
+
+
+def pack_publications(federate_name: str, publications: list, vector_size: int) -> List[VectorPublication]:
+    """_summary_
+    Groups the publications, in their order, in vectors of at most 'vector_size' values.
+    """
+    if vector_size < 1:
+        raise ValueError(f"The size of the vector publications must be positive, not {vector_size}.")
+
+    return [
+        VectorPublication(f"{federate_name}_vector_{cnt + 1}", publications[start : start + vector_size])
+        for cnt, start in enumerate(range(0, len(publications), vector_size))
+    ]
@@ -1,11 +1,18 @@
-from .exceptions import UnknownFileFormatError, AttributeNotFoundError  # noqa
+from cycosim.utils.lazy_loading import lazy_attributes
 
-from .dynawo import (  # noqa
-    DynawoParserDYD,
-    DynawoParserIIDM,
-    DynawoParserJOBS,
-    DynawoParserPAR,
-    DynawoParserCRV,
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "UnknownFileFormatError": ".exceptions",
+        "AttributeNotFoundError": ".exceptions",
+        "DynawoParserDYD": ".dynawo",
+        "DynawoParserIIDM": ".dynawo",
+        "DynawoParserJIIDM": ".dynawo",
+        "DynawoParserBIIDM": ".dynawo",
+        "BinaryIIDMSnapshot": ".dynawo",
+        "DynawoParserJOBS": ".dynawo",
+        "DynawoParserPAR": ".dynawo",
+        "DynawoParserCRV": ".dynawo",
+        "HelicsParserXML": ".helics",
+    },
 )
-
-from .helics import HelicsParserXML  # noqa
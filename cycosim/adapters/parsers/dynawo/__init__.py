@@ -1,5 +1,15 @@
-from .dyd_parser import DynawoParserDYD  # noqa
-from .iidm_parser import DynawoParserIIDM  # noqa
-from .jobs_parser import DynawoParserJOBS  # noqa
-from .par_parser import DynawoParserPAR  # noqa
-from .crv_parser import DynawoParserCRV  # noqa
+from cycosim.utils.lazy_loading import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "DynawoParserDYD": ".dyd_parser",
+        "DynawoParserIIDM": ".iidm_parser",
+        "DynawoParserJIIDM": ".iidm_json_parser",
+        "DynawoParserBIIDM": ".iidm_binary_parser",
+        "BinaryIIDMSnapshot": ".iidm_binary_parser",
+        "DynawoParserJOBS": ".jobs_parser",
+        "DynawoParserPAR": ".par_parser",
+        "DynawoParserCRV": ".crv_parser",
+    },
+)
@@ -1,30 +1,28 @@
-import xmltodict
-
 from cycosim.adapters.simulations.dynawo_elements import DynawoCurves
 
-from cycosim.utils import remove_superfluous
-
-
-def parse_xml(xml_dict: dict, curves: DynawoCurves):
-    for key, val in xml_dict.items():
-        if key == "curve":
-            if isinstance(val, list):
-                for curve in val:
-                    curves.add_curve(curve["model"], curve["variable"])
+from cycosim.utils import XMLEventReader
+from cycosim.domain.ports import Parser
 
-            elif isinstance(val, dict):
-                curves.add_curve(val["model"], val["variable"])
 
+class DynawoParserCRV(Parser):
+    version = 2
 
-class DynawoParserCRV:
     def __init__(self, _crv_file: str):
+        super().__init__(_crv_file)
         self.crv_file = _crv_file
         self.curves = DynawoCurves()
 
+    def start_curves_input(self, flag_name: str, attributes: dict):
+        self.curves.xmlns = attributes["xmlns"]
+
+    def start_curve(self, flag_name: str, attributes: dict):
+        self.curves.add_curve(attributes["model"], attributes["variable"])
+
     def parse(self) -> DynawoCurves:
         with open(self.crv_file, "rb") as xml_data:
-            xml_dict = remove_superfluous(xmltodict.parse(xml_data), ["@"])
-            self.curves.xmlns = xml_dict["curvesInput"]["xmlns"]
-            parse_xml(xml_dict["curvesInput"], self.curves)
+            reader = XMLEventReader(xml_data)
+            reader.on_start("curvesInput", self.start_curves_input)
+            reader.on_start("curve", self.start_curve)
+            reader.read()
 
         return self.curves
@@ -1,5 +1,3 @@
-import xmltodict
-
 from cycosim.domain.models.power_system import (
     DynamicComponent,
     Connection,
@@ -7,6 +5,8 @@ from cycosim.domain.models.power_system import (
     StaticReference,
     DynamicModel,
 )
+from cycosim.domain.ports import Parser
+from cycosim.utils import XMLEventReader
 
 flag_dyd_mapping = {
     "blackBoxModel": DynamicComponent,
@@ -16,37 +16,53 @@ flag_dyd_mapping = {
     "connect": Connection,
 }
 
+# The flags holding other flags, they are added to the model once closed
+container_flags = {"blackBoxModel", "macroConnector"}
 
-def parse_xml(xml_dict: dict, elements: list):
-    for key, val in xml_dict.items():
-        if isinstance(val, dict):
-            curr_cpnt = flag_dyd_mapping[key.replace("dyn:", "")]()
-            curr_cpnt.parse(val)
-            elements.append(curr_cpnt)
-
-        elif isinstance(val, list):
-            for elem in val:
-                curr_cpnt = flag_dyd_mapping[key.replace("dyn:", "")]()
-                curr_cpnt.parse(elem)
-                elements.append(curr_cpnt)
 
-        elif isinstance(val, str):
-            print("Error : Attributes not managed here.")
+class DynawoParserDYD(Parser):
+    """_summary_
+    A class used to parse Dynawo .dyd files, read as a stream of xml events.
+    The staticRef flags of a blackBoxModel and the connect flags of a macroConnector
+    are attached to it, the other flags are added to the DynamicModel.
+    """
 
-        else:
-            print("Error : Unknown type of " + str(val))
+    version = 4
 
-
-class DynawoParserDYD:
     def __init__(self, _dyd_file: str):
+        super().__init__(_dyd_file)
         self.dyd_file = _dyd_file
         self.dynamic_model = DynamicModel()
+        self.containers = []
+
+    def start_flag(self, flag_name: str, attributes: dict):
+        curr_cpnt = flag_dyd_mapping[flag_name]()
+        curr_cpnt.parse(attributes)
+
+        if flag_name in container_flags:
+            self.containers.append(curr_cpnt)
+        elif not self.containers:
+            self.dynamic_model.add_component(curr_cpnt)
+        elif isinstance(curr_cpnt, StaticReference):
+            self.containers[-1].static_references.append(curr_cpnt)
+        else:
+            self.containers[-1].connections.append(curr_cpnt)
+
+    def end_container(self, flag_name: str, attributes: dict):
+        self.dynamic_model.add_component(self.containers.pop())
+
+    def unknown_flag(self, flag_name: str, attributes: dict):
+        print(f"Error : Unknown flag '{flag_name}' in DYD file.")
 
     def parse(self) -> DynamicModel:
         with open(self.dyd_file, "rb") as xml_data:
-            xml_dict = xmltodict.parse(xml_data)
-            xml_dict = xml_dict["dyn:dynamicModelsArchitecture"]
-            xml_dict.pop("@xmlns:dyn", None)
-            parse_xml(xml_dict, self.dynamic_model.components)
+            reader = XMLEventReader(xml_data)
+            reader.on_start("dynamicModelsArchitecture", None)
+            reader.on_start(None, self.unknown_flag)
+            for flag_name in flag_dyd_mapping:
+                reader.on_start(flag_name, self.start_flag)
+            for flag_name in container_flags:
+                reader.on_end(flag_name, self.end_container)
+            reader.read()
 
         return self.dynamic_model
@@ -0,0 +1,242 @@
+import json
+import mmap
+import struct
+
+import numpy as np
+
+from cycosim.domain.models.power_system import BaseComponent, Component, CompactComponent
+from cycosim.domain.ports import Parser
+
+from cycosim.adapters.parsers.dynawo.iidm_parser import flag_iidm_mapping, compact_flag_iidm_mapping, set_attribute
+
+# Layout of a .biidm file : the magic string, the format version, the size of the JSON header, the
+# header, then the columns of the snapshot, each one aligned on 8 bytes from the start of the file.
+BIIDM_MAGIC = b"CYBIIDM\x00"
+BIIDM_VERSION = 1
+BIIDM_PREFIX = struct.Struct("<8sIQ")
+BIIDM_ALIGNMENT = 8
+
+# The kinds of attribute column
+NUMBER_COLUMN = "number"
+STRING_COLUMN = "string"
+
+# How the text of a value of a number column is rebuilt from the float
+NUMBER_STYLE_REPR = 0
+NUMBER_STYLE_INTEGER = 1
+NUMBER_STYLE_TEXT = 2
+
+
+def get_number_style(text: str, val: float) -> int:
+    """_summary_
+    Returns how the text of the value can be rebuilt from the float: as its repr ('72.8'),
+    as an integer ('500'), or not at all, the text being then kept as it is.
+    """
+    if repr(val) == text:
+        return NUMBER_STYLE_REPR
+    if val.is_integer() and str(int(val)) == text:
+        return NUMBER_STYLE_INTEGER
+    return NUMBER_STYLE_TEXT
+
+
+def get_number_text(val: float, style: int) -> str:
+    if style == NUMBER_STYLE_INTEGER:
+        return str(int(val))
+    return repr(float(val))
+
+
+class BinaryIIDMSnapshot:
+    """_summary_
+    Read access to a binary IIDM snapshot (.biidm file). The file is memory-mapped and the columns
+    are numpy arrays reading it directly, so the numeric values of a large network are available
+    without parsing nor copying anything, the pages being loaded by the system when they are read.
+
+    The snapshot holds the components in the order of a depth first walk of the network:
+        - 'parents' : the index of the parent of every component, -1 for the network,
+        - 'flags' : the index of the flag name of every component in the 'flag_names' list,
+        - 'ids' : the index of the id of every component in the string table, -1 if it has none.
+    The attributes are stored per flag name, each attribute being a column over the components of
+    the flag, either a float64 column or a column of indexes in the string table.
+
+    Attributes:
+        path (str) : The path of the .biidm file.
+        header (dict) : The description of the columns, read from the start of the file.
+        flag_names (list) : The flag names of the components.
+    """
+
+    def __init__(self, _path: str, _memory_map: bool = True):
+        self.path = _path
+        with open(_path, "rb") as in_file:
+            if _memory_map:
+                self.buffer = mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self.buffer = in_file.read()
+
+        magic, version, header_size = BIIDM_PREFIX.unpack_from(self.buffer)
+        if magic != BIIDM_MAGIC:
+            raise ValueError(f"The file '{_path}' is not a binary IIDM snapshot.")
+        if version != BIIDM_VERSION:
+            raise ValueError(f"Unknown version {version} of the binary IIDM snapshot '{_path}'.")
+
+        self.header = json.loads(bytes(self.buffer[BIIDM_PREFIX.size : BIIDM_PREFIX.size + header_size]))
+        # The offsets of the columns are given from the end of the header
+        self.data_start = BIIDM_PREFIX.size + header_size
+        self.flag_names = self.header["flag_names"]
+        self.strings = None
+
+    def __len__(self):
+        return self.header["nbr_components"]
+
+    def close(self):
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def get_array(self, column: dict) -> np.ndarray:
+        """_summary_
+        Returns the read-only array of the column described in the header, without any copy.
+        """
+        return np.frombuffer(
+            self.buffer, dtype=column["dtype"], count=column["count"], offset=self.data_start + column["offset"]
+        )
+
+    def get_strings(self) -> list:
+        """_summary_
+        Returns the string table, decoded on the first call.
+        """
+        if self.strings is None:
+            offsets = self.get_array(self.header["strings"]["offsets"])
+            data = bytes(self.get_array(self.header["strings"]["data"]))
+            self.strings = [data[start:end].decode("utf-8") for start, end in zip(offsets[:-1], offsets[1:])]
+        return self.strings
+
+    def get_structure(self, name: str) -> np.ndarray:
+        """_summary_
+        Returns the 'parents', 'flags' or 'ids' column over all the components.
+        """
+        return self.get_array(self.header["structure"][name])
+
+    def get_rows(self, flag_name: str) -> np.ndarray:
+        """_summary_
+        Returns the indexes of the components of the given flag name.
+        """
+        return self.get_array(self.header["groups"][flag_name]["rows"])
+
+    def get_ids(self, flag_name: str) -> list:
+        strings = self.get_strings()
+        ids = self.get_structure("ids")[self.get_rows(flag_name)]
+        return [strings[index] if index >= 0 else None for index in ids]
+
+    def get_attribute_names(self, flag_name: str) -> list:
+        return [attribute["name"] for attribute in self.header["groups"][flag_name]["attributes"]]
+
+    def get_attribute(self, flag_name: str, name: str) -> dict:
+        for attribute in self.header["groups"][flag_name]["attributes"]:
+            if attribute["name"] == name:
+                return attribute
+        raise KeyError(f"The components '{flag_name}' do not have any attribute '{name}'.")
+
+    def get_column(self, flag_name: str, name: str) -> np.ndarray:
+        """_summary_
+        Returns the values of an attribute for every component of the given flag name, in the
+        order of get_rows. The number attributes are float64 arrays mapped on the file, where
+        the missing values are NaN. The other attributes are returned as lists of strings.
+        """
+        attribute = self.get_attribute(flag_name, name)
+        values = self.get_array(attribute["values"])
+        if attribute["kind"] == NUMBER_COLUMN:
+            if attribute["present"] is None:
+                return values
+            return np.where(self.get_array(attribute["present"]).astype(bool), values, np.nan)
+
+        strings = self.get_strings()
+        return [strings[index] if index >= 0 else None for index in values]
+
+    def get_texts(self, flag_name: str, attribute: dict) -> list:
+        """_summary_
+        Returns the values of an attribute as they are written in the xml files, None where missing.
+        """
+        values = self.get_array(attribute["values"])
+        if attribute["kind"] == STRING_COLUMN:
+            strings = self.get_strings()
+            return [strings[index] if index >= 0 else None for index in values.tolist()]
+
+        styles = self.get_array(attribute["styles"]).tolist() if attribute["styles"] else None
+        present = self.get_array(attribute["present"]).tolist() if attribute["present"] else None
+        texts = []
+        for row, val in enumerate(values.tolist()):
+            if present is not None and not present[row]:
+                texts.append(None)
+            elif styles is not None and styles[row] == NUMBER_STYLE_TEXT:
+                texts.append(attribute["texts"][str(row)])
+            else:
+                texts.append(get_number_text(val, styles[row] if styles is not None else NUMBER_STYLE_REPR))
+        return texts
+
+    def to_network(self, flag_mapping: dict = flag_iidm_mapping, network: BaseComponent = None) -> BaseComponent:
+        """_summary_
+        Rebuilds the tree of components held by the snapshot.
+        """
+        strings = self.get_strings()
+        flags = self.get_structure("flags").tolist()
+        parents = self.get_structure("parents").tolist()
+        ids = self.get_structure("ids").tolist()
+
+        # The attributes of every component, set before it is added to its parent
+        attributes = [None] * len(self)
+        for flag_name, group in self.header["groups"].items():
+            rows = self.get_array(group["rows"]).tolist()
+            for row in rows:
+                attributes[row] = []
+            for attribute in group["attributes"]:
+                for row, text in zip(rows, self.get_texts(flag_name, attribute)):
+                    if text is not None:
+                        attributes[row].append((attribute["name"], text))
+
+        cpnts = []
+        for index in range(len(self)):
+            flag_name = self.flag_names[flags[index]]
+            if index == 0 and network is not None:
+                cpnt = network
+            else:
+                cpnt = flag_mapping[flag_name]()
+            cpnt.flag_name = flag_name
+            if ids[index] >= 0:
+                cpnt.id = strings[ids[index]]
+            for key, val in attributes[index]:
+                set_attribute(cpnt, key, val)
+
+            if parents[index] >= 0:
+                cpnts[parents[index]].add_sub_component(cpnt)
+            cpnts.append(cpnt)
+
+        return cpnts[0] if cpnts else network
+
+
+class DynawoParserBIIDM(Parser):
+    """
+    Summary :
+        A class used to load the binary IIDM snapshots (.biidm files) into a network of components.
+        Use BinaryIIDMSnapshot directly to read the columns without building the components.
+
+    Attributes :
+        compact : If True, the components are instances of the slotted Compact classes.
+        See parent classes.
+    """
+
+    version = 3
+
+    def __init__(self, _biidm_file: str, _compact: bool = False):
+        super().__init__(_biidm_file)
+        self.biidm_file = _biidm_file
+        self.compact = _compact
+        self.flag_mapping = compact_flag_iidm_mapping if _compact else flag_iidm_mapping
+        self.network = CompactComponent() if _compact else Component()
+
+    def parse(self) -> BaseComponent:
+        with BinaryIIDMSnapshot(self.biidm_file) as snapshot:
+            return snapshot.to_network(self.flag_mapping, self.network)
@@ -0,0 +1,115 @@
+import json
+
+from cycosim.domain.models.power_system import BaseComponent, Component, CompactComponent
+from cycosim.domain.ports import Parser
+
+from cycosim.adapters.parsers.dynawo.iidm_parser import flag_iidm_mapping, compact_flag_iidm_mapping, set_attribute
+
+# The flags appearing at most once in their parent, written as an object instead of a list
+single_flags = {
+    "busBreakerTopology",
+    "nodeBreakerTopology",
+    "reactiveCapabilityCurve",
+    "minMaxReactiveLimits",
+    "phaseTapChanger",
+    "ratioTapChanger",
+    "terminalRef",
+    "currentLimits",
+    "currentLimits1",
+    "currentLimits2",
+    "currentLimit1",
+    "currentLimit2",
+}
+
+
+def get_plural(flag_name: str) -> str:
+    """_summary_
+    Returns the name of the list holding the children of the given flag, as in the JSON
+    format of PowSyBl ('substations', 'voltageLevels', 'buses', 'switches').
+    """
+    if flag_name.endswith(("s", "x", "ch", "sh")):
+        return flag_name + "es"
+    return flag_name + "s"
+
+
+# The flag of every known list name
+plural_flags = {get_plural(flag_name): flag_name for flag_name in flag_iidm_mapping}
+
+
+def get_singular(list_name: str) -> str:
+    if list_name in plural_flags:
+        return plural_flags[list_name]
+    if list_name.endswith(("ses", "xes", "ches", "shes")):
+        return list_name[:-2]
+    return list_name[:-1]
+
+
+def to_text(val) -> str:
+    """_summary_
+    Returns the value as it is written in an xml attribute. The numbers are read as strings by
+    the parser, so their text is kept as written in the file.
+    """
+    if isinstance(val, bool):
+        return "true" if val else "false"
+    return val
+
+
+def json_parser(json_dict: dict, cpnt: BaseComponent, flag_mapping: dict):
+    """_summary_
+    Recursively instantiates the components described by the dictionary. The scalars are the
+    attributes of the component, the objects and the lists hold its sub components.
+
+    Args:
+        json_dict (dict): The dictionary of the component.
+        cpnt (BaseComponent): The component being filled.
+        flag_mapping (dict): The class instantiated for every flag.
+    """
+    for key, val in json_dict.items():
+        if isinstance(val, dict):
+            sub_cpnt = flag_mapping[key]()
+            sub_cpnt.flag_name = key
+            json_parser(val, sub_cpnt, flag_mapping)
+            cpnt.add_sub_component(sub_cpnt)
+
+        elif isinstance(val, list):
+            flag_name = get_singular(key)
+            for elem in val:
+                sub_cpnt = flag_mapping[flag_name]()
+                sub_cpnt.flag_name = flag_name
+                json_parser(elem, sub_cpnt, flag_mapping)
+                cpnt.add_sub_component(sub_cpnt)
+
+        elif val is not None:
+            set_attribute(cpnt, key, to_text(val))
+
+
+class DynawoParserJIIDM(Parser):
+    """
+    Summary :
+        A class used to parse the IIDM networks written in JSON (.jiidm files). The layout is the
+        one of PowSyBl: the root object is the network, the attributes of a component are its scalar
+        members and its children are grouped in lists named after their flag in the plural
+        ('substations', 'voltageLevels', 'buses'), the flags appearing once being objects.
+
+    Attributes :
+        compact : If True, the components are instances of the slotted Compact classes.
+        See parent classes.
+    """
+
+    version = 3
+
+    def __init__(self, _jiidm_file: str, _compact: bool = False):
+        super().__init__(_jiidm_file)
+        self.jiidm_file = _jiidm_file
+        self.compact = _compact
+        self.flag_mapping = compact_flag_iidm_mapping if _compact else flag_iidm_mapping
+        self.network = CompactComponent() if _compact else Component()
+
+    def parse(self) -> BaseComponent:
+        with open(self.jiidm_file, "r", encoding="utf-8") as json_data:
+            # The numbers are kept as written, like the attributes of the xml files
+            json_dict = json.load(json_data, parse_float=str, parse_int=str, parse_constant=str)
+
+        self.network.flag_name = "network"
+        json_parser(json_dict, self.network, self.flag_mapping)
+        return self.network
@@ -1,15 +1,25 @@
-import xmltodict
+from xml.etree.ElementTree import iterparse
 
-from cycosim.utils import remove_superfluous
+from cycosim.utils import remove_superfluous, strip_namespace
 
 from cycosim.domain.models.power_system import (
+    BaseComponent,
     Component,
     Bus,
     Switch,
     Generator,
     Load,
+    ShuntCompensator,
     ACLine,
+    CompactComponent,
+    CompactBus,
+    CompactSwitch,
+    CompactGenerator,
+    CompactLoad,
+    CompactShuntCompensator,
+    CompactACLine,
 )
+from cycosim.domain.ports import Parser
 
 var_iidm_mapping = {
     "version": "xml_version",
@@ -57,6 +67,10 @@ flag_iidm_mapping = {
     "step": Component,
     "vscConverterStation": Component,
     "line": ACLine,
+    "shunt": ShuntCompensator,
+    "shuntLinearModel": Component,
+    "shuntNonLinearModel": Component,
+    "section": Component,
     "currentLimit1": Component,
     "currentLimit2": Component,
     "temporaryLimit": Component,
@@ -65,8 +79,40 @@ flag_iidm_mapping = {
     "currentLimits2": Component,
 }
 
+# The slotted classes instantiated in compact mode, the other flags give a CompactComponent
+compact_flag_iidm_mapping = {
+    flag: {
+        Bus: CompactBus,
+        Generator: CompactGenerator,
+        Load: CompactLoad,
+        Switch: CompactSwitch,
+        ShuntCompensator: CompactShuntCompensator,
+        ACLine: CompactACLine,
+    }.get(cpnt_class, CompactComponent)
+    for flag, cpnt_class in flag_iidm_mapping.items()
+}
+
+
+def set_attribute(cpnt: BaseComponent, key: str, val):
+    """_summary_
+    Stores an xml attribute in the given component. The attribute is stored in the corresponding
+    variable if there is one, in the 'info' variable otherwise.
+
+    Args:
+        cpnt (BaseComponent): The component the attribute belongs to.
+        key (str): The name of the attribute, without any prefix.
+        val: The value of the attribute.
+    """
+    if not hasattr(cpnt, key):
+        cpnt.set_info(key, val)
+
+    elif isinstance(val, str):
+        cpnt.set_variable(var_iidm_mapping[key], val)
+    else:
+        print("Error : Unknow type of " + str(val))
+
 
-def xml_parser(xml_dict: dict, parent_cpnt: Component):
+def xml_parser(xml_dict: dict, parent_cpnt: BaseComponent, flag_mapping: dict = flag_iidm_mapping):
     """_summary_
     Recursively goes through the dictionary and instantiates the corresponding class of
     the encountered xml flags. The attributes are stored in the corresponding variables
@@ -74,51 +120,110 @@ def xml_parser(xml_dict: dict, parent_cpnt: Component):
 
     Args:
         xml_dict (dict): The dictionary to parse.
-        parent_cpnt (Component): The flag in which the current dictionary has been defined.
+        parent_cpnt (BaseComponent): The flag in which the current dictionary has been defined.
+        flag_mapping (dict): The class instantiated for every xml flag.
     """
     for key, val in xml_dict.items():
         if isinstance(val, dict):
-            curr_cpnt = flag_iidm_mapping[key]()
-            xml_parser(val, curr_cpnt)
+            curr_cpnt = flag_mapping[key]()
+            xml_parser(val, curr_cpnt, flag_mapping)
             curr_cpnt.flag_name = key
             parent_cpnt.add_sub_component(curr_cpnt)
 
         elif isinstance(val, list):
             for elem in val:
-                curr_cpnt = flag_iidm_mapping[key]()
+                curr_cpnt = flag_mapping[key]()
                 curr_cpnt.flag_name = key
-                xml_parser(elem, curr_cpnt)
+                xml_parser(elem, curr_cpnt, flag_mapping)
                 parent_cpnt.add_sub_component(curr_cpnt)
 
-        elif not hasattr(parent_cpnt, key):
-            parent_cpnt.info[key] = val
+        else:
+            set_attribute(parent_cpnt, key, val)
+
+
+def stream_parser(xml_source, network: BaseComponent, flag_mapping: dict = flag_iidm_mapping):
+    """_summary_
+    Goes through the xml file as a stream of events and instantiates the corresponding class
+    of each xml flag when it opens. The component is attached to its parent when the flag closes
+    and the xml element is then freed, so the whole document is never held in memory.
+    The siblings are kept in the order of the document.
+
+    Args:
+        xml_source: The path or the binary stream of the file to parse.
+        network (BaseComponent): The component in which the root flag is parsed.
+        flag_mapping (dict): The class instantiated for every xml flag.
+    """
+    stack = []
+    namespaces = {}
+
+    for event, elem in iterparse(xml_source, events=("start-ns", "start", "end")):
+        if event == "start-ns":
+            prefix, uri = elem
+            namespaces["xmlns:" + prefix if prefix else "xmlns"] = uri
+
+        elif event == "start":
+            flag_name = strip_namespace(elem.tag)
+            if stack:
+                curr_cpnt = flag_mapping[flag_name]()
+            else:
+                curr_cpnt = network
+                for key, val in namespaces.items():
+                    curr_cpnt.set_info(key, val)
+            curr_cpnt.flag_name = flag_name
+
+            for key, val in elem.attrib.items():
+                set_attribute(curr_cpnt, strip_namespace(key), val)
+
+            stack.append((elem, curr_cpnt))
 
-        elif isinstance(val, str):
-            setattr(parent_cpnt, var_iidm_mapping[key], val)
         else:
-            print("Error : Unknow type of " + str(val))
+            _, curr_cpnt = stack.pop()
+            elem.clear()
+            if stack:
+                parent_elem, parent_cpnt = stack[-1]
+                parent_elem.remove(elem)
+                parent_cpnt.add_sub_component(curr_cpnt)
 
 
-class DynawoParserIIDM:
+class DynawoParserIIDM(Parser):
     """
     Summary :
         A class used to parse iidm or xiidm files.
 
     Attributes :
+        streaming : If True, the file is parsed as a stream of xml events instead of being
+                    loaded as a whole dictionary, which bounds the memory used on large networks.
+        compact : If True, the components are instances of the slotted Compact classes, which
+                  use less memory than the Component classes on large networks.
         See parent classes.
     """
 
-    def __init__(self, _iidm_file):
+    version = 3
+
+    def __init__(self, _iidm_file, _streaming: bool = False, _compact: bool = False):
+        super().__init__(_iidm_file)
         self.iidm_file = _iidm_file
-        self.network = Component()
+        self.streaming = _streaming
+        self.compact = _compact
+        self.flag_mapping = compact_flag_iidm_mapping if _compact else flag_iidm_mapping
+        self.network = CompactComponent() if _compact else Component()
+
+    def parse(self) -> BaseComponent:
+        if self.streaming:
+            with open(self.iidm_file, "rb") as xml_data:
+                stream_parser(xml_data, self.network, self.flag_mapping)
+            return self.network
+
+        # Only the dictionary mode needs xmltodict, which is imported when first used
+        import xmltodict
 
-    def parse(self) -> Component:
         with open(self.iidm_file, "rb") as xml_data:
             xml_dict = xmltodict.parse(xml_data)
             self.network.flag_name = "network"
             xml_parser(
                 remove_superfluous(xml_dict["iidm:network"], ["iidm:", "@"]),
                 self.network,
+                self.flag_mapping,
             )
 
         return self.network
@@ -1,10 +1,9 @@
-import xmltodict
-
-from cycosim.utils import remove_superfluous
+from cycosim.utils import XMLEventReader
 
 from ..exceptions import AttributeNotFoundError
 
-from cycosim.adapters.simulations import DynawoSimulation, DynawoSimulationParameters
+from cycosim.adapters.simulations import DynawoSimulationParameters
+from cycosim.domain.ports import Parser
 
 
 jobs_to_mapping = {
@@ -45,48 +44,64 @@ def set_variable(obj, variable_name, value):
         setattr(obj, variable_name, value)
 
 
-def parse_xml(xml_dict: dict, sim_obj: DynawoSimulation, flag_name: str):
-    var_name = ""
-    for key, val in xml_dict.items():
-        if isinstance(val, dict):
-            parse_xml(val, sim_obj, key)
-
-        elif isinstance(val, list):
-            pass
-
-        elif isinstance(val, str):
-            try:
-                if isinstance(jobs_to_mapping[key], dict):
-                    var_name = jobs_to_mapping[key][flag_name]
-                else:
-                    var_name = jobs_to_mapping[key]
-            except KeyError:
-                raise AttributeNotFoundError(
-                    f"Parsing Error : Unknown flag attribute '{key}' with flag name '{flag_name}' from JOBS file."
-                )
-            set_variable(sim_obj, var_name, val)
-
-        else:
-            print(f"Error : Unmanaged type '{val.type}' during parsing of JOBS file")
+def set_attributes(sim_obj: DynawoSimulationParameters, flag_name: str, attributes: dict):
+    for key, val in attributes.items():
+        try:
+            if isinstance(jobs_to_mapping[key], dict):
+                var_name = jobs_to_mapping[key][flag_name]
+            else:
+                var_name = jobs_to_mapping[key]
+        except KeyError:
+            raise AttributeNotFoundError(
+                f"Parsing Error : Unknown flag attribute '{key}' with flag name '{flag_name}' from JOBS file."
+            )
+        set_variable(sim_obj, var_name, val)
 
 
-class DynawoParserJOBS:
+class DynawoParserJOBS(Parser):
     """
     Summary :
         A class used to parse .jobs files.
         Returns a ParsedFileObject if everything went correctly.
+        When a flag is repeated under the same parent, only its first occurrence is read, apart
+        from the 'dynModels' flags whose DYD files are all kept.
 
     """
 
+    version = 3
+
     def __init__(self, _jobs_file: str):
+        super().__init__(_jobs_file)
         self.jobs_file = _jobs_file
 
         self.simulation_parameters = DynawoSimulationParameters()
+        # The flags already read under every open flag, and the depth in a skipped repeated flag
+        self.read_flags = [set()]
+        self.skipped_depth = 0
+
+    def start_flag(self, flag_name: str, attributes: dict):
+        if not self.skipped_depth and flag_name == "dynModels" and flag_name in self.read_flags[-1]:
+            if self.simulation_parameters.additional_dyd_files is None:
+                self.simulation_parameters.additional_dyd_files = []
+            self.simulation_parameters.additional_dyd_files.append(attributes["dydFile"])
+            self.skipped_depth += 1
+        elif self.skipped_depth or flag_name in self.read_flags[-1]:
+            self.skipped_depth += 1
+        else:
+            set_attributes(self.simulation_parameters, flag_name, attributes)
+        self.read_flags[-1].add(flag_name)
+        self.read_flags.append(set())
+
+    def end_flag(self, flag_name: str, attributes: dict):
+        self.read_flags.pop()
+        if self.skipped_depth:
+            self.skipped_depth -= 1
 
     def parse(self) -> DynawoSimulationParameters:
         with open(self.jobs_file, "rb") as xml_data:
-            xml_dict = xmltodict.parse(xml_data)
-            clean_dict = remove_superfluous(xml_dict, ["@", "dyn:"])
-            parse_xml(clean_dict, self.simulation_parameters, "")
+            reader = XMLEventReader(xml_data)
+            reader.on_start(None, self.start_flag)
+            reader.on_end(None, self.end_flag)
+            reader.read()
 
         return self.simulation_parameters
@@ -1 +1,8 @@
-from .xml_parser import HelicsParserXML  # noqa
+from cycosim.utils.lazy_loading import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "HelicsParserXML": ".xml_parser",
+    },
+)
@@ -1,41 +1,25 @@
-import xmltodict
-
-from cycosim.utils import remove_superfluous
+from cycosim.utils import XMLEventReader
 
 from cycosim.adapters.cosimulation import HelicsCosimulation
 
-from cycosim.domain.ports import SimulationConnection
-
-
-def xml_parser(xml_dict: dict, helics_cosim: HelicsCosimulation):
-    for key, val in xml_dict["connect"].items():
-        if key == "publish":
-            if isinstance(val, list):
-                for pub in val:
-                    helics_cosim.add_connection(SimulationConnection(pub["name"], pub["variable"]))
+from cycosim.domain.ports import SimulationConnection, Parser
 
-            else:
-                helics_cosim.add_connection(SimulationConnection(val["name"], val["variable"]))
 
-    for key, val in xml_dict["cosimulationParameters"].items():
-        if key == "parameter":
-            if isinstance(val, list):
-                for par in val:
-                    if par["name"] == "period":
-                        helics_cosim.power_system_federate.period = float(par["value"])
+def set_parameter(helics_cosim: HelicsCosimulation, name: str, value: str):
+    if name == "period":
+        helics_cosim.power_system_federate.period = float(value)
 
-                    elif par["name"] == "log_level":
-                        helics_cosim.power_system_federate.log_level = par["value"]
+    elif name == "log_level":
+        helics_cosim.power_system_federate.log_level = value
 
-            else:
-                if val["name"] == "period":
-                    helics_cosim.power_system_federate.period = float(val["value"])
+    elif name == "packed":
+        helics_cosim.power_system_federate.packed = value.lower() == "true"
 
-                elif val["name"] == "log_level":
-                    helics_cosim.power_system_federate.log_level = val["value"]
+    elif name == "vector_size":
+        helics_cosim.power_system_federate.vector_size = int(value)
 
 
-class HelicsParserXML:
+class HelicsParserXML(Parser):
 
     """
     Summary :
@@ -45,16 +29,31 @@ class HelicsParserXML:
         xml_file (str) : The path to the xml file to parse
         helics_cosim (helicsCosimulation) : an HelicsCosimulation object that's going to be filled with
                                             the data contained in the file.
+        reader (XMLEventReader) : The reader of the file, only set while parsing.
     """
 
+    version = 3
+
     def __init__(self, _xml_file: str):
+        super().__init__(_xml_file)
         self.xml_file = _xml_file
         self.helics_cosim = HelicsCosimulation()
+        self.reader = None
+
+    def start_publish(self, flag_name: str, attributes: dict):
+        if self.reader.get_parent() == "connect":
+            self.helics_cosim.add_connection(SimulationConnection(attributes["name"], attributes["variable"]))
+
+    def start_parameter(self, flag_name: str, attributes: dict):
+        if self.reader.get_parent() == "cosimulationParameters":
+            set_parameter(self.helics_cosim, attributes["name"], attributes["value"])
 
     def parse(self):
         with open(self.xml_file, "rb") as xml_data:
-            xml_dict = xmltodict.parse(xml_data)
-            clean_dict = remove_superfluous(xml_dict, ["hel:", "@"])
-            xml_parser(clean_dict["cosimulation"], self.helics_cosim)
+            self.reader = XMLEventReader(xml_data)
+            self.reader.on_start("publish", self.start_publish)
+            self.reader.on_start("parameter", self.start_parameter)
+            self.reader.read()
+            self.reader = None
 
         return self.helics_cosim
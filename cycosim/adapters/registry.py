@@ -0,0 +1,52 @@
+"""
+The adapters available for every file type and every simulator, imported when first used.
+"""
+from cycosim.domain.ports.files import FileType
+from cycosim.utils.registry import AdapterRegistry
+
+dynawo_parsers = AdapterRegistry("Dynawo parser")
+dynawo_parsers.register(
+    FileType.IIDM, "cycosim.adapters.parsers.dynawo.iidm_parser:DynawoParserIIDM", ("streaming", "compact")
+)
+dynawo_parsers.register(
+    FileType.XIIDM, "cycosim.adapters.parsers.dynawo.iidm_parser:DynawoParserIIDM", ("streaming", "compact")
+)
+dynawo_parsers.register(
+    FileType.JIIDM, "cycosim.adapters.parsers.dynawo.iidm_json_parser:DynawoParserJIIDM", ("compact",)
+)
+dynawo_parsers.register(
+    FileType.BIIDM, "cycosim.adapters.parsers.dynawo.iidm_binary_parser:DynawoParserBIIDM", ("compact",)
+)
+dynawo_parsers.register(FileType.DYD, "cycosim.adapters.parsers.dynawo.dyd_parser:DynawoParserDYD")
+dynawo_parsers.register(FileType.PAR, "cycosim.adapters.parsers.dynawo.par_parser:DynawoParserPAR")
+dynawo_parsers.register(FileType.JOBS, "cycosim.adapters.parsers.dynawo.jobs_parser:DynawoParserJOBS")
+dynawo_parsers.register(FileType.CRV, "cycosim.adapters.parsers.dynawo.crv_parser:DynawoParserCRV")
+
+helics_parsers = AdapterRegistry("HELICS parser")
+helics_parsers.register(FileType.XML, "cycosim.adapters.parsers.helics.xml_parser:HelicsParserXML")
+
+serializers = AdapterRegistry("serializer")
+serializers.register(FileType.IIDM, "cycosim.adapters.serializers.dynawo.iidm_serializer:DynawoSerializerIIDM")
+serializers.register(FileType.XIIDM, "cycosim.adapters.serializers.dynawo.iidm_serializer:DynawoSerializerIIDM")
+serializers.register(
+    FileType.JIIDM, "cycosim.adapters.serializers.dynawo.iidm_json_serializer:DynawoSerializerJIIDM"
+)
+serializers.register(
+    FileType.BIIDM, "cycosim.adapters.serializers.dynawo.iidm_binary_serializer:DynawoSerializerBIIDM"
+)
+serializers.register(FileType.JOBS, "cycosim.adapters.serializers.dynawo.jobs_serializer:DynawoSerializerJOBS")
+serializers.register(FileType.DYD, "cycosim.adapters.serializers.dynawo.dyd_serializer:DynawoSerializerDYD")
+serializers.register(FileType.PAR, "cycosim.adapters.serializers.dynawo.par_serializer:DynawoSerializerPAR")
+serializers.register(FileType.CRV, "cycosim.adapters.serializers.dynawo.crv_serializer:DynawoSerializerCRV")
+
+# The simulators selected with the '--pow_sys_sim' and '--cosim' flags
+power_system_simulators = AdapterRegistry("power system simulator")
+power_system_simulators.register("dynawo", "cycosim.adapters.simulations.dynawo_simulation:DynawoSimulation")
+
+cosimulators = AdapterRegistry("cosimulator")
+cosimulators.register("helics", "cycosim.adapters.cosimulation.helics_cosimulation:HelicsCosimulation")
+
+# The launchers running the serialized simulations, selected with the '--launcher' flag of the runner
+launchers = AdapterRegistry("launcher")
+launchers.register("dynawo", "cycosim.adapters.simulations.launchers:DynawoLauncher")
+launchers.register("command", "cycosim.adapters.simulations.launchers:CommandLauncher")
@@ -1,9 +1,16 @@
-from .dynawo import (  # noqa
-    DynawoSerializerIIDM,
-    DynawoSerializerJOBS,
-    DynawoSerializerDYD,
-    DynawoSerializerPAR,
-    DynawoSerializerCRV,
-)
+from cycosim.utils.lazy_loading import lazy_attributes
 
-from .helics import HelicsSerializerJSON  # noqa
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "DynawoSerializerIIDM": ".dynawo",
+        "DynawoSerializerJIIDM": ".dynawo",
+        "DynawoSerializerBIIDM": ".dynawo",
+        "DynawoSerializerJOBS": ".dynawo",
+        "DynawoSerializerDYD": ".dynawo",
+        "DynawoSerializerPAR": ".dynawo",
+        "DynawoSerializerCRV": ".dynawo",
+        "HelicsSerializerJSON": ".helics",
+        "HelicsSerializerIndexMap": ".helics",
+    },
+)
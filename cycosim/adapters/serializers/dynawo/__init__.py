@@ -1,5 +1,14 @@
-from .iidm_serializer import DynawoSerializerIIDM  # noqa
-from .jobs_serializer import DynawoSerializerJOBS  # noqa
-from .dyd_serializer import DynawoSerializerDYD  # noqa
-from .par_serializer import DynawoSerializerPAR  # noqa
-from .crv_serializer import DynawoSerializerCRV  # noqa
+from cycosim.utils.lazy_loading import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "DynawoSerializerIIDM": ".iidm_serializer",
+        "DynawoSerializerJIIDM": ".iidm_json_serializer",
+        "DynawoSerializerBIIDM": ".iidm_binary_serializer",
+        "DynawoSerializerJOBS": ".jobs_serializer",
+        "DynawoSerializerDYD": ".dyd_serializer",
+        "DynawoSerializerPAR": ".par_serializer",
+        "DynawoSerializerCRV": ".crv_serializer",
+    },
+)
@@ -1,12 +1,15 @@
 import io
 
+from cycosim.domain.ports import FileType, Serializer, ObjectToSerialize
+from cycosim.utils import open_output_file
+
 
 def xml_serialize(out_file: io.TextIOWrapper, curves):
     for curve in curves.curves:
         out_file.write(f'  <curve model="{curve.model}" variable="{curve.variable}"/>\n')
 
 
-class DynawoSerializerCRV:
+class DynawoSerializerCRV(Serializer):
     """_summary_
     Serializer for .crv files.
     """
@@ -15,11 +18,12 @@ class DynawoSerializerCRV:
     encoding = "UTF-8"
 
     def __init__(self, _output_path: str, _curves):
+        super().__init__(ObjectToSerialize(FileType.CRV, _output_path, _curves))
         self.output_path = _output_path
         self.curves = _curves
 
     def serialize(self) -> None:
-        with open(self.output_path, "w", encoding="utf-8") as out_file:
+        with open_output_file(self.output_path) as out_file:
             out_file.write(f'<?xml version="{self.xml_version}" encoding="{self.encoding}"?>\n')
             out_file.write(f'<curvesInput xmlns="{self.curves.xmlns}">\n')
             xml_serialize(out_file, self.curves)
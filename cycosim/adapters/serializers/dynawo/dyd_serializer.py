@@ -1,14 +1,13 @@
 import io
 
-from cycosim.domain.models.power_system import (
-    DynamicComponent,
-    Connection,
-    Connector,
-)
+from cycosim.domain.models.power_system import DynamicModel
 
+from cycosim.domain.ports import FileType, Serializer, ObjectToSerialize
+from cycosim.utils import open_output_file
 
-def xml_serialize(out_file: io.TextIOWrapper, cpnt_list: list):
-    for elem in [e for e in cpnt_list if isinstance(e, DynamicComponent)]:
+
+def xml_serialize(out_file: io.TextIOWrapper, dynamic_model: DynamicModel):
+    for elem in dynamic_model.black_box_models:
         out_file.write(
             f'  <dyn:blackBoxModel id="{elem.id}" lib="{elem.library}" '
             f'parFile="{elem.parameter_file}" parId="{elem.parameter_id}"'
@@ -25,7 +24,7 @@ def xml_serialize(out_file: io.TextIOWrapper, cpnt_list: list):
         else:
             out_file.write("/>\n")
 
-    for elem in [e for e in cpnt_list if isinstance(e, Connector)]:
+    for elem in dynamic_model.connectors:
         out_file.write(f'  <dyn:macroConnector id="{elem.id}"')
 
         if elem.connections:
@@ -37,7 +36,7 @@ def xml_serialize(out_file: io.TextIOWrapper, cpnt_list: list):
         else:
             out_file.write("/>\n")
 
-    for elem in [e for e in cpnt_list if isinstance(e, Connection)]:
+    for elem in dynamic_model.connections:
         if elem.is_macro:
             out_file.write(
                 f'  <dyn:macroConnect connector="{elem.connector}" id1="{elem.id_1}" '
@@ -50,7 +49,7 @@ def xml_serialize(out_file: io.TextIOWrapper, cpnt_list: list):
             )
 
 
-class DynawoSerializerDYD:
+class DynawoSerializerDYD(Serializer):
     """_summary_
     Serializer for .dyd files.
     """
@@ -59,12 +58,13 @@ class DynawoSerializerDYD:
     encoding = "UTF-8"
 
     def __init__(self, _output_path: str, _dyd_network):
+        super().__init__(ObjectToSerialize(FileType.DYD, _output_path, _dyd_network))
         self.output_path = _output_path
         self.dyd_network = _dyd_network
 
     def serialize(self) -> None:
-        with open(self.output_path, "w", encoding="utf-8") as out_file:
+        with open_output_file(self.output_path) as out_file:
             out_file.write(f'<?xml version="{self.xml_version}" encoding="{self.encoding}"?>\n')
             out_file.write('<dyn:dynamicModelsArchitecture xmlns:dyn="http://www.rte-france.com/dynawo">\n')
-            xml_serialize(out_file, self.dyd_network.components)
+            xml_serialize(out_file, self.dyd_network)
             out_file.write("</dyn:dynamicModelsArchitecture>")
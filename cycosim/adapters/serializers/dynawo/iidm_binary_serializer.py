@@ -0,0 +1,189 @@
+import io
+import json
+from array import array
+
+from cycosim.domain.models.power_system import Component
+
+from cycosim.domain.ports import FileType, Serializer, ObjectToSerialize
+from cycosim.utils import open_output_file
+
+from cycosim.adapters.parsers.dynawo.iidm_binary_parser import (
+    BIIDM_MAGIC,
+    BIIDM_VERSION,
+    BIIDM_PREFIX,
+    BIIDM_ALIGNMENT,
+    NUMBER_COLUMN,
+    STRING_COLUMN,
+    NUMBER_STYLE_REPR,
+    NUMBER_STYLE_TEXT,
+    get_number_style,
+)
+from cycosim.adapters.serializers.dynawo.iidm_serializer import get_iidm_attributes
+
+# The dtype of the numpy arrays reading the columns of every array typecode
+array_dtypes = {"b": "|i1", "B": "|u1", "i": "<i4", "d": "<f8", "q": "<i8"}
+
+# Beyond this share of values whose text can not be rebuilt from the float, the column holds strings
+MAX_TEXT_SHARE = 0.1
+
+
+class ColumnWriter:
+    """_summary_
+    Collects the columns of a snapshot and their position in the data part of the file.
+    """
+
+    def __init__(self):
+        self.columns = []
+        self.size = 0
+
+    def add(self, values: array) -> dict:
+        padding = -self.size % BIIDM_ALIGNMENT
+        if padding:
+            self.columns.append(bytes(padding))
+            self.size += padding
+
+        column = {"dtype": array_dtypes[values.typecode], "offset": self.size, "count": len(values)}
+        self.columns.append(values)
+        self.size += len(values) * values.itemsize
+        return column
+
+
+class StringTable:
+    def __init__(self):
+        self.indexes = {}
+
+    def get_index(self, text: str) -> int:
+        index = self.indexes.get(text)
+        if index is None:
+            index = self.indexes[text] = len(self.indexes)
+        return index
+
+    def get_columns(self) -> tuple:
+        offsets = array("q", [0])
+        data = bytearray()
+        for text in self.indexes:
+            data += text.encode("utf-8")
+            offsets.append(len(data))
+        return offsets, array("B", data)
+
+
+def encode_attribute(name: str, texts: list, columns: ColumnWriter, strings: StringTable) -> dict:
+    """_summary_
+    Encodes the values of an attribute over the components of a flag, None where missing.
+    The attribute is stored as float64 if all its values are numbers whose text can be rebuilt
+    from the float, apart from a few ones, and as indexes in the string table otherwise.
+    """
+    values = array("d")
+    styles = array("B")
+    exceptions = {}
+    is_number = True
+    for row, text in enumerate(texts):
+        if text is None:
+            values.append(0.0)
+            styles.append(NUMBER_STYLE_REPR)
+            continue
+        try:
+            val = float(text)
+        except ValueError:
+            is_number = False
+            break
+        values.append(val)
+        styles.append(get_number_style(text, val))
+        if styles[-1] == NUMBER_STYLE_TEXT:
+            exceptions[str(row)] = text
+            if len(exceptions) > MAX_TEXT_SHARE * len(texts):
+                is_number = False
+                break
+
+    attribute = {"name": name, "present": None, "styles": None, "texts": {}}
+    if not is_number:
+        attribute["kind"] = STRING_COLUMN
+        attribute["values"] = columns.add(array("i", [-1 if t is None else strings.get_index(t) for t in texts]))
+        return attribute
+
+    attribute["kind"] = NUMBER_COLUMN
+    attribute["values"] = columns.add(values)
+    if None in texts:
+        attribute["present"] = columns.add(array("B", [text is not None for text in texts]))
+    if any(styles):
+        attribute["styles"] = columns.add(styles)
+        attribute["texts"] = exceptions
+    return attribute
+
+
+def build_snapshot(network: Component) -> tuple:
+    """_summary_
+    Returns the header and the columns of the snapshot of the network.
+    """
+    columns = ColumnWriter()
+    strings = StringTable()
+    flag_names = {}
+    parents = array("i")
+    flags = array("i")
+    ids = array("i")
+    groups = {}
+
+    # Depth first walk, so that every component comes after its parent and before its next sibling
+    stack = [(network, -1)]
+    while stack:
+        cpnt, parent = stack.pop()
+        index = len(parents)
+        parents.append(parent)
+        flags.append(flag_names.setdefault(cpnt.flag_name, len(flag_names)))
+        ids.append(-1 if cpnt.id is None else strings.get_index(cpnt.id))
+
+        rows, texts = groups.setdefault(cpnt.flag_name, (array("i"), {}))
+        for key, val in get_iidm_attributes(cpnt):
+            if key != "id":
+                texts.setdefault(key, {})[len(rows)] = str(val)
+        rows.append(index)
+
+        stack.extend((sub_cpnt, index) for sub_cpnt in reversed(cpnt.sub_components))
+
+    header = {
+        "nbr_components": len(parents),
+        "flag_names": list(flag_names),
+        "structure": {"parents": columns.add(parents), "flags": columns.add(flags), "ids": columns.add(ids)},
+        "groups": {},
+    }
+    for flag_name, (rows, texts) in groups.items():
+        header["groups"][flag_name] = {
+            "rows": columns.add(rows),
+            "attributes": [
+                encode_attribute(name, [values.get(row) for row in range(len(rows))], columns, strings)
+                for name, values in texts.items()
+            ],
+        }
+
+    offsets, data = strings.get_columns()
+    header["strings"] = {"offsets": columns.add(offsets), "data": columns.add(data)}
+    return header, columns
+
+
+class DynawoSerializerBIIDM(Serializer):
+    """_summary_
+    Serializer for the binary IIDM snapshots (.biidm files), see BinaryIIDMSnapshot for the layout.
+    The texts of the attributes are kept, so the xml file written from a loaded snapshot is the
+    one written from the original network, the attributes of a flag being written in the same order.
+    """
+
+    def __init__(self, _output_path: str, _obj_stat_model):
+        super().__init__(ObjectToSerialize(FileType.BIIDM, _output_path, _obj_stat_model))
+        self.output_path = _output_path
+        self.obj_stat_model = _obj_stat_model
+
+    def write(self, out_file: io.BufferedWriter):
+        header, columns = build_snapshot(self.obj_stat_model)
+
+        # The header is padded so that the columns are aligned from the start of the file
+        header_data = json.dumps(header).encode("utf-8")
+        header_data += b" " * (-(BIIDM_PREFIX.size + len(header_data)) % BIIDM_ALIGNMENT)
+
+        out_file.write(BIIDM_PREFIX.pack(BIIDM_MAGIC, BIIDM_VERSION, len(header_data)))
+        out_file.write(header_data)
+        for column in columns.columns:
+            out_file.write(column)
+
+    def serialize(self) -> None:
+        with open_output_file(self.output_path, binary=True) as out_file:
+            self.write(out_file)
@@ -0,0 +1,92 @@
+import io
+import re
+import json
+
+from cycosim.domain.models.power_system import Component
+
+from cycosim.domain.ports import FileType, Serializer, ObjectToSerialize
+from cycosim.utils import open_output_file
+
+from cycosim.adapters.parsers.dynawo.iidm_json_parser import single_flags, get_plural
+from cycosim.adapters.serializers.dynawo.iidm_serializer import get_iidm_attributes
+
+JSON_NUMBER = re.compile(r"-?(0|[1-9][0-9]*)(\.[0-9]+)?([eE][+-]?[0-9]+)?")
+
+# The attributes always written as strings, even when their value looks like a number
+string_attributes = {
+    "id",
+    "name",
+    "bus",
+    "bus1",
+    "bus2",
+    "connectableBus",
+    "connectableBus1",
+    "connectableBus2",
+    "voltageLevelId1",
+    "voltageLevelId2",
+}
+
+
+def to_json_value(key: str, val) -> str:
+    """_summary_
+    Returns the JSON text of an attribute. The numbers and the booleans are written as such,
+    with the text they have in the xml file, so that the file can be read back without any change.
+    """
+    text = str(val)
+    if key not in string_attributes:
+        if JSON_NUMBER.fullmatch(text) or text in ("true", "false"):
+            return text
+    return json.dumps(text)
+
+
+def json_cpnt_serialize(out_file: io.TextIOWrapper, cpnt: Component, nbr_tabs: int):
+    """_summary_
+    Recursively writes the component to the out_file stream as a JSON object. The attributes come
+    first, then the sub components grouped by flag, in the order of their first appearance.
+
+    Args:
+        out_file (io.TextIOWrapper): The stream where to write
+        cpnt (Component): The component currently serialized
+        nbr_tabs (int): The current indentation of the JSON file.
+    """
+    indent = "  " * (nbr_tabs + 1)
+    members = [f"{indent}{json.dumps(key)}: {to_json_value(key, val)}" for key, val in get_iidm_attributes(cpnt)]
+
+    groups = {}
+    for sub_cpnt in cpnt.sub_components:
+        groups.setdefault(sub_cpnt.flag_name, []).append(sub_cpnt)
+
+    out_file.write("{\n")
+    out_file.write(",\n".join(members))
+    for cnt, (flag_name, sub_cpnts) in enumerate(groups.items()):
+        if members or cnt > 0:
+            out_file.write(",\n")
+
+        if flag_name in single_flags and len(sub_cpnts) == 1:
+            out_file.write(f"{indent}{json.dumps(flag_name)}: ")
+            json_cpnt_serialize(out_file, sub_cpnts[0], nbr_tabs + 1)
+            continue
+
+        out_file.write(f"{indent}{json.dumps(get_plural(flag_name))}: [")
+        for index, sub_cpnt in enumerate(sub_cpnts):
+            out_file.write(", " if index > 0 else "")
+            json_cpnt_serialize(out_file, sub_cpnt, nbr_tabs + 1)
+        out_file.write("]")
+
+    out_file.write("\n" + "  " * nbr_tabs + "}")
+
+
+class DynawoSerializerJIIDM(Serializer):
+    """_summary_
+    Serializer for the IIDM networks written in JSON (.jiidm files), see DynawoParserJIIDM.
+    """
+
+    def __init__(self, _output_path: str, _obj_stat_model):
+        super().__init__(ObjectToSerialize(FileType.JIIDM, _output_path, _obj_stat_model))
+        self.output_path = _output_path
+        self.obj_stat_model = _obj_stat_model
+
+    def serialize(self) -> None:
+        with open_output_file(self.output_path) as out_file:
+            json_cpnt_serialize(out_file, self.obj_stat_model, 0)
+            out_file.write("\n")
@@ -2,6 +2,9 @@ import io
 
 from cycosim.domain.models.power_system import Component
 
+from cycosim.domain.ports import FileType, Serializer, ObjectToSerialize
+from cycosim.utils import open_output_file
+
 
 iidm_var_mapping = {
     "xml_version": "version",
@@ -53,6 +56,21 @@ attributes_to_ignore = [
 ]
 
 
+def get_iidm_attributes(cpnt: Component) -> list:
+    """_summary_
+    Returns the (name, value) pairs of the xml attributes of the component, in the order they are written:
+    the id, the variables of the component and then the content of its 'info' dictionary.
+    """
+    attributes = []
+    if cpnt.id is not None:
+        attributes.append(("id", cpnt.id))
+    for key, val in cpnt.get_attributes().items():
+        if key in iidm_var_mapping.keys() and key != "id":
+            attributes.append((iidm_var_mapping[key], val))
+    attributes.extend(cpnt.info.items())
+    return attributes
+
+
 def xml_cpnt_serialize(out_file: io.TextIOWrapper, cpnt: Component, nbr_tabs: int):
     """_summary_
     Recursively writes to the out_file stream the component and its sub-components.
@@ -65,16 +83,7 @@ def xml_cpnt_serialize(out_file: io.TextIOWrapper, cpnt: Component, nbr_tabs: in
     """
     out_file.write("\t" * nbr_tabs)
     out_file.write(f"<iidm:{cpnt.flag_name}")
-    if cpnt.id is not None:
-        out_file.write(f' id="{cpnt.id}"')
-
-    # Add the available variables.
-    for key, val in cpnt.__dict__.items():
-        if key in iidm_var_mapping.keys() and key != "id":
-            out_file.write(f' {iidm_var_mapping[key]}="{val}"')
-
-    # If there is variables in the infos dictionary, add them.
-    for key, val in cpnt.info.items():
+    for key, val in get_iidm_attributes(cpnt):
         out_file.write(f' {key}="{val}"')
 
     if cpnt.sub_components:
@@ -90,7 +99,7 @@ def xml_cpnt_serialize(out_file: io.TextIOWrapper, cpnt: Component, nbr_tabs: in
         out_file.write(f"</iidm:{cpnt.flag_name}>\n")
 
 
-class DynawoSerializerIIDM:
+class DynawoSerializerIIDM(Serializer):
     """_summary_
     Serializer for .iidm and .xiidm files.
     """
@@ -99,10 +108,11 @@ class DynawoSerializerIIDM:
     encoding = "UTF-8"
 
     def __init__(self, _output_path: str, _obj_stat_model):
+        super().__init__(ObjectToSerialize(FileType.IIDM, _output_path, _obj_stat_model))
         self.output_path = _output_path
         self.obj_stat_model = _obj_stat_model
 
     def serialize(self) -> None:
-        with open(self.output_path, "w", encoding="utf-8") as out_file:
+        with open_output_file(self.output_path) as out_file:
             out_file.write(f'<?xml version="{self.xml_version}" encoding="{self.encoding}"?>\n')
             xml_cpnt_serialize(out_file, self.obj_stat_model, 0)
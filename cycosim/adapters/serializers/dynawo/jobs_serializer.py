@@ -2,6 +2,9 @@ import io
 
 from cycosim.adapters.parsers.exceptions import AttributeNotFoundError
 
+from cycosim.domain.ports import FileType, Serializer, ObjectToSerialize
+from cycosim.utils import open_output_file
+
 PREFIX = "dyn:"
 INDENT = "  "
 
@@ -105,10 +108,15 @@ def xml_serializer(out_file: io.TextIOWrapper, sim_obj, nbr_indents: int, curr_f
         else:
             out_file.write(flag + "/>\n")
 
+    # The DYD files added to the first one are written in their own 'dynModels' flags
+    if curr_flag == "dynModels" and sim_obj.additional_dyd_files:
+        for dyd_file in sim_obj.additional_dyd_files:
+            out_file.write(f'{INDENT * nbr_indents}<{PREFIX}{curr_flag} dydFile="{dyd_file}"/>\n')
+
     return
 
 
-class DynawoSerializerJOBS:
+class DynawoSerializerJOBS(Serializer):
     """_summary_
     Serializer for .jobs files.
     """
@@ -117,11 +125,12 @@ class DynawoSerializerJOBS:
     encoding = "UTF-8"
 
     def __init__(self, _output_path: str, _param_obj):
+        super().__init__(ObjectToSerialize(FileType.JOBS, _output_path, _param_obj))
         self.output_path = _output_path
         self.param_obj = _param_obj
 
     def serialize(self) -> None:
-        with open(self.output_path, "w", encoding="utf-8") as out_file:
+        with open_output_file(self.output_path) as out_file:
             out_file.write(f'<?xml version="{self.xml_version}" encoding="{self.encoding}"?>\n')
             xml_serializer(
                 out_file,
@@ -1,15 +1,23 @@
 import io
 
+from cycosim.domain.ports import FileType, Serializer, ObjectToSerialize
+from cycosim.adapters.simulations.dynawo_elements import DynawoParameterStore
+from cycosim.utils import open_output_file
+
 INDENT = "  "
 
 
-def xml_serializer(out_file: io.TextIOWrapper, set_list: list):
-    for st in set_list:
-        out_file.write(f'{INDENT * 1}<set id="{st.id}">\n')
-        for _, par in st.parameters.items():
-            out_file.write(f'{INDENT * 2}<par type="{par.dynawo_type.name}" name="{par.name}" value="{par.value}"/>\n')
+def xml_serializer(out_file: io.TextIOWrapper, store: DynawoParameterStore):
+    for row, set_id in enumerate(store.set_ids):
+        out_file.write(f'{INDENT * 1}<set id="{set_id}">\n')
+        for idx in store.set_parameters[row]:
+            dynawo_type = store.get_type(idx)
+            out_file.write(
+                f'{INDENT * 2}<par type="{dynawo_type.name}" name="{store.parameter_names[idx]}" '
+                f'value="{store.get_text_at(idx)}"/>\n'
+            )
 
-        for _, ref in st.references.items():
+        for _, ref in store.references.get(row, {}).items():
             out_file.write(
                 f'{INDENT * 2}<reference name="{ref.name}" origData="{ref.original_data_source}" '
                 f'origName="{ref.original_name}" type="{ref.dynawo_type.name}"/>\n'
@@ -18,7 +26,7 @@ def xml_serializer(out_file: io.TextIOWrapper, set_list: list):
         out_file.write(f"{INDENT * 1}</set>\n")
 
 
-class DynawoSerializerPAR:
+class DynawoSerializerPAR(Serializer):
     """_summary_
     Serializer for .jobs files.
     """
@@ -27,11 +35,15 @@ class DynawoSerializerPAR:
     encoding = "UTF-8"
 
     def __init__(self, _output_path: str, _obj_param):
+        super().__init__(ObjectToSerialize(FileType.PAR, _output_path, _obj_param))
         self.output_path = _output_path
+        # A list of DynawoParameterSet is copied in a store so that the sets are written from their columns
+        if not isinstance(_obj_param, DynawoParameterStore):
+            _obj_param = DynawoParameterStore.from_sets(_obj_param)
         self.obj_param = _obj_param
 
     def serialize(self) -> None:
-        with open(self.output_path, "w", encoding="utf-8") as out_file:
+        with open_output_file(self.output_path) as out_file:
             out_file.write(
                 f'<?xml version="{self.xml_version}" encoding="{self.encoding}"?>\n'
                 '<parametersSet xmlns="http://www.rte-france.com/dynawo">\n'
@@ -1 +1,9 @@
-from .json_serializer import HelicsSerializerJSON  # noqa
+from cycosim.utils.lazy_loading import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "HelicsSerializerJSON": ".json_serializer",
+        "HelicsSerializerIndexMap": ".index_map_serializer",
+    },
+)
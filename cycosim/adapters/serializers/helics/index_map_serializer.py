@@ -0,0 +1,20 @@
+import json
+
+from cycosim.domain.ports import FileType, Serializer, ObjectToSerialize
+from cycosim.utils import open_output_file
+
+
+class HelicsSerializerIndexMap(Serializer):
+    """_summary_
+    Writes the index map of a federate in packed mode, giving the position of every
+    publication in the vector publications.
+    """
+
+    def __init__(self, _output_path: str, _cosim_obj):
+        super().__init__(ObjectToSerialize(FileType.JSON, _output_path, _cosim_obj))
+        self.output_path = _output_path
+        self.cosim_obj = _cosim_obj
+
+    def serialize(self) -> None:
+        with open_output_file(self.output_path) as out_file:
+            json.dump(self.cosim_obj.get_index_map(), out_file, indent=2)
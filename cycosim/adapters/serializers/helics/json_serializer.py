@@ -1,8 +1,12 @@
 import json
 
+from cycosim.domain.ports import FileType, Serializer, ObjectToSerialize
+from cycosim.utils import open_output_file
 
-class HelicsSerializerJSON:
+
+class HelicsSerializerJSON(Serializer):
     def __init__(self, _output_path: str, _cosim_obj):
+        super().__init__(ObjectToSerialize(FileType.JSON, _output_path, _cosim_obj))
         self.output_path = _output_path
         self.cosim_obj = _cosim_obj
 
@@ -20,9 +24,13 @@ class HelicsSerializerJSON:
         out_dict["period"] = self.cosim_obj.period
 
         if self.cosim_obj.publications:
-            out_dict["publications"] = [pub.to_dict() for pub in self.cosim_obj.publications]
+            # In packed mode, the publications are sent in vectors described by the index map
+            if getattr(self.cosim_obj, "packed", False):
+                out_dict["publications"] = [vec.to_dict() for vec in self.cosim_obj.get_vector_publications()]
+            else:
+                out_dict["publications"] = [pub.to_dict() for pub in self.cosim_obj.publications]
         if self.cosim_obj.subscriptions:
             out_dict["subscriptions"] = [sub.to_dict() for sub in self.cosim_obj.subscriptions]
 
-        with open(self.output_path, "w", encoding="utf-8") as out_file:
+        with open_output_file(self.output_path) as out_file:
             json.dump(out_dict, out_file, indent=2)
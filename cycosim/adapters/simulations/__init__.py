@@ -1,9 +1,21 @@
-from .dynawo_simulation import DynawoSimulation, DynawoSimulationParameters  # noqa
-from .dynawo_elements import (  # noqa
-    DynawoParameter,
-    DynawoParameterType,
-    DynawoReference,
-    DynawoParameterSet,
-    DynawoCurves,
-    Curve,
+from cycosim.utils.lazy_loading import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "DynawoSimulation": ".dynawo_simulation",
+        "DynawoSimulationParameters": ".dynawo_simulation",
+        "DynawoParameter": ".dynawo_elements",
+        "DynawoParameterType": ".dynawo_elements",
+        "DynawoReference": ".dynawo_elements",
+        "DynawoParameterSet": ".dynawo_elements",
+        "DynawoParameterStore": ".dynawo_elements",
+        "DynawoCurves": ".dynawo_elements",
+        "Curve": ".dynawo_elements",
+        "SymbolTable": ".symbol_table",
+        "SymbolKind": ".symbol_table",
+        "Symbol": ".symbol_table",
+        "CommandLauncher": ".launchers",
+        "DynawoLauncher": ".launchers",
+    },
 )
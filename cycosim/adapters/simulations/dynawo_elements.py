@@ -1,7 +1,13 @@
+import sys
+
 from enum import Enum
 
+from array import array
+
 from typing import List
 
+from collections.abc import Mapping
+
 from dataclasses import dataclass
 
 from cycosim.domain.ports.external_elements import ExternalElement
@@ -18,8 +24,12 @@ class DynawoParameterType(str, Enum):
 class DynawoParameter:
     name: str
     dynawo_type: DynawoParameterType
+    # The value as written in the PAR file, the typed value is given by get_typed_value
     value: float | bool | int
 
+    def get_typed_value(self):
+        return to_typed_value(self.dynawo_type, self.value)
+
 
 @dataclass
 class DynawoReference:
@@ -29,11 +39,113 @@ class DynawoReference:
     original_name: str
 
 
+# Code of every parameter type in the 'parameter_types' array of a DynawoParameterStore
+TYPE_CODES = {param_type: code for code, param_type in enumerate(DynawoParameterType)}
+CODE_TYPES = list(DynawoParameterType)
+
+# The value left in the slot of a parameter whose type changed
+EMPTY_VALUES = {
+    DynawoParameterType.DOUBLE: 0.0,
+    DynawoParameterType.INT: 0,
+    DynawoParameterType.BOOL: 0,
+    DynawoParameterType.STRING: None,
+}
+
+
+def to_typed_value(dynawo_type: DynawoParameterType, value):
+    """_summary_
+    Converts a raw value read from a PAR file to the Python type of its Dynawo type.
+    """
+    if dynawo_type == DynawoParameterType.DOUBLE:
+        return float(value)
+    elif dynawo_type == DynawoParameterType.INT:
+        # An INT can be written as a double holding an integer, like "1.0"
+        try:
+            return int(value)
+        except ValueError:
+            return int(float(value))
+    elif dynawo_type == DynawoParameterType.BOOL:
+        if isinstance(value, str):
+            return value.strip().lower() in ("true", "1")
+        return bool(value)
+    return str(value)
+
+
+def to_par_string(dynawo_type: DynawoParameterType, value) -> str:
+    """_summary_
+    Converts a typed value to the string written in a PAR file, for the values that have no text
+    of their own. The doubles holding an integer are written without decimal part.
+    """
+    if dynawo_type == DynawoParameterType.DOUBLE:
+        val = repr(value)
+        return val[:-2] if val.endswith(".0") else val
+    elif dynawo_type == DynawoParameterType.BOOL:
+        return "true" if value else "false"
+    return str(value)
+
+
+class ParameterMapping(Mapping):
+    """_summary_
+    Read-only dictionary of the parameters of a set, mapping their name to a DynawoParameter
+    built from the columns of the store.
+    """
+
+    def __init__(self, _store, _row: int):
+        self.store = _store
+        self.row = _row
+
+    def __getitem__(self, name: str) -> DynawoParameter:
+        param = self.store.get_parameter(self.row, name)
+        if param is None:
+            raise KeyError(name)
+        return param
+
+    def __contains__(self, name) -> bool:
+        return self.store.find(self.row, name) is not None
+
+    def __iter__(self):
+        return (self.store.parameter_names[idx] for idx in self.store.set_parameters[self.row])
+
+    def __len__(self):
+        return len(self.store.set_parameters[self.row])
+
+
 class DynawoParameterSet(ExternalElement):
-    def __init__(self):
-        self.id: str = None
-        self.parameters: dict(DynawoParameter) = {}
-        self.references: dict(DynawoReference) = {}
+    """_summary_
+    A set of parameters of a PAR file. The values are not held by the set but by the
+    DynawoParameterStore it belongs to, the set being its row in the store.
+    A set created on its own gets a store of its own, and is moved to another store
+    when it is appended to it.
+    """
+
+    def __init__(self, _store=None, _row: int = None):
+        if _store is None:
+            _store = DynawoParameterStore()
+            _row = _store.add_set(None)
+        self.store = _store
+        self.row = _row
+
+    def __eq__(self, other):
+        return isinstance(other, DynawoParameterSet) and self.store is other.store and self.row == other.row
+
+    def __hash__(self):
+        return hash((id(self.store), self.row))
+
+    @property
+    def id(self) -> str:
+        return self.store.set_ids[self.row]
+
+    @id.setter
+    def id(self, set_id: str):
+        self.store.set_id(self.row, set_id)
+
+    @property
+    def parameters(self) -> ParameterMapping:
+        return ParameterMapping(self.store, self.row)
+
+    @property
+    def references(self) -> dict:
+        return self.store.references.get(self.row, {})
 
     def get_parameter(self, param_name: str):
         """_summary_
@@ -46,13 +158,18 @@ class DynawoParameterSet(ExternalElement):
             DynawoParameter : The parameter
             None : If the parameter does not exist
         """
-        if param_name in self.parameters:
-            return self.parameters[param_name]
-        return None
+        return self.store.get_parameter(self.row, param_name)
+
+    def get_value(self, param_name: str):
+        """_summary_
+        Returns the value of the parameter with the name 'param_name' converted to its Dynawo type,
+        None if the parameter does not exist.
+        """
+        return self.store.get_value(self.row, param_name)
 
     def add_parameter(self, name: str, dynawo_type: str, value: float | bool | int):
         """_summary_
-        Add a new DynawoParameter object to the dictionary of parameters.
+        Add a new parameter to the set.
         If the used name already exists, it is replaced by the new one.
 
         Args:
@@ -60,7 +177,7 @@ class DynawoParameterSet(ExternalElement):
             dynawo_type (DynawoParameterType): the dynawo type of the parameter
             value (float | bool | int): the value of the parameter
         """
-        self.parameters[name] = DynawoParameter(name, DynawoParameterType(dynawo_type), value)
+        self.store.add_parameter(self.row, name, dynawo_type, value)
 
     def get_reference(self, ref_name: str):
         """_summary_
@@ -73,9 +190,7 @@ class DynawoParameterSet(ExternalElement):
             DynawoParameter : The parameter
             None : If the parameter does not exist
         """
-        if ref_name in self.references:
-            return self.references[ref_name]
-        return None
+        return self.references.get(ref_name)
 
     def add_reference(
         self,
@@ -94,7 +209,421 @@ class DynawoParameterSet(ExternalElement):
             data_source (str): The original data source of the reference
             original_name (str): The original name of the referencee
         """
-        self.references[name] = DynawoReference(name, DynawoParameterType(dynawo_type), data_source, original_name)
+        self.store.add_reference(
+            self.row, DynawoReference(name, DynawoParameterType(dynawo_type), data_source, original_name)
+        )
+
+
+class DynawoParameterStore(ExternalElement):
+    """_summary_
+    Columnar store of the parameter sets of a PAR file. The values are converted once to the
+    type given by their DynawoParameterType and each type is stored in its own array, the
+    parameters only holding the type and the position of their value. The store behaves like
+    the list of its DynawoParameterSet.
+
+    Attributes:
+        set_ids (list) : The id of every set, the position in the list is the row of the set.
+        set_rows (dict) : The row of every set id.
+        set_parameters (list) : For every set, the indexes of its parameters, in their order.
+                                The sets sharing the same payload after deduplicate share the same array.
+        payload_rows (dict) : For every shared payload, the rows of the sets sharing it, given by its owner row.
+        set_owners (dict) : The owner row of the payload of every set sharing its payload.
+        references (dict) : For the sets having references, the dictionary of their DynawoReference.
+        parameter_names (list) : The name of every parameter.
+        parameter_rows (array) : The row of the set of every parameter, the owner row for a shared payload.
+        parameter_types (array) : The code of the DynawoParameterType of every parameter.
+        parameter_slots (array) : The position of the value of every parameter in the array of its type.
+        parameter_texts (list) : The text of the value of every parameter as read from the PAR file, written
+                                 back as it was while the value is unchanged. None for the values set from
+                                 Python objects, which are written with to_par_string.
+        values (dict) : The array of values of every DynawoParameterType.
+        names (dict) : For every parameter name, the indexes of the parameters with this name in all the sets.
+    """
+
+    def __init__(self):
+        self.set_ids = []
+        self.set_rows = {}
+        self.set_parameters = []
+        self.payload_rows = {}
+        self.set_owners = {}
+        self.references = {}
+
+        self.parameter_names = []
+        self.parameter_rows = array("i")
+        self.parameter_types = array("b")
+        self.parameter_slots = array("i")
+        self.parameter_texts = []
+        self.values = {
+            DynawoParameterType.DOUBLE: array("d"),
+            DynawoParameterType.INT: array("q"),
+            DynawoParameterType.BOOL: array("b"),
+            DynawoParameterType.STRING: [],
+        }
+        self.names = {}
+
+    @classmethod
+    def from_sets(cls, param_sets: list):
+        """_summary_
+        Returns a store holding a copy of the given sets, the sets themselves being left untouched.
+        """
+        store = cls()
+        for param_set in param_sets:
+            store.copy_set(param_set)
+        return store
+
+    def __len__(self):
+        return len(self.set_ids)
+
+    def __getitem__(self, row: int) -> DynawoParameterSet:
+        if row < 0:
+            row += len(self.set_ids)
+        if not 0 <= row < len(self.set_ids):
+            raise IndexError("DynawoParameterStore index out of range")
+        return DynawoParameterSet(self, row)
+
+    def __iter__(self):
+        return (DynawoParameterSet(self, row) for row in range(len(self.set_ids)))
+
+    def add_set(self, set_id: str) -> int:
+        """_summary_
+        Adds an empty set and returns its row.
+        """
+        row = len(self.set_ids)
+        self.set_ids.append(set_id)
+        self.set_parameters.append(array("i"))
+        if set_id is not None:
+            self.set_rows.setdefault(set_id, row)
+        return row
+
+    def set_id(self, row: int, set_id: str):
+        """_summary_
+        Changes the id of the set of the given row, the index keeping the first set of every id.
+        """
+        old_id = self.set_ids[row]
+        self.set_ids[row] = set_id
+        if old_id is not None and self.set_rows.get(old_id) == row:
+            # Another set may have the old id after this one
+            next_row = next((other for other in range(row + 1, len(self.set_ids)) if self.set_ids[other] == old_id), None)
+            if next_row is None:
+                del self.set_rows[old_id]
+            else:
+                self.set_rows[old_id] = next_row
+        if set_id is not None and self.set_rows.get(set_id, row) >= row:
+            self.set_rows[set_id] = row
+
+    def get_set(self, set_id: str) -> DynawoParameterSet:
+        """_summary_
+        Returns the first set with the given id, None if there is no such set.
+        """
+        row = self.set_rows.get(set_id)
+        return None if row is None else DynawoParameterSet(self, row)
+
+    def copy_set(self, param_set: DynawoParameterSet) -> int:
+        """_summary_
+        Adds a copy of the given set, which can belong to another store, and returns its row.
+        """
+        row = self.add_set(param_set.id)
+        src = param_set.store
+        for idx in src.set_parameters[param_set.row]:
+            self.add_parameter(
+                row, src.parameter_names[idx], src.get_type(idx), src.get_value_at(idx), src.parameter_texts[idx]
+            )
+        for ref in param_set.references.values():
+            self.add_reference(row, ref)
+        return row
+
+    def append(self, param_set: DynawoParameterSet):
+        """_summary_
+        Adds the given set at the end of the store. A set coming from another store is
+        copied, and the given object then refers to the copy.
+        """
+        if param_set.store is self:
+            return
+        param_set.row = self.copy_set(param_set)
+        param_set.store = self
+
+    def add_parameter(self, row: int, name: str, dynawo_type, value, text: str = None):
+        """_summary_
+        Adds a parameter to the set of the given row, the value being converted to the type
+        of the parameter. If the set already has a parameter with this name, it is replaced
+        and keeps its position. The text written in the PAR file is the given one, by default
+        the value itself when it is a string.
+        """
+        dynawo_type = DynawoParameterType(dynawo_type)
+        if text is None and isinstance(value, str):
+            text = value
+        try:
+            value = to_typed_value(dynawo_type, value)
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"The value '{value}' of the parameter '{name}' of the set '{self.set_ids[row]}' "
+                f"is not a valid {dynawo_type.value}."
+            )
+
+        if row in self.set_owners:
+            self.unshare(row)
+
+        values = self.values[dynawo_type]
+        idx = self.find(row, name)
+        if idx is None:
+            idx = len(self.parameter_names)
+            self.names.setdefault(name, array("i")).append(idx)
+            self.set_parameters[row].append(idx)
+            self.parameter_names.append(name)
+            self.parameter_rows.append(row)
+            self.parameter_types.append(TYPE_CODES[dynawo_type])
+            self.parameter_slots.append(len(values))
+            self.parameter_texts.append(text)
+            values.append(value)
+
+        elif CODE_TYPES[self.parameter_types[idx]] == dynawo_type:
+            values[self.parameter_slots[idx]] = value
+            self.parameter_texts[idx] = text
+
+        else:
+            old_type = CODE_TYPES[self.parameter_types[idx]]
+            self.values[old_type][self.parameter_slots[idx]] = EMPTY_VALUES[old_type]
+            self.parameter_types[idx] = TYPE_CODES[dynawo_type]
+            self.parameter_slots[idx] = len(values)
+            self.parameter_texts[idx] = text
+            values.append(value)
+
+    def add_reference(self, row: int, reference: DynawoReference):
+        self.references.setdefault(row, {})[reference.name] = reference
+
+    def find(self, row: int, name: str) -> int:
+        """_summary_
+        Returns the index of the parameter with the given name in the set of the given row,
+        None if the set does not have it. The parameters of the set are scanned, a set
+        holding a few tens of parameters at most.
+        """
+        names = self.parameter_names
+        for idx in self.set_parameters[row]:
+            if names[idx] == name:
+                return idx
+        return None
+
+    def get_type(self, idx: int) -> DynawoParameterType:
+        return CODE_TYPES[self.parameter_types[idx]]
+
+    def get_value_at(self, idx: int):
+        """_summary_
+        Returns the typed value of the parameter of the given index.
+        """
+        dynawo_type = CODE_TYPES[self.parameter_types[idx]]
+        value = self.values[dynawo_type][self.parameter_slots[idx]]
+        # The booleans are stored as bytes
+        return bool(value) if dynawo_type == DynawoParameterType.BOOL else value
+
+    def get_text_at(self, idx: int) -> str:
+        """_summary_
+        Returns the text written in the PAR file for the parameter of the given index.
+        """
+        text = self.parameter_texts[idx]
+        return to_par_string(self.get_type(idx), self.get_value_at(idx)) if text is None else text
+
+    def get_value(self, row: int, name: str):
+        """_summary_
+        Returns the typed value of the parameter of the given name in the set of the given row.
+        """
+        idx = self.find(row, name)
+        return None if idx is None else self.get_value_at(idx)
+
+    def get_parameter(self, row: int, name: str) -> DynawoParameter:
+        """_summary_
+        Returns the parameter of the given name in the set of the given row, with its value as written
+        in the PAR file. Its typed value is given by get_value.
+        """
+        idx = self.find(row, name)
+        if idx is None:
+            return None
+        return DynawoParameter(name, self.get_type(idx), self.get_text_at(idx))
+
+    def get_sharing_rows(self, row: int) -> list:
+        """_summary_
+        Returns the rows of the sets sharing the payload owned by the given row.
+        """
+        return self.payload_rows.get(row, [row])
+
+    def get_rows(self, name: str) -> list:
+        """_summary_
+        Returns the rows of the sets having a parameter with the given name.
+        """
+        return [row for idx in self.names.get(name, []) for row in self.get_sharing_rows(self.parameter_rows[idx])]
+
+    def get_values(self, name: str) -> dict:
+        """_summary_
+        Returns the value of the given parameter in every set defining it, by set id.
+        """
+        return {
+            self.set_ids[row]: self.get_value_at(idx)
+            for idx in self.names.get(name, [])
+            for row in self.get_sharing_rows(self.parameter_rows[idx])
+        }
+
+    def set_values(self, name: str, values):
+        """_summary_
+        Sets the value of the given parameter in the sets defining it, keeping its type.
+
+        Args:
+            name (str): The name of the parameter
+            values: Either a dictionary of the new values by set id, the sets not in the dictionary
+                    being left untouched, or a single value given to every set.
+        """
+        for idx in list(self.names.get(name, [])):
+            rows = list(self.get_sharing_rows(self.parameter_rows[idx]))
+            dynawo_type = self.get_type(idx)
+            if not isinstance(values, dict):
+                new_values = [values] * len(rows)
+            else:
+                rows = [row for row in rows if self.set_ids[row] in values]
+                new_values = [values[self.set_ids[row]] for row in rows]
+            if not rows:
+                continue
+
+            # A value given to every set sharing a payload is written in the shared payload
+            nbr_sharing = len(self.get_sharing_rows(self.parameter_rows[idx]))
+            if len(rows) == nbr_sharing and all(val == new_values[0] for val in new_values):
+                self.values[dynawo_type][self.parameter_slots[idx]] = to_typed_value(dynawo_type, new_values[0])
+                self.parameter_texts[idx] = new_values[0] if isinstance(new_values[0], str) else None
+            else:
+                for row, value in zip(rows, new_values):
+                    self.add_parameter(row, name, dynawo_type, value)
+
+    def unshare(self, row: int):
+        """_summary_
+        Gives its own copy of its payload to a set sharing it, before it is modified.
+        """
+        owner = self.set_owners.pop(row)
+        rows = self.payload_rows.pop(owner)
+        rows.remove(row)
+        shared = self.set_parameters[row]
+
+        # The remaining sets keep the payload, owned by the first of them
+        new_owner = rows[0]
+        if len(rows) > 1:
+            self.payload_rows[new_owner] = rows
+            for other_row in rows:
+                self.set_owners[other_row] = new_owner
+        else:
+            del self.set_owners[new_owner]
+        if new_owner != owner:
+            for idx in shared:
+                self.parameter_rows[idx] = new_owner
+
+        self.set_parameters[row] = array("i")
+        for idx in shared:
+            self.add_parameter(
+                row, self.parameter_names[idx], self.get_type(idx), self.get_value_at(idx), self.parameter_texts[idx]
+            )
+
+    def get_payload_key(self, row: int) -> tuple:
+        return tuple(
+            (self.parameter_names[idx], self.parameter_types[idx], self.get_value_at(idx), self.parameter_texts[idx])
+            for idx in self.set_parameters[row]
+        )
+
+    def deduplicate(self) -> int:
+        """_summary_
+        Makes the sets holding exactly the same parameters, with the same types, values, texts and order,
+        share a single payload, then drops the parameters that are not used anymore. A set sharing
+        its payload gets its own copy again when it is modified. The references are not shared.
+
+        Returns:
+            int : The number of sets that now share the payload of another set.
+        """
+        owners = {}
+        nbr_shared = 0
+        for row in range(len(self.set_ids)):
+            if self.set_owners.get(row, row) != row:
+                continue
+            owner = owners.setdefault(self.get_payload_key(row), row)
+            if owner == row:
+                continue
+
+            # The sets of the payload of this row join the payload of the owner
+            group = self.payload_rows.setdefault(owner, [owner])
+            self.set_owners[owner] = owner
+            for other_row in self.payload_rows.pop(row, [row]):
+                self.set_parameters[other_row] = self.set_parameters[owner]
+                self.set_owners[other_row] = owner
+                group.append(other_row)
+                nbr_shared += 1
+
+        if nbr_shared:
+            self.compact()
+        return nbr_shared
+
+    def compact(self):
+        """_summary_
+        Rebuilds the columns keeping only the parameters used by a set, in the order of the sets.
+        """
+        old = (self.parameter_names, self.parameter_types, self.parameter_slots, self.values, self.parameter_texts)
+        self.parameter_names = []
+        self.parameter_rows = array("i")
+        self.parameter_types = array("b")
+        self.parameter_slots = array("i")
+        self.parameter_texts = []
+        self.values = {param_type: vals[:0] for param_type, vals in old[3].items()}
+        self.names = {}
+
+        new_payloads = {}
+        for row, payload in enumerate(self.set_parameters):
+            if id(payload) not in new_payloads:
+                new_payload = array("i")
+                for idx in payload:
+                    dynawo_type = CODE_TYPES[old[1][idx]]
+                    values = self.values[dynawo_type]
+                    new_idx = len(self.parameter_names)
+                    self.names.setdefault(old[0][idx], array("i")).append(new_idx)
+                    self.parameter_names.append(old[0][idx])
+                    self.parameter_rows.append(row)
+                    self.parameter_types.append(old[1][idx])
+                    self.parameter_slots.append(len(values))
+                    self.parameter_texts.append(old[4][idx])
+                    values.append(old[3][dynawo_type][old[2][idx]])
+                    new_payload.append(new_idx)
+                new_payloads[id(payload)] = new_payload
+            self.set_parameters[row] = new_payloads[id(payload)]
+
+    def intern_strings(self) -> int:
+        """_summary_
+        Interns the names of the parameters, the string values and the references, so that
+        the repeated strings are held once.
+
+        Returns:
+            int : The estimated number of bytes saved.
+        """
+        saved = 0
+
+        def intern(val: str) -> str:
+            nonlocal saved
+            interned = sys.intern(val)
+            if interned is not val:
+                saved += sys.getsizeof(val)
+            return interned
+
+        self.parameter_names = [intern(name) for name in self.parameter_names]
+        self.names = {intern(name): idxs for name, idxs in self.names.items()}
+        strings = self.values[DynawoParameterType.STRING]
+        strings[:] = [None if val is None else intern(val) for val in strings]
+        self.parameter_texts = [None if text is None else intern(text) for text in self.parameter_texts]
+        for refs in self.references.values():
+            for ref in refs.values():
+                ref.name = intern(ref.name)
+                ref.original_data_source = intern(ref.original_data_source)
+                ref.original_name = intern(ref.original_name)
+        return saved
+
+    def nbytes(self) -> int:
+        """_summary_
+        Returns the memory used by the numeric arrays of the store, in bytes.
+        """
+        arrays = [self.parameter_rows, self.parameter_types, self.parameter_slots] + [
+            vals for vals in self.values.values() if isinstance(vals, array)
+        ]
+        arrays += list({id(payload): payload for payload in self.set_parameters}.values()) + list(self.names.values())
+        return sum(arr.itemsize * len(arr) for arr in arrays)
 
 
 class Curve:
@@ -102,6 +631,8 @@ class Curve:
     Class representanting a curve to plot at the end of a cosimulation
     """
 
+    __slots__ = ("model", "variable")
+
     def __init__(self, _model: str, _variable: str):
         self.model = _model
         self.variable = _variable
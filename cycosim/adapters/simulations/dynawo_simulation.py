@@ -1,9 +1,8 @@
-from typing import List
-
-from cycosim.adapters.simulations.dynawo_elements import DynawoParameterSet, DynawoCurves
+from cycosim.adapters.simulations.dynawo_elements import DynawoParameterSet, DynawoParameterStore, DynawoCurves
+from cycosim.adapters.simulations.symbol_table import SymbolTable
 
 from cycosim.domain.ports import Simulation, Cosimulation
-from cycosim.domain.models.power_system import Component, DynamicModel, DynamicComponent, Connection
+from cycosim.domain.models.power_system import BaseComponent, DynamicModel, DynamicComponent, Connection
 
 from cycosim.adapters.serializers import (
     DynawoSerializerJOBS,
@@ -13,6 +12,8 @@ from cycosim.adapters.serializers import (
     DynawoSerializerCRV,
 )
 
+from cycosim.utils import get_model_digest, serialize_output, profile_stage
+
 
 class DynawoSimulationParameters:
     # Simulation parameters
@@ -29,6 +30,8 @@ class DynawoSimulationParameters:
     iidm_file = None
     dyd_file = None
     crv_file = None
+    # The DYD files of the 'dynModels' flags following the first one, such as the events of a contingency
+    additional_dyd_files = None
 
     # Modeler parameters
     modeler_compilation_directory = None
@@ -59,53 +62,79 @@ class DynawoSimulationParameters:
 
 
 class DynawoSimulation(Simulation):
+    # Whether the CosimulationAutomaton reads the vector publications of the packed mode. Its inputs are
+    # only wired to scalar publications so far, the packed mode is thus refused.
+    reads_vector_publications = False
+
     def __init__(self):
-        self.parameter_sets: List[DynawoParameterSet] = None
+        self.parameter_sets: DynawoParameterStore = None
         self.simulation_parameters: DynawoSimulationParameters = None
-        self.static_network: Component = None
+        self.static_network: BaseComponent = None
         self.dynamic_network: DynamicModel = None
         self.curves: DynawoCurves = None
+        self.symbol_table: SymbolTable = None
+        # The key of the parsed file every element has been read from, by attribute name
+        self.source_keys: dict = {}
 
     def add_element(self, element):
-        if isinstance(element, list):
+        if isinstance(element, (list, DynawoParameterStore)):
             for elem in element:
                 if not isinstance(elem, DynawoParameterSet):
                     raise TypeError(f"Class DynawoSimulation does not have list containing {type(elem)}")
+            if isinstance(element, list):
+                element = DynawoParameterStore.from_sets(element)
             self.parameter_sets = element
+            if self.symbol_table is not None:
+                self.symbol_table.set_parameter_sets(element)
         elif isinstance(element, DynawoSimulationParameters):
             self.simulation_parameters = element
-        elif isinstance(element, Component):
+            if self.symbol_table is not None:
+                self.symbol_table.set_job_parameters(element)
+        elif isinstance(element, BaseComponent):
             self.static_network = element
+            if self.symbol_table is not None:
+                self.symbol_table.set_static_network(element)
         elif isinstance(element, DynamicModel):
             self.dynamic_network = element
+            if self.symbol_table is not None:
+                self.symbol_table.set_dynamic_network(element)
         else:
             raise TypeError(f"Class DynawoSimulation does not have {type(element)}")
 
+    def build_symbol_table(self):
+        """_summary_
+        Gathers the names of the parameter sets, of the job parameters, of the static network
+        and of the dynamic network in a SymbolTable used to resolve the parameters.
+        It is built once every element has been parsed, then kept up to date by add_element and
+        by the methods adding the cosimulation elements. It must be built again if the elements
+        are modified in another way.
+        """
+        self.symbol_table = SymbolTable()
+        self.symbol_table.set_parameter_sets(self.parameter_sets)
+        self.symbol_table.set_job_parameters(self.simulation_parameters)
+        self.symbol_table.set_static_network(self.static_network)
+        self.symbol_table.set_dynamic_network(self.dynamic_network)
+
+    def get_ambiguous_parameters(self):
+        """_summary_
+        Returns the names that can be resolved at more than one place, with all their symbols.
+        """
+        if self.symbol_table is None:
+            self.build_symbol_table()
+        return self.symbol_table.get_ambiguous_names()
+
     def get_parameter(self, var_name: str):
         split_var = var_name.split("/")
         pure_name = split_var[-1]
 
-        param = None
-        # Check in the parameters class
-        for sets in self.parameter_sets:
-            param = sets.get_parameter(pure_name)
-            if param is not None:
-                return param
+        if self.symbol_table is None:
+            self.build_symbol_table()
 
-        # Check in the simulation class
-        param = self.simulation_parameters.get_parameter(pure_name)
-        if param is not None:
-            return param
-
-        # Check in the static network
-        param = self.static_network.get_sub_component(pure_name)
-        if param is not None:
-            return param
-
-        # Check in the dynamic network
-        param = self.dynamic_network.get_parameter(pure_name)
-        if param is not None:
-            return param
+        # The parameter sets are checked first, then the simulation parameters, the static network
+        # and finally the dynamic network.
+        symbol = self.symbol_table.resolve(pure_name)
+        if symbol is not None:
+            return symbol.value
 
         return None
 
@@ -120,7 +149,9 @@ class DynawoSimulation(Simulation):
             dyn_comp.parameter_file = self.simulation_parameters.network_parameter_file
             dyn_comp.parameter_id = par_id
 
-            self.dynamic_network.components.append(dyn_comp)
+            self.dynamic_network.add_component(dyn_comp)
+            if self.symbol_table is not None:
+                self.symbol_table.add_dynamic_element(dyn_comp)
 
             cnt = 1
             for con in connections:
@@ -132,7 +163,9 @@ class DynawoSimulation(Simulation):
                 curr_con.variable_2 = f"automaton_inputs_{cnt}_"
                 cnt += 1
 
-                self.dynamic_network.components.append(curr_con)
+                self.dynamic_network.add_component(curr_con)
+                if self.symbol_table is not None:
+                    self.symbol_table.add_dynamic_element(curr_con)
 
     def add_cosimulation_set(self, cosim_obj: Cosimulation):
         connections = [cosim_obj.get_connection(pub=p) for p in cosim_obj.power_system_federate.publications]
@@ -170,23 +203,66 @@ class DynawoSimulation(Simulation):
             )
 
             self.parameter_sets.append(param_set)
+            if self.symbol_table is not None:
+                self.symbol_table.add_parameter_set(param_set)
+
+    def get_cosimulation_description(self, cosim_obj: Cosimulation) -> str:
+        """_summary_
+        Returns the text of everything the cosimulation elements added to the dynamic network and
+        to the parameter sets are built from.
+        """
+        federate = cosim_obj.power_system_federate
+        return repr(
+            (
+                federate.period,
+                self.simulation_parameters.network_parameter_file,
+                [(pub.key, pub.info) for pub in federate.publications],
+            )
+        )
 
     def initialize(self, arguments: dict = {}):
-        self.add_cosimulation_connections(arguments["cosimulation"])
-        self.add_cosimulation_set(arguments["cosimulation"])
-
-        DynawoSerializerJOBS(
-            arguments["output_path"] + self.simulation_parameters.name + ".jobs", self.simulation_parameters
-        ).serialize()
-        DynawoSerializerIIDM(
-            arguments["output_path"] + self.simulation_parameters.iidm_file, self.static_network
-        ).serialize()
-        DynawoSerializerDYD(
-            arguments["output_path"] + self.simulation_parameters.dyd_file, self.dynamic_network
-        ).serialize()
-        DynawoSerializerPAR(
-            arguments["output_path"] + self.simulation_parameters.network_parameter_file, self.parameter_sets
-        ).serialize()
-
-        if self.curves is not None:
-            DynawoSerializerCRV(arguments["output_path"] + self.simulation_parameters.crv_file, self.curves).serialize()
+        """_summary_
+        Adds the cosimulation elements to the simulation and serializes it in the output path.
+        If an OutputManifest is given in the 'manifest' argument, the files whose elements did not
+        change since the previous serialization are not serialized again. An element is known to be
+        unchanged by the key of the parsed file it has been read from, in 'source_keys', along with
+        the description of the cosimulation elements added to it.
+        """
+        with profile_stage("injection"):
+            self.add_cosimulation_connections(arguments["cosimulation"])
+            self.add_cosimulation_set(arguments["cosimulation"])
+        manifest = arguments.get("manifest")
+        injected = self.get_cosimulation_description(arguments["cosimulation"])
+
+        with profile_stage("serialization"):
+            serialize_output(
+                DynawoSerializerJOBS(
+                    arguments["output_path"] + self.simulation_parameters.name + ".jobs", self.simulation_parameters
+                ),
+                get_model_digest(self.source_keys.get("simulation_parameters")),
+                manifest,
+            )
+            serialize_output(
+                DynawoSerializerIIDM(arguments["output_path"] + self.simulation_parameters.iidm_file, self.static_network),
+                get_model_digest(self.source_keys.get("static_network")),
+                manifest,
+            )
+            serialize_output(
+                DynawoSerializerDYD(arguments["output_path"] + self.simulation_parameters.dyd_file, self.dynamic_network),
+                get_model_digest(self.source_keys.get("dynamic_network"), injected),
+                manifest,
+            )
+            serialize_output(
+                DynawoSerializerPAR(
+                    arguments["output_path"] + self.simulation_parameters.network_parameter_file, self.parameter_sets
+                ),
+                get_model_digest(self.source_keys.get("parameter_sets"), injected),
+                manifest,
+            )
+
+            if self.curves is not None:
+                serialize_output(
+                    DynawoSerializerCRV(arguments["output_path"] + self.simulation_parameters.crv_file, self.curves),
+                    get_model_digest(self.source_keys.get("curves")),
+                    manifest,
+                )
@@ -0,0 +1,58 @@
+import os
+import shlex
+
+from cycosim.domain.ports import Launcher
+
+# The fields available in the command templates
+COMMAND_FIELDS = ("{file}", "{directory}", "{name}")
+
+
+class CommandLauncher(Launcher):
+    """
+    Summary :
+        Runs the simulations with any command, such as a stand-in executable in the tests.
+        The command is a template whose fields are replaced for every simulation :
+            - {file} : the absolute path of the main file of the simulation,
+            - {directory} : the absolute path of the folder of the main file,
+            - {name} : the name of the main file, without its extension.
+        If the template has no field, the path of the main file is added at its end. The other
+        braces of the template, such as those of a shell or JSON argument, are kept as they are.
+
+        There is no launcher of its own for the co-simulations, which need a HELICS broker along
+        with the federates : they are run with this launcher on the HELICS configuration of the
+        federate, '--launcher command --extension json', and a command starting the broker and
+        all the federates of the folder.
+
+    Attributes :
+        command (str) : The template of the command.
+    """
+
+    def __init__(self, _command: str):
+        self.command = _command
+
+    def get_command(self, main_file: str) -> list:
+        main_file = os.path.abspath(main_file)
+        directory = os.path.dirname(main_file)
+        name = os.path.splitext(os.path.basename(main_file))[0]
+        args = shlex.split(self.command)
+        if not any(field in self.command for field in COMMAND_FIELDS):
+            return args + [main_file]
+        return [
+            arg.replace("{file}", main_file).replace("{directory}", directory).replace("{name}", name) for arg in args
+        ]
+
+
+class DynawoLauncher(CommandLauncher):
+    """
+    Summary :
+        Runs the Dynawo simulations with the Dynawo launcher, found in the PATH or given by the
+        DYNAWO_LAUNCHER environment variable.
+    """
+
+    default_command = "dynawo.sh jobs {file}"
+
+    def __init__(self, _command: str = None):
+        if _command is None:
+            launcher = os.environ.get("DYNAWO_LAUNCHER")
+            _command = self.default_command if launcher is None else f"{shlex.quote(launcher)} jobs {{file}}"
+        super().__init__(_command)
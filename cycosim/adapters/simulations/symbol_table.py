@@ -0,0 +1,148 @@
+from enum import Enum
+
+from dataclasses import dataclass
+
+from cycosim.adapters.simulations.dynawo_elements import DynawoParameterStore
+
+
+class SymbolKind(str, Enum):
+    """_summary_
+    The places where a name can be found in a simulation, given in their resolution order.
+    """
+
+    PARAMETER_SET = "parameter_set"
+    JOB_PARAMETER = "job_parameter"
+    STATIC_COMPONENT = "static_component"
+    DYNAMIC_ELEMENT = "dynamic_element"
+
+
+@dataclass
+class Symbol:
+    name: str
+    kind: SymbolKind
+    value: object
+    owner: object = None
+
+
+class SymbolTable:
+    """_summary_
+    Maps every name used in a simulation to the places where it has been found, so a name
+    is resolved with a few dictionary lookups instead of going through the whole model.
+
+    The parameters of a DynawoParameterStore are not copied in the table, they are resolved
+    with the name index of the store.
+
+    Attributes:
+        symbols (dict) : For every SymbolKind, the dictionary mapping a name to the list of its symbols.
+        parameter_store (DynawoParameterStore) : The store of the parameter sets, if any.
+    """
+
+    def __init__(self):
+        self.symbols = {kind: {} for kind in SymbolKind}
+        self.parameter_store = None
+
+    def add_symbol(self, name: str, kind: SymbolKind, value, owner=None):
+        self.symbols[kind].setdefault(name, []).append(Symbol(name, kind, value, owner))
+
+    def clear(self, kind: SymbolKind):
+        self.symbols[kind] = {}
+
+    def add_parameter_set(self, param_set):
+        # The sets of the store are already resolved through its index
+        if self.parameter_store is not None and param_set.store is self.parameter_store:
+            return
+        for name, param in param_set.parameters.items():
+            self.add_symbol(name, SymbolKind.PARAMETER_SET, param, param_set)
+
+    def set_parameter_sets(self, param_sets: list):
+        self.clear(SymbolKind.PARAMETER_SET)
+        self.parameter_store = param_sets if isinstance(param_sets, DynawoParameterStore) else None
+        if self.parameter_store is not None:
+            return
+        for param_set in param_sets or []:
+            self.add_parameter_set(param_set)
+
+    def get_store_symbols(self, name: str, first_only: bool = False) -> list:
+        """_summary_
+        Returns the symbols of the parameters with the given name in the store of the parameter sets.
+        """
+        if self.parameter_store is None:
+            return []
+        store = self.parameter_store
+        rows = store.get_rows(name)
+        return [
+            Symbol(name, SymbolKind.PARAMETER_SET, store.get_parameter(row, name), store[row])
+            for row in (rows[:1] if first_only else rows)
+        ]
+
+    def get_kind_symbols(self, kind: SymbolKind, name: str, first_only: bool = False) -> list:
+        symbols = self.symbols[kind].get(name, [])
+        if kind == SymbolKind.PARAMETER_SET:
+            symbols = self.get_store_symbols(name, first_only) + symbols
+        return symbols
+
+    def set_job_parameters(self, sim_params):
+        self.clear(SymbolKind.JOB_PARAMETER)
+        if sim_params is None:
+            return
+        for name, val in sim_params.__dict__.items():
+            if val is not None:
+                self.add_symbol(name, SymbolKind.JOB_PARAMETER, val, sim_params)
+
+    def set_static_network(self, network):
+        self.clear(SymbolKind.STATIC_COMPONENT)
+        if network is None or network.index is None:
+            return
+        for cpnt_id, cpnt in network.index.items():
+            self.add_symbol(cpnt_id, SymbolKind.STATIC_COMPONENT, cpnt, cpnt.parent)
+
+    def add_dynamic_element(self, element):
+        for name in dict.fromkeys(element.get_parameter_names()):
+            if name is not None:
+                self.add_symbol(name, SymbolKind.DYNAMIC_ELEMENT, name, element)
+
+    def set_dynamic_network(self, dynamic_model):
+        self.clear(SymbolKind.DYNAMIC_ELEMENT)
+        if dynamic_model is None:
+            return
+        for element in dynamic_model.components:
+            self.add_dynamic_element(element)
+
+    def resolve(self, name: str):
+        """_summary_
+        Returns the first symbol found for the given name, following the order of SymbolKind.
+
+        Args:
+            name (str): The name to resolve
+
+        Returns:
+            Symbol : The symbol
+            None : If the name is unknown
+        """
+        for kind in SymbolKind:
+            symbols = self.get_kind_symbols(kind, name, True)
+            if symbols:
+                return symbols[0]
+        return None
+
+    def get_symbols(self, name: str):
+        """_summary_
+        Returns every symbol found for the given name, following the order of SymbolKind.
+        """
+        return [symbol for kind in SymbolKind for symbol in self.get_kind_symbols(kind, name)]
+
+    def get_ambiguous_names(self):
+        """_summary_
+        Returns the names that have been found at more than one place, with all their symbols.
+
+        Returns:
+            dict : The ambiguous names mapped to the list of their symbols.
+        """
+        counts = {}
+        if self.parameter_store is not None:
+            for name, rows in self.parameter_store.names.items():
+                counts[name] = len(rows)
+        for kind in SymbolKind:
+            for name, symbols in self.symbols[kind].items():
+                counts[name] = counts.get(name, 0) + len(symbols)
+        return {name: self.get_symbols(name) for name, cnt in counts.items() if cnt > 1}
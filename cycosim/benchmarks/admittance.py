@@ -0,0 +1,87 @@
+"""
+Times the assembly of the admittance matrix and its updates on generated grids of increasing size,
+and writes the results in a JSON file.
+
+Usage : python -m cycosim.benchmarks.admittance [--sizes 10000 30000 100000] [--output admittance.json]
+"""
+import json
+import time
+import argparse
+import tempfile
+
+import numpy as np
+
+from cycosim.adapters.parsers.dynawo import DynawoParserIIDM
+from cycosim.benchmarks.grid_generator import generate_grid
+from cycosim.benchmarks.round_trip import measure, get_metadata
+from cycosim.services.input_files.parse_cache import ParseCache
+from cycosim.services.power_system.admittance import AdmittanceMatrix
+from cycosim.services.power_system.bus_reduction import BusReduction
+from cycosim.services.power_system.network_tables import NetworkTables
+
+DEFAULT_SIZES = [10000, 30000, 100000]
+
+
+def switch_branches(admittance: AdmittanceMatrix, branches: np.ndarray):
+    for branch in branches:
+        admittance.set_branch_status(branch, False)
+    for branch in branches:
+        admittance.set_branch_status(branch, True)
+
+
+def run_benchmark(sizes: list, repeat: int = 3, nbr_switched: int = 1000) -> list:
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            iidm_file = generate_grid(tmp_dir, size)["iidm"]
+            network = DynawoParserIIDM(iidm_file, _compact=True).parse()
+
+            tables, tables_time, tables_peak = measure(NetworkTables, network, repeat=repeat)
+            reduction, reduction_time, _ = measure(BusReduction, tables, repeat=repeat)
+            admittance, build_time, build_peak = measure(
+                lambda: AdmittanceMatrix(tables, _reduction=reduction), repeat=repeat
+            )
+
+            branches = np.random.default_rng(0).choice(len(admittance), min(nbr_switched, len(admittance)), False)
+            _, switch_time, _ = measure(switch_branches, admittance, branches.tolist(), repeat=repeat)
+
+            cache = ParseCache(tmp_dir + "/cache")
+            AdmittanceMatrix.from_file(iidm_file, cache=cache)
+            _, cache_time, _ = measure(lambda: AdmittanceMatrix.from_file(iidm_file, cache=cache), repeat=repeat)
+
+            result = {
+                "size": size,
+                "reduced_buses": admittance.nbr_buses,
+                "branches": len(admittance),
+                "nnz": int(admittance.matrix.nnz),
+                "tables_time": tables_time,
+                "tables_peak_mb": tables_peak,
+                "reduction_time": reduction_time,
+                "build_time": build_time,
+                "build_peak_mb": build_peak,
+                "switch_time_us": 1e6 * switch_time / (2 * len(branches)),
+                "cache_load_time": cache_time,
+            }
+            results.append(result)
+            print(
+                f"{size:>8} buses {result['reduced_buses']:>8} reduced {result['nnz']:>9} nnz   "
+                f"tables {tables_time:8.4f} s   reduction {reduction_time:8.4f} s   build {build_time:8.4f} s "
+                f"{build_peak:7.1f} MB   switch {result['switch_time_us']:7.1f} us   "
+                f"cache load {cache_time:8.4f} s"
+            )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", help="The number of buses of the generated grids.", type=int, nargs="+")
+    parser.add_argument("--repeat", help="Number of timed runs per measure.", type=int, default=3)
+    parser.add_argument("--switched", help="The number of branches switched off and on.", type=int, default=1000)
+    parser.add_argument("--output", help="The JSON file where the results are written.", default="admittance.json")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run_benchmark(args.sizes or DEFAULT_SIZES, args.repeat, args.switched)
+    with open(args.output, "w", encoding="utf-8") as out_file:
+        json.dump({"metadata": get_metadata(), "results": results}, out_file, indent=2)
+    print(f"Benchmark run in {time.perf_counter() - start:.1f} s.")
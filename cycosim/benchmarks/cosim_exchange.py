@@ -0,0 +1,100 @@
+"""
+Compares the messages and the bytes exchanged per time step by the power system federate
+in scalar mode, with one publication per variable, and in packed mode, with the variables
+grouped in vector publications.
+
+Usage : python -m cycosim.benchmarks.cosim_exchange [--sizes 10 100 1000 10000] [--vector_size 256]
+                                                    [--output results.json]
+"""
+import json
+import time
+import random
+import argparse
+
+from cycosim.adapters.cosimulation import HelicsCosimulationFederate, encode_scalar, decode_scalar
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+
+
+def create_federate(nbr_variables: int, vector_size: int) -> HelicsCosimulationFederate:
+    federate = HelicsCosimulationFederate()
+    federate.name = "Dynawo"
+    federate.vector_size = vector_size
+    for cnt in range(nbr_variables):
+        federate.add_publication(f"signal_{cnt}", f"MODEL_{cnt}/variable")
+    return federate
+
+
+def scalar_step(federate: HelicsCosimulationFederate, values: dict) -> tuple:
+    """_summary_
+    Encodes and decodes one time step in scalar mode, returns the number of messages and of bytes.
+    """
+    messages = [encode_scalar(values[pub.key]) for pub in federate.publications]
+    decoded = {pub.key: decode_scalar(msg) for pub, msg in zip(federate.publications, messages)}
+    assert decoded == values
+    return len(messages), sum(len(msg) for msg in messages)
+
+
+def packed_step(vector_publications: list, values: dict) -> tuple:
+    """_summary_
+    Encodes and decodes one time step in packed mode, returns the number of messages and of bytes.
+    """
+    messages = [vec.encode(values) for vec in vector_publications]
+    decoded = {}
+    for vec, msg in zip(vector_publications, messages):
+        decoded.update(vec.decode(msg))
+    assert decoded == values
+    return len(messages), sum(len(msg) for msg in messages)
+
+
+def measure_step(func, *args, repeat: int = 10) -> tuple:
+    best_time = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        nbr_messages, nbr_bytes = func(*args)
+        elapsed = time.perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+    return nbr_messages, nbr_bytes, best_time
+
+
+def run_benchmark(sizes: list, vector_size: int, repeat: int = 10) -> list:
+    results = []
+    for size in sizes:
+        federate = create_federate(size, vector_size)
+        values = {pub.key: random.random() for pub in federate.publications}
+        vector_publications = federate.get_vector_publications()
+
+        for mode, func, args in (
+            ("scalar", scalar_step, (federate, values)),
+            ("packed", packed_step, (vector_publications, values)),
+        ):
+            nbr_messages, nbr_bytes, step_time = measure_step(func, *args, repeat=repeat)
+            results.append(
+                {
+                    "size": size,
+                    "mode": mode,
+                    "vector_size": vector_size if mode == "packed" else 1,
+                    "messages_per_step": nbr_messages,
+                    "bytes_per_step": nbr_bytes,
+                    "codec_time_per_step": step_time,
+                }
+            )
+            print(
+                f"{size:>8} {mode:<8} {nbr_messages:>8} messages {nbr_bytes:>10} bytes "
+                f"{step_time * 1000:9.3f} ms to encode and decode"
+            )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", help="The numbers of published variables.", type=int, nargs="+")
+    parser.add_argument("--vector_size", help="The maximum number of values of a vector.", type=int, default=256)
+    parser.add_argument("--repeat", help="Number of timed steps per measure.", type=int, default=10)
+    parser.add_argument("--output", help="The JSON file where the results are written.")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes or DEFAULT_SIZES, args.vector_size, args.repeat)
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as out_file:
+            json.dump(results, out_file, indent=2)
@@ -0,0 +1,353 @@
+"""
+Generates a synthetic set of Dynawo and HELICS input files of a given size.
+
+Usage : python -m cycosim.benchmarks.grid_generator path/to/output/folder --buses 1000 [--name generated] [--seed 0]
+"""
+import os
+import random
+import argparse
+
+NOMINAL_V_HV = 225.0
+NOMINAL_V_LV = 63.0
+
+# Three generator parameterizations, each shared by a third of the generators
+GENERATOR_PARAMETERS = [
+    {"generator_H": 5.4, "generator_SNom": 1150.0, "generator_XdPu": 2.22, "generator_RaPu": 0.003},
+    {"generator_H": 4.2, "generator_SNom": 700.0, "generator_XdPu": 2.0, "generator_RaPu": 0.002},
+    {"generator_H": 6.3, "generator_SNom": 1500.0, "generator_XdPu": 2.57, "generator_RaPu": 0.004},
+]
+
+
+class GeneratedGrid:
+    """_summary_
+    Description of a synthetic grid, from which every input file is written.
+    The grid is made of substations holding two buses. Most substations have a single voltage level
+    where both buses are coupled by a switch, every fifth substation has a second lower voltage level
+    linked by a transformer. The substations are linked by a ring of lines plus random meshing lines.
+    Every substation has a load, every third one has a generator.
+
+    Attributes:
+        name (str) : The name of the case, used for the file names.
+        substations (list) : For every substation, a dict describing its voltage levels, buses and elements.
+        lines (list) : The (id, bus_1, voltage_level_1, bus_2, voltage_level_2) of every line.
+        generators (list) : The id of every generator.
+        loads (list) : The id of every load.
+    """
+
+    def __init__(self, _name: str, _nbr_buses: int, _seed: int = 0):
+        self.name = _name
+        rand = random.Random(_seed)
+
+        nbr_substations = max(2, (_nbr_buses + 1) // 2)
+        self.substations = []
+        self.generators = []
+        self.loads = []
+
+        total_load = 0.0
+        for s in range(nbr_substations):
+            with_transformer = s % 5 == 4
+            sub = {
+                "id": f"S{s}",
+                "vl_1": f"VL{s}",
+                "vl_2": f"VL{s}_LV" if with_transformer else None,
+                "bus_1": f"S{s}_B1",
+                "bus_2": f"S{s}_B2",
+                "generator": None,
+                "load": f"LD{s}",
+                "load_p": round(rand.uniform(10.0, 100.0), 2),
+            }
+            total_load += sub["load_p"]
+            if s % 3 == 0:
+                sub["generator"] = f"G{s}"
+                self.generators.append(sub["generator"])
+            self.loads.append(sub["load"])
+            self.substations.append(sub)
+
+        # The generators share the load with a small margin for the losses
+        self.generator_p = round(1.02 * total_load / len(self.generators), 2)
+
+        self.lines = []
+        for s in range(nbr_substations):
+            others = [(s + 1) % nbr_substations]
+            if nbr_substations > 3 and rand.random() < 0.5:
+                others.append(rand.randrange(nbr_substations))
+            for o in others:
+                if o == s:
+                    continue
+                sub_1, sub_2 = self.substations[s], self.substations[o]
+                self.lines.append(
+                    (f"L{len(self.lines)}", sub_1["bus_1"], sub_1["vl_1"], sub_2["bus_1"], sub_2["vl_1"])
+                )
+
+    def write_iidm(self, path: str):
+        with open(path, "w", encoding="utf-8") as out_file:
+            out_file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            out_file.write(
+                '<iidm:network xmlns:iidm="http://www.itesla_project.eu/schema/iidm/1_0" '
+                f'id="{self.name}" caseDate="2023-01-01T00:00:00.000+01:00" forecastDistance="0" sourceFormat="generated">\n'
+            )
+            for sub in self.substations:
+                self.write_substation(out_file, sub)
+
+            for line_id, bus_1, vl_1, bus_2, vl_2 in self.lines:
+                out_file.write(
+                    f'  <iidm:line id="{line_id}" r="0.5" x="5.0" g1="0.0" b1="1.0E-5" g2="0.0" b2="1.0E-5" '
+                    f'bus1="{bus_1}" connectableBus1="{bus_1}" voltageLevelId1="{vl_1}" '
+                    f'bus2="{bus_2}" connectableBus2="{bus_2}" voltageLevelId2="{vl_2}">\n'
+                    '    <iidm:currentLimits1 permanentLimit="1000.0"/>\n'
+                    '    <iidm:currentLimits2 permanentLimit="1000.0"/>\n'
+                    "  </iidm:line>\n"
+                )
+            out_file.write("</iidm:network>\n")
+
+    def write_substation(self, out_file, sub: dict):
+        out_file.write(f'  <iidm:substation id="{sub["id"]}" country="FR">\n')
+        out_file.write(f'    <iidm:voltageLevel id="{sub["vl_1"]}" nominalV="{NOMINAL_V_HV}" topologyKind="BUS_BREAKER">\n')
+        out_file.write("      <iidm:busBreakerTopology>\n")
+        out_file.write(f'        <iidm:bus id="{sub["bus_1"]}" v="{NOMINAL_V_HV}" angle="0.0"/>\n')
+        if sub["vl_2"] is None:
+            out_file.write(f'        <iidm:bus id="{sub["bus_2"]}" v="{NOMINAL_V_HV}" angle="0.0"/>\n')
+            out_file.write(
+                f'        <iidm:switch id="{sub["id"]}_SW" kind="BREAKER" retained="true" open="false" '
+                f'bus1="{sub["bus_1"]}" bus2="{sub["bus_2"]}"/>\n'
+            )
+        out_file.write("      </iidm:busBreakerTopology>\n")
+
+        if sub["generator"] is not None:
+            p = self.generator_p
+            out_file.write(
+                f'      <iidm:generator id="{sub["generator"]}" energySource="THERMAL" minP="0.0" maxP="{2 * p}" '
+                f'voltageRegulatorOn="true" targetP="{p}" targetV="{NOMINAL_V_HV}" targetQ="0.0" '
+                f'bus="{sub["bus_1"]}" connectableBus="{sub["bus_1"]}" p="{-p}" q="0.0">\n'
+                '        <iidm:minMaxReactiveLimits minQ="-500.0" maxQ="500.0"/>\n'
+                "      </iidm:generator>\n"
+            )
+
+        load_vl = sub["vl_1"] if sub["vl_2"] is None else sub["vl_2"]
+        load_bus = sub["bus_2"]
+        load_line = (
+            f'      <iidm:load id="{sub["load"]}" loadType="UNDEFINED" p0="{sub["load_p"]}" q0="{sub["load_p"] / 10}" '
+            f'bus="{load_bus}" connectableBus="{load_bus}" p="{sub["load_p"]}" q="{sub["load_p"] / 10}"/>\n'
+        )
+        if sub["vl_2"] is None:
+            out_file.write(load_line)
+        out_file.write("    </iidm:voltageLevel>\n")
+
+        if sub["vl_2"] is not None:
+            out_file.write(f'    <iidm:voltageLevel id="{load_vl}" nominalV="{NOMINAL_V_LV}" topologyKind="BUS_BREAKER">\n')
+            out_file.write("      <iidm:busBreakerTopology>\n")
+            out_file.write(f'        <iidm:bus id="{load_bus}" v="{NOMINAL_V_LV}" angle="0.0"/>\n')
+            out_file.write("      </iidm:busBreakerTopology>\n")
+            out_file.write(load_line)
+            out_file.write("    </iidm:voltageLevel>\n")
+            out_file.write(
+                f'    <iidm:twoWindingsTransformer id="{sub["id"]}_TR" r="0.2" x="10.0" g="0.0" b="0.0" '
+                f'ratedU1="{NOMINAL_V_HV}" ratedU2="{NOMINAL_V_LV}" '
+                f'bus1="{sub["bus_1"]}" connectableBus1="{sub["bus_1"]}" voltageLevelId1="{sub["vl_1"]}" '
+                f'bus2="{load_bus}" connectableBus2="{load_bus}" voltageLevelId2="{load_vl}"/>\n'
+            )
+        out_file.write("  </iidm:substation>\n")
+
+    def write_dyd(self, path: str):
+        par_file = self.name + ".par"
+        with open(path, "w", encoding="utf-8") as out_file:
+            out_file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            out_file.write('<dyn:dynamicModelsArchitecture xmlns:dyn="http://www.rte-france.com/dynawo">\n')
+            for gen in self.generators:
+                out_file.write(
+                    f'  <dyn:blackBoxModel id="GEN_{gen}" lib="GeneratorSynchronousFourWindingsProportionalRegulations" '
+                    f'parFile="{par_file}" parId="GEN_{gen}" staticId="{gen}">\n'
+                    '    <dyn:staticRef var="generator_PGenPu" staticVar="p"/>\n'
+                    '    <dyn:staticRef var="generator_QGenPu" staticVar="q"/>\n'
+                    '    <dyn:staticRef var="generator_state" staticVar="state"/>\n'
+                    "  </dyn:blackBoxModel>\n"
+                )
+            for load in self.loads:
+                out_file.write(
+                    f'  <dyn:blackBoxModel id="LOAD_{load}" lib="LoadAlphaBeta" parFile="{par_file}" '
+                    f'parId="LOAD" staticId="{load}">\n'
+                    '    <dyn:staticRef var="load_PPu" staticVar="p"/>\n'
+                    '    <dyn:staticRef var="load_QPu" staticVar="q"/>\n'
+                    "  </dyn:blackBoxModel>\n"
+                )
+            out_file.write(
+                f'  <dyn:blackBoxModel id="OMEGA_REF" lib="DYNModelOmegaRef" parFile="{par_file}" parId="OMEGA_REF"/>\n'
+            )
+
+            out_file.write(
+                '  <dyn:macroConnector id="GEN-NETWORK">\n'
+                '    <dyn:connect var1="generator_terminal" var2="@STATIC_ID@@NODE@_ACPIN"/>\n'
+                '    <dyn:connect var1="generator_switchOffSignal1" var2="@STATIC_ID@@NODE@_switchOff"/>\n'
+                "  </dyn:macroConnector>\n"
+                '  <dyn:macroConnector id="LOAD-NETWORK">\n'
+                '    <dyn:connect var1="load_terminal" var2="@STATIC_ID@@NODE@_ACPIN"/>\n'
+                '    <dyn:connect var1="load_switchOffSignal1" var2="@STATIC_ID@@NODE@_switchOff"/>\n'
+                "  </dyn:macroConnector>\n"
+            )
+            for gen in self.generators:
+                out_file.write(f'  <dyn:macroConnect connector="GEN-NETWORK" id1="GEN_{gen}" id2="NETWORK"/>\n')
+            for load in self.loads:
+                out_file.write(f'  <dyn:macroConnect connector="LOAD-NETWORK" id1="LOAD_{load}" id2="NETWORK"/>\n')
+            for cnt, gen in enumerate(self.generators):
+                out_file.write(
+                    f'  <dyn:connect id1="OMEGA_REF" var1="omega_grp_{cnt}" id2="GEN_{gen}" var2="generator_omegaPu"/>\n'
+                    f'  <dyn:connect id1="OMEGA_REF" var1="running_grp_{cnt}" id2="GEN_{gen}" var2="generator_running"/>\n'
+                )
+            out_file.write("</dyn:dynamicModelsArchitecture>\n")
+
+    def write_par(self, path: str):
+        with open(path, "w", encoding="utf-8") as out_file:
+            out_file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            out_file.write('<parametersSet xmlns="http://www.rte-france.com/dynawo">\n')
+            for cnt, gen in enumerate(self.generators):
+                out_file.write(f'  <set id="GEN_{gen}">\n')
+                for name, value in GENERATOR_PARAMETERS[cnt % len(GENERATOR_PARAMETERS)].items():
+                    out_file.write(f'    <par type="DOUBLE" name="{name}" value="{value}"/>\n')
+                out_file.write('    <par type="BOOL" name="generator_UseApproximation" value="true"/>\n')
+                out_file.write('    <par type="INT" name="generator_ExcitationPu" value="1"/>\n')
+                for name, orig_name in (("generator_P0Pu", "p_pu"), ("generator_Q0Pu", "q_pu"), ("generator_U0Pu", "v_pu")):
+                    out_file.write(
+                        f'    <reference name="{name}" origData="IIDM" origName="{orig_name}" type="DOUBLE"/>\n'
+                    )
+                out_file.write("  </set>\n")
+
+            out_file.write(
+                '  <set id="LOAD">\n'
+                '    <par type="DOUBLE" name="load_alpha" value="1.5"/>\n'
+                '    <par type="DOUBLE" name="load_beta" value="2.5"/>\n'
+                '    <reference name="load_P0Pu" origData="IIDM" origName="p_pu" type="DOUBLE"/>\n'
+                '    <reference name="load_Q0Pu" origData="IIDM" origName="q_pu" type="DOUBLE"/>\n'
+                "  </set>\n"
+            )
+
+            out_file.write('  <set id="OMEGA_REF">\n')
+            out_file.write(f'    <par type="INT" name="nbGen" value="{len(self.generators)}"/>\n')
+            for cnt in range(len(self.generators)):
+                out_file.write(f'    <par type="DOUBLE" name="weight_gen_{cnt}" value="1"/>\n')
+            out_file.write("  </set>\n")
+
+            out_file.write(
+                '  <set id="NETWORK">\n'
+                '    <par type="DOUBLE" name="capacitor_no_reclosing_delay" value="300"/>\n'
+                '    <par type="DOUBLE" name="load_Tp" value="90"/>\n'
+                '    <par type="BOOL" name="load_isControllable" value="false"/>\n'
+                '    <par type="STRING" name="transformer_regulating" value="none"/>\n'
+                "  </set>\n"
+            )
+            out_file.write("</parametersSet>\n")
+
+    def write_solver_par(self, path: str):
+        with open(path, "w", encoding="utf-8") as out_file:
+            out_file.write(
+                '<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<parametersSet xmlns="http://www.rte-france.com/dynawo">\n'
+                '  <set id="IDA">\n'
+                '    <par type="INT" name="order" value="2"/>\n'
+                '    <par type="DOUBLE" name="initStep" value="0.000001"/>\n'
+                '    <par type="DOUBLE" name="minStep" value="0.000001"/>\n'
+                '    <par type="DOUBLE" name="maxStep" value="10"/>\n'
+                "  </set>\n"
+                '  <set id="SIM">\n'
+                '    <par type="DOUBLE" name="hMin" value="0.000001"/>\n'
+                '    <par type="DOUBLE" name="hMax" value="1"/>\n'
+                "  </set>\n"
+                "</parametersSet>\n"
+            )
+
+    def write_jobs(self, path: str):
+        with open(path, "w", encoding="utf-8") as out_file:
+            out_file.write(
+                '<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<dyn:jobs xmlns:dyn="http://www.rte-france.com/dynawo">\n'
+                f'  <dyn:job name="{self.name}">\n'
+                '    <dyn:solver lib="dynawo_SolverIDA" parFile="solvers.par" parId="IDA"/>\n'
+                '    <dyn:modeler compileDir="outputs/compilation">\n'
+                f'      <dyn:network iidmFile="{self.name}.iidm" parFile="{self.name}.par" parId="NETWORK"/>\n'
+                f'      <dyn:dynModels dydFile="{self.name}.dyd"/>\n'
+                '      <dyn:precompiledModels useStandardModels="true"/>\n'
+                '      <dyn:modelicaModels useStandardModels="true"/>\n'
+                "    </dyn:modeler>\n"
+                '    <dyn:simulation startTime="0" stopTime="30"/>\n'
+                '    <dyn:outputs directory="outputs">\n'
+                f'      <dyn:curves inputFile="{self.name}.crv" exportMode="CSV"/>\n'
+                "      <dyn:logs>\n"
+                '        <dyn:appender tag="" file="dynawo.log" lvlFilter="DEBUG"/>\n'
+                "      </dyn:logs>\n"
+                "    </dyn:outputs>\n"
+                "  </dyn:job>\n"
+                "</dyn:jobs>\n"
+            )
+
+    def write_crv(self, path: str, nbr_curves: int = 10):
+        with open(path, "w", encoding="utf-8") as out_file:
+            out_file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            out_file.write('<curvesInput xmlns="http://www.rte-france.com/dynawo">\n')
+            for gen in self.generators[:nbr_curves]:
+                out_file.write(f'  <curve model="GEN_{gen}" variable="generator_omegaPu"/>\n')
+            for sub in self.substations[:nbr_curves]:
+                out_file.write(f'  <curve model="NETWORK" variable="{sub["bus_1"]}_Upu_value"/>\n')
+            out_file.write("</curvesInput>\n")
+
+    def write_helics(self, path: str, nbr_publications: int = 100):
+        with open(path, "w", encoding="utf-8") as out_file:
+            out_file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            out_file.write('<hel:cosimulation xmlns:hel="http://helics">\n')
+            out_file.write("  <hel:connect>\n")
+            for gen in self.generators[:nbr_publications]:
+                out_file.write(f'    <hel:publish name="GEN_{gen}_omega" variable="GEN_{gen}/generator_omegaPu"/>\n')
+            out_file.write("  </hel:connect>\n")
+            out_file.write(
+                "  <hel:cosimulationParameters>\n"
+                '    <hel:parameter name="period" value="0.5"/>\n'
+                '    <hel:parameter name="log_level" value="Debug"/>\n'
+                "  </hel:cosimulationParameters>\n"
+                "</hel:cosimulation>\n"
+            )
+
+
+def generate_grid(output_directory: str, nbr_buses: int, name: str = "generated", seed: int = 0) -> dict:
+    """_summary_
+    Writes a synthetic case in the given folder: the JOBS, IIDM, DYD, PAR, solver PAR and CRV files
+    of Dynawo, and the XML file of HELICS in the 'helics' sub folder.
+
+    Args:
+        output_directory (str): The folder where the files are written.
+        nbr_buses (int): The number of buses of the network, rounded up to an even number.
+        name (str): The name of the case.
+        seed (int): The seed of the random generator, the same seed gives the same files.
+
+    Returns:
+        dict : The path of every written file, by file type.
+    """
+    grid = GeneratedGrid(name, nbr_buses, seed)
+    os.makedirs(os.path.join(output_directory, "helics"), exist_ok=True)
+
+    paths = {
+        "jobs": os.path.join(output_directory, name + ".jobs"),
+        "iidm": os.path.join(output_directory, name + ".iidm"),
+        "dyd": os.path.join(output_directory, name + ".dyd"),
+        "par": os.path.join(output_directory, name + ".par"),
+        "crv": os.path.join(output_directory, name + ".crv"),
+        "solver_par": os.path.join(output_directory, "solvers.par"),
+        "helics": os.path.join(output_directory, "helics", name + ".xml"),
+    }
+    grid.write_jobs(paths["jobs"])
+    grid.write_iidm(paths["iidm"])
+    grid.write_dyd(paths["dyd"])
+    grid.write_par(paths["par"])
+    grid.write_crv(paths["crv"])
+    grid.write_solver_par(paths["solver_par"])
+    grid.write_helics(paths["helics"])
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("output_directory", help="The folder where the files are written.")
+    parser.add_argument("--buses", help="The number of buses of the network.", type=int, default=1000)
+    parser.add_argument("--name", help="The name of the case.", default="generated")
+    parser.add_argument("--seed", help="The seed of the random generator.", type=int, default=0)
+    args = parser.parse_args()
+
+    for file_type, path in generate_grid(args.output_directory, args.buses, args.name, args.seed).items():
+        print(f"{file_type:<12}{path}")
@@ -0,0 +1,38 @@
+"""
+Compares the dictionary based and the streaming parsing of an IIDM file.
+
+Usage : python -m cycosim.benchmarks.iidm_parsing path/to/network.iidm [--repeat N]
+"""
+import argparse
+import statistics
+
+from cycosim.adapters.parsers.dynawo import DynawoParserIIDM
+from cycosim.benchmarks.tools import run_isolated
+
+
+def parse_iidm(iidm_file: str, streaming: bool):
+    DynawoParserIIDM(iidm_file, streaming).parse()
+
+
+def compare_modes(iidm_file: str, repeat: int = 3) -> dict:
+    """_summary_
+    Parse the given file with both modes, each run in its own process, and return the
+    median wall time, cpu time and peak RSS of every mode.
+    """
+    results = {}
+    for mode, streaming in (("dict", False), ("streaming", True)):
+        runs = [run_isolated(parse_iidm, iidm_file, streaming) for _ in range(repeat)]
+        results[mode] = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("iidm_file", help="The IIDM file to parse.")
+    parser.add_argument("--repeat", help="Number of runs per mode.", type=int, default=3)
+    args = parser.parse_args()
+
+    results = compare_modes(args.iidm_file, args.repeat)
+    print(f"{'mode':<12}{'wall (s)':>12}{'cpu (s)':>12}{'peak RSS (MB)':>16}")
+    for mode, res in results.items():
+        print(f"{mode:<12}{res['wall_time']:>12.3f}{res['cpu_time']:>12.3f}{res['peak_rss_mb']:>16.1f}")
@@ -0,0 +1,80 @@
+"""
+Measures the cold import time of the package and of its entry points, and the number of modules
+they load, every import being run in a fresh interpreter.
+
+Usage : python -m cycosim.benchmarks.import_time [--repeat 5] [--output results.json]
+"""
+import sys
+import json
+import argparse
+import subprocess
+
+# name : the statement measured
+IMPORTS = {
+    "package": "import cycosim",
+    "cli": "import cycosim.__main__",
+    "par_parser": "from cycosim import DynawoParserPAR",
+    "iidm_parser": "from cycosim import DynawoParserIIDM",
+    "global_parser": "from cycosim import DynawoGlobalParser",
+    "global_serializer": "from cycosim import GlobalSerializer",
+    "simulation": "from cycosim import DynawoSimulation",
+    "everything": "import cycosim; [getattr(cycosim, name) for name in dir(cycosim)]",
+}
+
+MEASURE_SCRIPT = """
+import sys, time, json
+before = set(sys.modules)
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+loaded = set(sys.modules) - before
+print(json.dumps({{
+    "time": elapsed,
+    "modules": len(loaded),
+    "cycosim_modules": len([name for name in loaded if name.startswith("cycosim")]),
+    "numpy": "numpy" in loaded,
+    "xmltodict": "xmltodict" in loaded,
+}}))
+"""
+
+
+def measure_import(statement: str) -> dict:
+    """_summary_
+    Runs the import statement in a fresh interpreter and returns its duration and the modules it loaded.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(output.stdout)
+
+
+def run_benchmark(repeat: int = 5) -> list:
+    results = []
+    for name, statement in IMPORTS.items():
+        runs = [measure_import(statement) for _ in range(repeat)]
+        result = runs[0]
+        result["time"] = min(run["time"] for run in runs)
+        result.update({"name": name, "statement": statement})
+        results.append(result)
+
+        dependencies = [dep for dep in ("numpy", "xmltodict") if result[dep]]
+        print(
+            f"{name:<18} {result['time'] * 1000:8.1f} ms {result['modules']:>5} modules "
+            f"({result['cycosim_modules']} of cycosim) {', '.join(dependencies)}"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", help="Number of runs per import, the fastest one is kept.", type=int, default=5)
+    parser.add_argument("--output", help="The JSON file where the results are written.")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.repeat)
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as out_file:
+            json.dump(results, out_file, indent=2)
@@ -0,0 +1,94 @@
+"""
+Compares the memory held by the static network once parsed with the Component classes and
+with the slotted Compact classes, on generated grids of increasing size. The serialized
+networks of both modes are also compared, they must be identical.
+
+Usage : python -m cycosim.benchmarks.object_memory [--sizes 1000 10000 100000] [--output results.json]
+"""
+import os
+import gc
+import json
+import time
+import filecmp
+import argparse
+import tempfile
+import tracemalloc
+
+from cycosim.adapters.parsers import DynawoParserIIDM
+from cycosim.adapters.serializers import DynawoSerializerIIDM
+from cycosim.benchmarks.grid_generator import generate_grid
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+BYTES_PER_MB = 1024 * 1024
+
+
+def count_components(network) -> int:
+    nbr_components = 0
+    stack = [network]
+    while stack:
+        cpnt = stack.pop()
+        nbr_components += 1
+        stack.extend(cpnt.sub_components)
+    return nbr_components
+
+
+def measure_network(iidm_file: str, compact: bool) -> tuple:
+    """_summary_
+    Parses the file and returns the network with the memory it still holds once the parsing
+    is over, as traced by tracemalloc, and the parsing time.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    network = DynawoParserIIDM(iidm_file, True, compact).parse()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return network, retained, elapsed
+
+
+def run_benchmark(sizes: list) -> list:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            iidm_file = generate_grid(os.path.join(tmp_dir, str(size)), size)["iidm"]
+            outputs = []
+            for mode, compact in (("component", False), ("compact", True)):
+                network, retained, elapsed = measure_network(iidm_file, compact)
+                nbr_components = count_components(network)
+
+                outputs.append(os.path.join(tmp_dir, f"{size}_{mode}.iidm"))
+                DynawoSerializerIIDM(outputs[-1], network).serialize()
+                del network
+
+                results.append(
+                    {
+                        "size": size,
+                        "mode": mode,
+                        "components": nbr_components,
+                        "retained_memory_mb": retained / BYTES_PER_MB,
+                        "bytes_per_component": retained / nbr_components,
+                        "parsing_time": elapsed,
+                    }
+                )
+                print(
+                    f"{size:>8} {mode:<10} {nbr_components:>9} components {retained / BYTES_PER_MB:10.1f} MB "
+                    f"{retained / nbr_components:8.0f} B/component {elapsed:8.3f} s"
+                )
+
+            if not filecmp.cmp(outputs[0], outputs[1], shallow=False):
+                raise RuntimeError(f"The compact network of {size} buses is not serialized as the other one.")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", help="The numbers of buses of the generated grids.", type=int, nargs="+")
+    parser.add_argument("--output", help="The JSON file where the results are written.")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes or DEFAULT_SIZES)
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as out_file:
+            json.dump(results, out_file, indent=2)
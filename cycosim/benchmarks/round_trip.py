@@ -0,0 +1,173 @@
+"""
+Times the parsing and the serialization of every Dynawo and HELICS file on generated grids
+of increasing size, and writes the results in a JSON file. When a previous result file is
+given, the operations that became slower are reported.
+
+Usage : python -m cycosim.benchmarks.round_trip [--sizes 10 100 1000 10000] [--output results.json]
+                                                [--compare previous_results.json] [--threshold 1.2]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import tracemalloc
+import subprocess
+
+from cycosim.adapters.parsers import (
+    DynawoParserJOBS,
+    DynawoParserIIDM,
+    DynawoParserDYD,
+    DynawoParserPAR,
+    DynawoParserCRV,
+    HelicsParserXML,
+)
+from cycosim.adapters.serializers import (
+    DynawoSerializerJOBS,
+    DynawoSerializerIIDM,
+    DynawoSerializerDYD,
+    DynawoSerializerPAR,
+    DynawoSerializerCRV,
+    HelicsSerializerJSON,
+)
+from cycosim.benchmarks.grid_generator import generate_grid
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+
+
+def serialize_helics(output_path: str, helics_cosim):
+    helics_cosim.power_system_federate.name = "Dynawo"
+    HelicsSerializerJSON(output_path, helics_cosim.power_system_federate).serialize()
+
+
+# name : (generated file, parsing function, serializing function)
+ROUND_TRIPS = {
+    "jobs": ("jobs", lambda f: DynawoParserJOBS(f).parse(), lambda p, o: DynawoSerializerJOBS(p, o).serialize()),
+    "iidm": ("iidm", lambda f: DynawoParserIIDM(f).parse(), lambda p, o: DynawoSerializerIIDM(p, o).serialize()),
+    "iidm_streaming": (
+        "iidm",
+        lambda f: DynawoParserIIDM(f, True).parse(),
+        lambda p, o: DynawoSerializerIIDM(p, o).serialize(),
+    ),
+    "iidm_compact": (
+        "iidm",
+        lambda f: DynawoParserIIDM(f, True, True).parse(),
+        lambda p, o: DynawoSerializerIIDM(p, o).serialize(),
+    ),
+    "dyd": ("dyd", lambda f: DynawoParserDYD(f).parse(), lambda p, o: DynawoSerializerDYD(p, o).serialize()),
+    "par": ("par", lambda f: DynawoParserPAR(f).parse(), lambda p, o: DynawoSerializerPAR(p, o).serialize()),
+    "crv": ("crv", lambda f: DynawoParserCRV(f).parse(), lambda p, o: DynawoSerializerCRV(p, o).serialize()),
+    "helics": ("helics", lambda f: HelicsParserXML(f).parse(), serialize_helics),
+}
+
+
+def measure(func, *args, repeat: int = 3):
+    """_summary_
+    Returns the result of the function, its best wall time over 'repeat' calls and its peak
+    of allocated memory in MB, measured with tracemalloc on an additional call.
+    """
+    best_time = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, best_time, peak / (1024 * 1024)
+
+
+def run_benchmark(sizes: list, repeat: int = 3) -> list:
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = generate_grid(tmp_dir, size)
+            for name, (file_type, parse, serialize) in ROUND_TRIPS.items():
+                parsed_obj, parse_time, parse_peak = measure(parse, paths[file_type], repeat=repeat)
+                out_path = os.path.join(tmp_dir, "out_" + os.path.basename(paths[file_type]))
+                _, serialize_time, serialize_peak = measure(serialize, out_path, parsed_obj, repeat=repeat)
+                results.append(
+                    {
+                        "size": size,
+                        "name": name,
+                        "file_size": os.path.getsize(paths[file_type]),
+                        "parse_time": parse_time,
+                        "parse_peak_mb": parse_peak,
+                        "serialize_time": serialize_time,
+                        "serialize_peak_mb": serialize_peak,
+                    }
+                )
+                print(
+                    f"{size:>8} {name:<16} parse {parse_time:9.4f} s {parse_peak:9.1f} MB   "
+                    f"serialize {serialize_time:9.4f} s {serialize_peak:9.1f} MB"
+                )
+    return results
+
+
+def get_metadata() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+    }
+
+
+def compare_results(previous: list, current: list, threshold: float) -> list:
+    """_summary_
+    Returns a description of every measure of 'current' that is more than 'threshold' times
+    the same measure of 'previous'.
+    """
+    previous_by_key = {(res["size"], res["name"]): res for res in previous}
+    slowdowns = []
+    for res in current:
+        prev = previous_by_key.get((res["size"], res["name"]))
+        if prev is None:
+            continue
+        for measure_name in ("parse_time", "serialize_time", "parse_peak_mb", "serialize_peak_mb"):
+            if prev[measure_name] > 0 and res[measure_name] / prev[measure_name] > threshold:
+                slowdowns.append(
+                    f"{res['name']} ({res['size']} buses) {measure_name} : "
+                    f"{prev[measure_name]:.4f} -> {res[measure_name]:.4f} "
+                    f"(x{res[measure_name] / prev[measure_name]:.2f})"
+                )
+    return slowdowns
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", help="The number of buses of the generated grids.", type=int, nargs="+")
+    parser.add_argument("--repeat", help="Number of timed runs per measure.", type=int, default=3)
+    parser.add_argument("--output", help="The JSON file where the results are written.", default="round_trip.json")
+    parser.add_argument("--compare", help="A previous result file to compare with.")
+    parser.add_argument("--threshold", help="The ratio above which a measure is reported.", type=float, default=1.2)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes or DEFAULT_SIZES, args.repeat)
+    with open(args.output, "w", encoding="utf-8") as out_file:
+        json.dump({"metadata": get_metadata(), "results": results}, out_file, indent=2)
+
+    if args.compare is not None:
+        with open(args.compare, "r", encoding="utf-8") as in_file:
+            slowdowns = compare_results(json.load(in_file)["results"], results, args.threshold)
+        for slowdown in slowdowns:
+            print("Slower : " + slowdown)
+        if slowdowns:
+            sys.exit(1)
@@ -0,0 +1,42 @@
+import sys
+import time
+import resource
+import multiprocessing
+
+
+def peak_rss_mb() -> float:
+    """_summary_
+    Return the peak resident set size of the current process in megabytes.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is given in bytes on macOS and in kilobytes on Linux
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def _measured_call(func, args):
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+    func(*args)
+    return {
+        "wall_time": time.perf_counter() - start_wall,
+        "cpu_time": time.process_time() - start_cpu,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_isolated(func, *args) -> dict:
+    """_summary_
+    Run the given function in a fresh interpreter so that its peak memory is not polluted
+    by the previous measures, and return its wall time, cpu time and peak RSS.
+
+    Args:
+        func: A module level function (it must be picklable).
+        args: The arguments given to the function.
+
+    Returns:
+        (dict): The measures of the call.
+    """
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(_measured_call, (func, args))
@@ -1,4 +1,5 @@
 from .component import (  # noqa
+    BaseComponent,
     Component,
     Bus,
     Switch,
@@ -11,6 +12,19 @@ from .component import (  # noqa
     Transformer,
 )
 
+from .compact_component import (  # noqa
+    CompactComponent,
+    CompactBus,
+    CompactSwitch,
+    CompactGenerator,
+    CompactLoad,
+    CompactShuntCompensator,
+    CompactStaticVARCompensator,
+    CompactEdge,
+    CompactACLine,
+    CompactTransformer,
+)
+
 from .power_system_model import (  # noqa
     PowerSystemModel,
 )
@@ -0,0 +1,165 @@
+from types import MappingProxyType
+
+from cycosim.domain.models.power_system.component import BaseComponent
+
+# Returned by the components without any info, it can not be modified by mistake
+EMPTY_INFO = MappingProxyType({})
+
+
+class CompactComponent(BaseComponent):
+    """
+    Summary :
+        Slotted counterpart of Component, used to hold large networks with less memory.
+        The attributes are stored in slots instead of a dictionary per object, and the
+        'info' dictionary and the 'sub_components' list are only created when the first
+        element is added to them, most of the components of a network having no children.
+
+        The attributes are the ones of Component. The 'info' and 'sub_components' getters return
+        empty read-only containers while nothing has been added, so set_info and add_sub_component
+        must be used to fill them.
+
+        The order in which the typed attributes have been set with set_variable is kept in '_order',
+        as in the dictionary of a Component, so that both are written the same way. The orders are
+        tuples shared by all the components having set their attributes in the same order.
+    """
+
+    __slots__ = ("id", "_info", "flag_name", "_sub_components", "parent", "index", "_order")
+
+    # The typed attributes of the class, set to None by the constructor
+    variables = ()
+
+    # Every order of the typed attributes met so far, shared by the components
+    orders = {}
+
+    def __init__(self):
+        self.id = None
+        self._info = None
+        self.flag_name = None
+        self._sub_components = None
+        self.parent = None
+        self.index = None
+        self._order = ()
+        for name in self.variables:
+            setattr(self, name, None)
+
+    @property
+    def info(self):
+        return EMPTY_INFO if self._info is None else self._info
+
+    @info.setter
+    def info(self, val: dict):
+        self._info = dict(val) if val else None
+
+    @property
+    def sub_components(self):
+        return () if self._sub_components is None else self._sub_components
+
+    @sub_components.setter
+    def sub_components(self, val: list):
+        self._sub_components = list(val) if val else None
+
+    def get_attributes(self) -> dict:
+        attributes = {"id": self.id, "flag_name": self.flag_name}
+        # The attributes set with set_variable come first, in the order they have been set
+        for names in (self._order, self.variables):
+            for name in names:
+                val = getattr(self, name, None)
+                if val is not None:
+                    attributes.setdefault(name, val)
+        return attributes
+
+    def set_variable(self, name: str, val):
+        setattr(self, name, val)
+        if name not in self._order:
+            order = self._order + (name,)
+            self._order = CompactComponent.orders.setdefault(order, order)
+
+    def set_info(self, key: str, val):
+        if self._info is None:
+            self._info = {}
+        self._info[key] = val
+
+    def remove_info(self, key: str):
+        if self._info is not None:
+            self._info.pop(key, None)
+            if not self._info:
+                self._info = None
+
+    def add_sub_component(self, new_component):
+        if self._sub_components is None:
+            self._sub_components = []
+        super().add_sub_component(new_component)
+
+
+class CompactBus(CompactComponent):
+    variables = ("V", "nominal_V", "phase", "is_slack_bus")
+    __slots__ = variables
+
+
+class CompactSwitch(CompactComponent):
+    variables = ("is_open", "voltage_level")
+    __slots__ = variables
+
+
+class CompactGenerator(CompactComponent):
+    variables = (
+        "bus",
+        "active_power_min",
+        "active_power_max",
+        "reactive_power_min",
+        "reactive_power_max",
+        "is_voltage_regulation",
+        "active_power_target",
+        "voltage_magnitude_target",
+        "reactive_power_target",
+        "active_power_output",
+        "reactive_power_output",
+        "rated_nominal_apparent_power",
+    )
+    __slots__ = variables
+
+
+class CompactLoad(CompactComponent):
+    variables = (
+        "bus",
+        "active_power_setpoint",
+        "reactive_power_setpoint",
+        "active_power_output",
+        "reactive_power_output",
+    )
+    __slots__ = variables
+
+
+class CompactShuntCompensator(CompactComponent):
+    variables = ("bus", "susceptance")
+    __slots__ = variables
+
+
+class CompactStaticVARCompensator(CompactComponent):
+    variables = ("bus", "reactive_power_setpoint")
+    __slots__ = variables
+
+
+class CompactEdge(CompactComponent):
+    variables = ("bus_1", "bus_2")
+    __slots__ = variables
+
+
+class CompactACLine(CompactEdge):
+    variables = CompactEdge.variables + (
+        "resistance",
+        "reactance",
+        "half_shunt_susceptance",
+        "rated_nominal_apparent_power",
+    )
+    __slots__ = variables[len(CompactEdge.variables) :]
+
+
+class CompactTransformer(CompactEdge):
+    variables = CompactEdge.variables + (
+        "resistance",
+        "reactance",
+        "magnetizing_susceptance",
+        "rated_nominal_apparent_power",
+    )
+    __slots__ = variables[len(CompactEdge.variables) :]
@@ -1,51 +1,158 @@
-class Component:
+class BaseComponent:
     """
     Summary :
-        Base class for every elements of a power system simulation.
-
-    Attributes :
-        id : The unique identifier of the component.
-        info :
-        flag_name :
-        sub_components :
+        Methods shared by the components, whatever the way their attributes are stored.
+        It does not hold any attribute itself, so that the compact components can be slotted.
     """
 
-    def __init__(self):
-        self.id = None
-        self.info = {}
-        self.flag_name = None
-        self.sub_components = []
+    __slots__ = ()
+
+    def get_attributes(self) -> dict:
+        """
+        Summary :
+            Returns the attributes set on the component, by name.
+        """
+        return self.__dict__
+
+    def set_variable(self, name: str, val):
+        """
+        Summary :
+            Sets one of the typed attributes of the component. The attributes are kept in the
+            order they have been set, which is the order they are written in.
+        """
+        setattr(self, name, val)
+
+    def set_info(self, key: str, val):
+        self.info[key] = val
+
+    def remove_info(self, key: str):
+        self.info.pop(key, None)
+
+    def get_root(self):
+        """
+        Summary :
+            Returns the highest component of the tree this component belongs to.
+        """
+        cpnt = self
+        while cpnt.parent is not None:
+            cpnt = cpnt.parent
+        return cpnt
 
     def add_sub_component(self, new_component):
         """
         Summary :
             Append a new component or set of component to the list of components.
+            The new component and its own sub components are registered in the index of the root,
+            so they can be retrieved by id whatever their depth. The id of a component must thus
+            be set before it is added. If two components share the same id, the last added is kept.
 
         Args :
             cpnt : The component to add.
             parent_cpnt : If the added component is a subpart of an other component, specifies this other component.
         """
         self.sub_components.append(new_component)
+        new_component.parent = self
+
+        root = self.get_root()
+        if root.index is None:
+            root.index = {}
+        if new_component.id is not None:
+            root.index[new_component.id] = new_component
+        if new_component.index is not None:
+            root.index.update(new_component.index)
+            new_component.index = None
 
     def get_sub_component(self, component_id: str):
         """
         Summary :
-            Returns the Component object attached to the given id.
+            Returns the Component object attached to the given id, searched among all the
+            components below this one whatever their depth.
 
         Args:
             component_id : The id of the component to search.
 
         Returns:
-            The Component object if it exists, False otherwise.
+            The Component object if it exists, None otherwise.
         """
-        for elem in self.sub_components:
-            if elem.id == component_id:
-                return elem
-            elif elem.sub_components:
-                return elem.get_sub_component(component_id)
+        root = self.get_root()
+        if root.index is None:
+            return None
+
+        cpnt = root.index.get(component_id)
+        if cpnt is None or self is root:
+            return cpnt
+
+        # The component must be below this one in the tree
+        parent = cpnt.parent
+        while parent is not None:
+            if parent is self:
+                return cpnt
+            parent = parent.parent
 
         return None
 
+    def get_parent(self, component_id: str):
+        """
+        Summary :
+            Returns the parent of the component attached to the given id.
+
+        Args:
+            component_id : The id of the component to search.
+
+        Returns:
+            The parent Component object if the component exists, None otherwise.
+        """
+        cpnt = self.get_sub_component(component_id)
+        if cpnt is None:
+            return None
+        return cpnt.parent
+
+    def get_path(self, component_id: str):
+        """
+        Summary :
+            Returns the components to go through to reach the component attached to the given id.
+
+        Args:
+            component_id : The id of the component to search.
+
+        Returns:
+            The list of components from this one to the searched one (both included) if it exists, None otherwise.
+        """
+        cpnt = self.get_sub_component(component_id)
+        if cpnt is None:
+            return None
+
+        path = [cpnt]
+        while cpnt is not self:
+            cpnt = cpnt.parent
+            path.append(cpnt)
+        path.reverse()
+        return path
+
+
+class Component(BaseComponent):
+    """
+    Summary :
+        Base class for every elements of a power system simulation.
+
+    Attributes :
+        id : The unique identifier of the component.
+        info :
+        flag_name :
+        sub_components :
+        parent : The component this one has been added to, None for the root of the network.
+        index : Only kept by the root of a tree of components, maps the id of every component
+                below the root to the component itself. None for the other components.
+    """
+
+    def __init__(self):
+        self.id = None
+        self.info = {}
+        self.flag_name = None
+        self.sub_components = []
+        self.parent = None
+        self.index = None
+
 
 class Bus(Component):
     V: float = None
@@ -2,6 +2,8 @@ from typing import List, Union
 
 
 class DynamicComponent:
+    __slots__ = ("id", "library", "parameter_file", "parameter_id", "static_id", "static_references")
+
     def __init__(self):
         self.id = None
         self.library = None
@@ -47,8 +49,13 @@ class DynamicComponent:
             return self.id
         return None
 
+    def get_parameter_names(self):
+        return [self.id]
+
 
 class StaticReference:
+    __slots__ = ("variable", "static_variable")
+
     def __init__(self):
         self.variable = None
         self.static_variable = None
@@ -73,8 +80,13 @@ class StaticReference:
         else:
             return None
 
+    def get_parameter_names(self):
+        return [self.variable, self.static_variable]
+
 
 class Connector:
+    __slots__ = ("id", "connections")
+
     def __init__(self):
         self.id = None
         self.connections = []
@@ -108,8 +120,13 @@ class Connector:
             return self.id
         return None
 
+    def get_parameter_names(self):
+        return [self.id]
+
 
 class Connection:
+    __slots__ = ("id_1", "id_2", "variable_1", "variable_2", "connector", "index_1")
+
     def __init__(self):
         self.id_1 = None
         self.id_2 = None
@@ -151,12 +168,96 @@ class Connection:
         else:
             return None
 
+    def get_parameter_names(self):
+        return [self.variable_1, self.variable_2]
+
 
 class DynamicModel:
-    components: List[Union[DynamicComponent, StaticReference, Connection, Connector]] = []
+    """_summary_
+    Store of the elements of a DYD file. The elements are kept in the order they have been added,
+    and partitioned by type so that each kind of element can be iterated without filtering the others.
+    The elements must be added with add_component, which keeps the indexes up to date in O(1).
+
+    Attributes:
+        components (list) : Every element, in the order they have been added.
+        black_box_models (list) : The DynamicComponent elements (blackBoxModel).
+        connectors (list) : The Connector elements (macroConnector).
+        connections (list) : The Connection elements (connect and macroConnect).
+        static_references (list) : The StaticReference elements given outside of a blackBoxModel.
+        black_box_models_by_id (dict) : The blackBoxModel of every id.
+        black_box_models_by_library (dict) : The blackBoxModels using every library.
+        black_box_models_by_static_id (dict) : The blackBoxModels linked to every static component.
+        connectors_by_id (dict) : The macroConnector of every id.
+        connections_by_model (dict) : The connections having the given model id as one of their endpoints.
+        names (dict) : The first element declaring every name returned by get_parameter_names.
+    """
+
+    def __init__(self):
+        self.components = []
+        self.black_box_models = []
+        self.connectors = []
+        self.connections = []
+        self.static_references = []
+
+        self.black_box_models_by_id = {}
+        self.black_box_models_by_library = {}
+        self.black_box_models_by_static_id = {}
+        self.connectors_by_id = {}
+        self.connections_by_model = {}
+        self.names = {}
+
+    def __len__(self):
+        return len(self.components)
+
+    def add_component(self, cpnt: Union[DynamicComponent, StaticReference, Connection, Connector]):
+        self.components.append(cpnt)
+
+        if isinstance(cpnt, DynamicComponent):
+            self.black_box_models.append(cpnt)
+            self.black_box_models_by_id.setdefault(cpnt.id, cpnt)
+            self.black_box_models_by_library.setdefault(cpnt.library, []).append(cpnt)
+            if cpnt.static_id is not None:
+                self.black_box_models_by_static_id.setdefault(cpnt.static_id, []).append(cpnt)
+
+        elif isinstance(cpnt, Connector):
+            self.connectors.append(cpnt)
+            self.connectors_by_id.setdefault(cpnt.id, cpnt)
+
+        elif isinstance(cpnt, Connection):
+            self.connections.append(cpnt)
+            for model_id in dict.fromkeys((cpnt.id_1, cpnt.id_2)):
+                if model_id is not None:
+                    self.connections_by_model.setdefault(model_id, []).append(cpnt)
+
+        elif isinstance(cpnt, StaticReference):
+            self.static_references.append(cpnt)
+
+        else:
+            raise TypeError(f"Class DynamicModel does not have {type(cpnt)}")
+
+        for name in cpnt.get_parameter_names():
+            if name is not None:
+                self.names.setdefault(name, cpnt)
+
+    def get_black_box_model(self, model_id: str) -> DynamicComponent:
+        return self.black_box_models_by_id.get(model_id)
+
+    def get_black_box_models_by_library(self, library: str) -> List[DynamicComponent]:
+        return self.black_box_models_by_library.get(library, [])
+
+    def get_black_box_models_by_static_id(self, static_id: str) -> List[DynamicComponent]:
+        return self.black_box_models_by_static_id.get(static_id, [])
+
+    def get_connector(self, connector_id: str) -> Connector:
+        return self.connectors_by_id.get(connector_id)
+
+    def get_connections(self, model_id: str) -> List[Connection]:
+        """_summary_
+        Returns the connections having the given model id as one of their two endpoints.
+        """
+        return self.connections_by_model.get(model_id, [])
 
     def get_parameter(self, param_name: str):
-        for dyn_cpnt in self.components:
-            if dyn_cpnt.get_parameter(param_name) is not None:
-                return dyn_cpnt.get_parameter(param_name)
+        if param_name in self.names:
+            return self.names[param_name].get_parameter(param_name)
         return None
@@ -4,3 +4,4 @@ from .serializers import Serializer, ObjectToSerialize  # noqa
 from .external_elements import ExternalElement  # noqa
 from .simulation import Simulation  # noqa
 from .cosimulation import Cosimulation, SimulationConnection  # noqa
+from .launcher import Launcher  # noqa
@@ -4,6 +4,8 @@ from enum import Enum
 class FileType(str, Enum):
     IIDM = "iidm"
     XIIDM = "xiidm"
+    JIIDM = "jiidm"
+    BIIDM = "biidm"
     DYD = "dyd"
     PAR = "par"
     JOBS = "jobs"
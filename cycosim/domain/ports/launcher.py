@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+
+class Launcher(ABC):
+    """_summary_
+    Builds the command running a serialized simulation, given the path of its main file
+    (the JOBS file of a Dynawo case), so that the runners do not depend on a simulator binary.
+    """
+
+    @abstractmethod
+    def get_command(self, main_file: str) -> list:
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from cycosim.domain.ports import FileType
+from cycosim.utils.profiling import profiled
 
 
 class ParsedFileObject(ABC):
@@ -28,6 +29,7 @@ class Parser(ABC):
     """
     Summary :
         Abstract class that every parser must inherit from.
+        The parse method of every subclass is measured when a Profiler is running.
 
     Attributes :
         file_to_parse : the full path to the file to parse.
@@ -36,6 +38,11 @@ class Parser(ABC):
     file_to_parse: str
     parsed_file_obj: ParsedFileObject
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "parse" in cls.__dict__:
+            cls.parse = profiled("parse", lambda parser: parser.file_to_parse)(cls.parse)
+
     def __init__(self, _file_to_parse: str, _parsed_file_obj: ParsedFileObject = None):
         self.file_to_parse = _file_to_parse
         self.parsed_file_obj = _parsed_file_obj
@@ -1,6 +1,7 @@
 import abc
 
 from cycosim.domain.ports.files import FileType
+from cycosim.utils.profiling import profiled
 
 
 class ObjectToSerialize:
@@ -26,6 +27,7 @@ class Serializer(abc.ABC):
     """
     Summary :
         Abstract class that every serializer must inherit from.
+        The serialize method of every subclass is measured when a Profiler is running.
 
     Attributes :
         file_to_serialize : A pointer to a ObjectToSerialize object that contains the object to serialize.
@@ -33,6 +35,13 @@ class Serializer(abc.ABC):
 
     object_to_serialize: ObjectToSerialize
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "serialize" in cls.__dict__:
+            cls.serialize = profiled("serialize", lambda serializer: serializer.object_to_serialize.output_path)(
+                cls.serialize
+            )
+
     def __init__(self, _object_to_serialize: ObjectToSerialize):
         self.object_to_serialize = _object_to_serialize
 
@@ -1,2 +1,12 @@
-from .input_files import DynawoGlobalParser, HelicsGlobalParser  # noqa
-from .output_files import GlobalSerializer  # noqa
+from cycosim.utils.lazy_loading import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "DynawoGlobalParser": ".input_files",
+        "HelicsGlobalParser": ".input_files",
+        "ParseCache": ".input_files",
+        "GlobalSerializer": ".output_files",
+        "JobRunner": ".batch",
+    },
+)
@@ -0,0 +1,11 @@
+from cycosim.utils.lazy_loading import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "JobRunner": ".job_runner",
+        "RunResult": ".job_runner",
+        "BatchReport": ".job_runner",
+        "find_scenarios": ".job_runner",
+    },
+)
@@ -0,0 +1,320 @@
+"""
+Runs many serialized simulations, such as the contingencies of a case, on a bounded pool of processes.
+
+    python -m cycosim run contingencies/ --workers 8 --timeout 600 --retries 1 --report runs.json
+    python -m cycosim run contingencies/ --launcher command --command "python stand_in.py {file}"
+
+The co-simulations, which need a HELICS broker along with the federates, are run from the HELICS
+configuration of their federate, with a command starting the broker and all the federates :
+
+    python -m cycosim run cases/*/serialized --launcher command --extension json --command "sh run_cosim.sh {directory}"
+"""
+import os
+import json
+import time
+import signal
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from cycosim.domain.ports import FileType, Launcher
+from cycosim.adapters.registry import launchers
+
+# The status of a run
+STATUS_SUCCESS = "success"
+STATUS_FAILED = "failed"
+STATUS_TIMEOUT = "timeout"
+STATUS_ERROR = "error"
+
+# The file where the output of the simulation is written, in the folder of the simulation
+LOG_FILE = "runner.log"
+
+SECONDS_PER_HOUR = 3600
+
+
+def find_scenarios(paths: list, extension: str = FileType.JOBS.value) -> list:
+    """_summary_
+    Returns the main file of every scenario found in the given paths. A path is either the main
+    file itself, a scenario folder holding it, or a folder whose sub folders are scenario folders.
+    The first file of the extension, by name, is the main file of a folder.
+    """
+    main_files = []
+    for path in paths:
+        if os.path.isfile(path):
+            main_files.append(path)
+            continue
+
+        main_file = get_main_file(path, extension)
+        if main_file is not None:
+            main_files.append(main_file)
+            continue
+
+        for entry in sorted(os.scandir(path), key=lambda entry: entry.name):
+            if entry.is_dir():
+                main_file = get_main_file(entry.path, extension)
+                if main_file is not None:
+                    main_files.append(main_file)
+    return main_files
+
+
+def get_main_file(directory: str, extension: str) -> str:
+    files = sorted(entry.name for entry in os.scandir(directory) if entry.name.endswith(f".{extension}"))
+    return os.path.join(directory, files[0]) if files else None
+
+
+def collect_outputs(directory: str, since: float) -> list:
+    """_summary_
+    Returns the files of the folder, relative to it, written since the given time.
+    """
+    outputs = []
+    for root, dirs, files in os.walk(directory):
+        for file in files:
+            path = os.path.join(root, file)
+            if file != LOG_FILE and not os.path.islink(path) and os.path.getmtime(path) >= since:
+                outputs.append(os.path.relpath(path, directory))
+    return sorted(outputs)
+
+
+class RunResult:
+    """_summary_
+    The outcome of the run of a scenario.
+
+    Attributes:
+        main_file (str) : The main file of the scenario.
+        status (str) : 'success', 'failed' (non zero return code), 'timeout', or 'error' if it could not be launched.
+        return_code (int) : The return code of the last attempt, None if it timed out or could not be launched.
+        attempts (int) : The number of times the scenario has been run.
+        wall_time (float) : The time spent running the scenario, all the attempts included, in seconds.
+        outputs (list) : The files written by the last attempt, relative to the folder of the scenario.
+    """
+
+    __slots__ = ("main_file", "status", "return_code", "attempts", "wall_time", "outputs")
+
+    def __init__(self, _main_file: str):
+        self.main_file = _main_file
+        self.status = None
+        self.return_code = None
+        self.attempts = 0
+        self.wall_time = 0.0
+        self.outputs = []
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def run_command(command: list, directory: str, timeout: float = None) -> tuple:
+    """_summary_
+    Runs the command in the given folder, its output being appended to the log file of the folder.
+    The command runs in its own process group, so that the processes it starts are killed with it
+    when it times out.
+
+    Returns:
+        tuple : The status of the run and the return code of the command.
+    """
+    with open(os.path.join(directory, LOG_FILE), "ab") as log:
+        log.write(f"$ {subprocess.list2cmdline(command)}\n".encode("utf-8"))
+        log.flush()
+        try:
+            process = subprocess.Popen(
+                command, cwd=directory, stdout=log, stderr=subprocess.STDOUT, start_new_session=True
+            )
+        except OSError as error:
+            log.write(f"Error : {error}\n".encode("utf-8"))
+            return STATUS_ERROR, None
+
+        try:
+            return_code = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
+            log.write(f"Error : Killed after {timeout} s.\n".encode("utf-8"))
+            return STATUS_TIMEOUT, None
+
+    return (STATUS_SUCCESS if return_code == 0 else STATUS_FAILED), return_code
+
+
+class BatchReport:
+    """_summary_
+    The results of a batch of runs and its throughput.
+
+    Attributes:
+        results (list) : The RunResult of every scenario, in the order of the scenarios.
+        workers (int) : The number of runs at the same time.
+        wall_time (float) : The duration of the batch, in seconds.
+        cpu_time (float) : The user and system time of the processes run by the batch, in seconds.
+    """
+
+    def __init__(self, _results: list, _workers: int, _wall_time: float, _cpu_time: float):
+        self.results = _results
+        self.workers = _workers
+        self.wall_time = _wall_time
+        self.cpu_time = _cpu_time
+
+    def get_counts(self) -> dict:
+        counts = {status: 0 for status in (STATUS_SUCCESS, STATUS_FAILED, STATUS_TIMEOUT, STATUS_ERROR)}
+        for result in self.results:
+            counts[result.status] += 1
+        return counts
+
+    def get_runs_per_hour(self) -> float:
+        return len(self.results) * SECONDS_PER_HOUR / self.wall_time if self.wall_time > 0 else 0.0
+
+    def get_cpu_utilisation(self, nbr_cpus: int = None) -> float:
+        """_summary_
+        Returns the share of the given cpus, the workers by default, kept busy by the runs.
+        """
+        nbr_cpus = nbr_cpus or self.workers
+        return self.cpu_time / (self.wall_time * nbr_cpus) if self.wall_time > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "workers": self.workers,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "runs_per_hour": self.get_runs_per_hour(),
+            "cpu_utilisation": self.get_cpu_utilisation(),
+            "machine_cpu_utilisation": self.get_cpu_utilisation(os.cpu_count()),
+            "counts": self.get_counts(),
+            "results": [result.to_dict() for result in self.results],
+        }
+
+    def save(self, path: str):
+        with open(path, "w") as out_file:
+            json.dump(self.to_dict(), out_file, indent=2)
+
+    def get_summary(self) -> str:
+        counts = ", ".join(f"{count} {status}" for status, count in self.get_counts().items())
+        return (
+            f"{len(self.results)} runs ({counts}) in {self.wall_time:.1f} s : "
+            f"{self.get_runs_per_hour():.1f} runs/hour, "
+            f"{self.get_cpu_utilisation():.0%} cpu utilisation of the {self.workers} workers "
+            f"({self.get_cpu_utilisation(os.cpu_count()):.0%} of the {os.cpu_count()} cpus)."
+        )
+
+
+class JobRunner:
+    """
+    Summary :
+        Runs the scenarios with the given launcher, at most 'workers' of them at the same time.
+        Every run is a process started by the launcher command, the threads of the pool only
+        waiting for them, and the scenarios failing or timing out are run again up to 'retries' times.
+
+    Attributes :
+        launcher (Launcher) : Builds the command running a scenario from its main file.
+        workers (int) : The maximum number of runs at the same time, the number of cpus by default.
+        timeout (float) : The time after which a run is killed, in seconds, None for no limit.
+        retries (int) : The number of times a failed or timed out run is started again.
+        retry_delay (float) : The time waited before running a scenario again, in seconds.
+    """
+
+    def __init__(
+        self,
+        _launcher: Launcher,
+        _workers: int = None,
+        _timeout: float = None,
+        _retries: int = 0,
+        _retry_delay: float = 0.0,
+    ):
+        self.launcher = _launcher
+        self.workers = _workers or os.cpu_count() or 1
+        self.timeout = _timeout
+        self.retries = _retries
+        self.retry_delay = _retry_delay
+
+    def run_scenario(self, main_file: str) -> RunResult:
+        result = RunResult(main_file)
+        directory = os.path.dirname(os.path.abspath(main_file))
+        command = self.launcher.get_command(main_file)
+
+        start = time.perf_counter()
+        while result.attempts <= self.retries:
+            if result.attempts > 0 and self.retry_delay > 0:
+                time.sleep(self.retry_delay)
+            result.attempts += 1
+            attempt_start = time.time()
+            result.status, result.return_code = run_command(command, directory, self.timeout)
+            # A command which can not be launched will not be the next time
+            if result.status in (STATUS_SUCCESS, STATUS_ERROR):
+                break
+
+        result.wall_time = time.perf_counter() - start
+        result.outputs = collect_outputs(directory, attempt_start)
+        return result
+
+    def run(self, main_files: list, on_result=None) -> BatchReport:
+        """_summary_
+        Runs all the scenarios and returns the report of the batch.
+
+        Args:
+            main_files (list): The main file of every scenario.
+            on_result (callable): Called with the number of finished runs and the RunResult of every
+                                  run, as soon as it is finished.
+        """
+        results = [None] * len(main_files)
+        start_times = os.times()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self.run_scenario, main_file): index for index, main_file in enumerate(main_files)}
+            for cnt, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                if on_result is not None:
+                    on_result(cnt, future.result())
+
+        wall_time = time.perf_counter() - start
+        end_times = os.times()
+        cpu_time = (end_times.children_user - start_times.children_user) + (
+            end_times.children_system - start_times.children_system
+        )
+        return BatchReport(results, self.workers, wall_time, cpu_time)
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(
+        prog="cycosim run",
+        description="Runs the serialized scenarios found in the given paths on a bounded pool of processes.",
+    )
+    parser.add_argument(
+        "paths", help="The main files of the scenarios, their folders, or folders of scenario folders.", nargs="+"
+    )
+    parser.add_argument("--extension", help="The extension of the main files.", default=FileType.JOBS.value)
+    parser.add_argument(
+        "--launcher", help="The launcher running the scenarios.", choices=launchers.get_names(), default="dynawo"
+    )
+    parser.add_argument(
+        "--command",
+        help="The command template of the launcher, whose fields {file}, {directory} and {name} are replaced "
+        "for every scenario. Mandatory with '--launcher command', which also runs the co-simulations with "
+        "'--extension json' and a command starting the HELICS broker and the federates.",
+    )
+    parser.add_argument("--workers", help="The maximum number of runs at the same time.", type=int)
+    parser.add_argument("--timeout", help="The time after which a run is killed, in seconds.", type=float)
+    parser.add_argument("--retries", help="The number of times a failed run is started again.", type=int, default=0)
+    parser.add_argument("--retry_delay", help="The time waited before a retry, in seconds.", type=float, default=0.0)
+    parser.add_argument("--report", help="Write the results and the throughput of the batch in the given JSON file.")
+    args = parser.parse_args(argv)
+
+    if args.launcher == "command" and args.command is None:
+        parser.error("'--command' is mandatory with '--launcher command'.")
+    launcher = launchers.get(args.launcher)(args.command)
+
+    main_files = find_scenarios(args.paths, args.extension)
+    if not main_files:
+        print(f"Error : No .{args.extension} file found in {args.paths}.")
+        return 1
+
+    def print_result(cnt: int, result: RunResult):
+        print(
+            f"[{cnt}/{len(main_files)}] {result.status:<7} {result.main_file} ({result.wall_time:.1f} s)", flush=True
+        )
+
+    runner = JobRunner(launcher, args.workers, args.timeout, args.retries, args.retry_delay)
+    report = runner.run(main_files, print_result)
+    print(report.get_summary())
+    if args.report is not None:
+        report.save(args.report)
+
+    return 0 if report.get_counts()[STATUS_SUCCESS] == len(main_files) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
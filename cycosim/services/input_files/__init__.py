@@ -1 +1,14 @@
-from .global_parser import DynawoGlobalParser, HelicsGlobalParser  # noqa
+from cycosim.utils.lazy_loading import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "DynawoGlobalParser": ".global_parser",
+        "HelicsGlobalParser": ".global_parser",
+        "ParseCache": ".parse_cache",
+        "parse_dynawo_files": ".parallel_parser",
+        "intern_simulation": ".interning",
+        "intern_network": ".interning",
+        "deduplicate_parameter_sets": ".interning",
+    },
+)
@@ -3,16 +3,10 @@ import os
 from cycosim.domain.ports.parser import Parser, ParsedFileObject
 from cycosim.domain.ports.files import FileType
 
-from cycosim.adapters.parsers import UnknownFileFormatError
-from cycosim.adapters.parsers.dynawo import (
-    DynawoParserDYD,
-    DynawoParserIIDM,
-    DynawoParserJOBS,
-    DynawoParserPAR,
-    DynawoParserCRV,
-)
+from cycosim.adapters.parsers.exceptions import UnknownFileFormatError
+from cycosim.adapters.registry import dynawo_parsers, helics_parsers
 
-from cycosim.adapters.parsers.helics import HelicsParserXML
+from cycosim.services.input_files.parse_cache import ParseCache, get_parse_key
 
 
 def check_file_validity(file) -> None:
@@ -47,52 +41,96 @@ def check_file_validity(file) -> None:
 
 
 class DynawoGlobalParser(Parser):
-    def __init__(self, _file_to_parse: str):
+    """
+    Summary :
+        Parses a Dynawo file with the parser registered for its extension in the 'dynawo_parsers'
+        registry, which is only imported when first used. The options of the global parser that the
+        registered parser accepts are given to it and are part of the key of the cache.
+    """
+
+    def __init__(
+        self, _file_to_parse: str, _streaming: bool = False, _cache: ParseCache = None, _compact: bool = False
+    ):
         super().__init__(_file_to_parse)
         check_file_validity(_file_to_parse)
         extension = self.file_to_parse.split(".")[-1]
         self.file_type = FileType(extension)
+        self.streaming = _streaming
+        self.cache = _cache
+        self.compact = _compact
+        self.cache_key = None
+
+    def get_parser(self) -> tuple:
+        """
+        Summary :
+            Returns the parser registered for the extension of the file and the options given to it.
+        """
+        if self.file_type not in dynawo_parsers:
+            raise UnknownFileFormatError(f"DynawoParser : Unknown file extension '{self.file_type}'.")
+
+        options = [getattr(self, option) for option in dynawo_parsers.get_options(self.file_type)]
+        return dynawo_parsers.get(self.file_type)(self.file_to_parse, *options), options
+
+    def get_cache_key(self) -> str:
+        """
+        Summary :
+            Returns the key of the cache entry of the parsed file, which the objects derived from the
+            parsed file can be stored next to. It is also known without cache, as the digest of the
+            parsed object. The file is only hashed once, by the first call or by the parsing with a cache.
+        """
+        if self.cache_key is None:
+            parser, options = self.get_parser()
+            self.cache_key = get_parse_key(self.file_to_parse, parser, *options)
+        return self.cache_key
 
     def parse(self):
         """
         Summary :
             Implementation of the abstract method from the parent class Parser.
         """
-        parser = None
-
-        if self.file_type == FileType.IIDM or self.file_type == FileType.XIIDM:
-            parser = DynawoParserIIDM(self.file_to_parse)
-        elif self.file_type == FileType.DYD:
-            parser = DynawoParserDYD(self.file_to_parse)
-        elif self.file_type == FileType.PAR:
-            parser = DynawoParserPAR(self.file_to_parse)
-        elif self.file_type == FileType.JOBS:
-            parser = DynawoParserJOBS(self.file_to_parse)
-        elif self.file_type == FileType.CRV:
-            parser = DynawoParserCRV(self.file_to_parse)
-        else:
-            raise UnknownFileFormatError(f"DynawoParser : Unknown file extension '{self.file_type}'.")
+        parser, options = self.get_parser()
+
+        if self.cache is not None:
+            return self.cache.parse_key(self.get_cache_key(), parser)
 
         return parser.parse()
 
 
 class HelicsGlobalParser(Parser):
-    def __init__(self, _file_to_parse: str):
+    def __init__(self, _file_to_parse: str, _cache: ParseCache = None):
         super().__init__(_file_to_parse)
         check_file_validity(_file_to_parse)
         extension = self.file_to_parse.split(".")[-1]
         self.file_type = FileType(extension)
+        self.cache = _cache
+        self.cache_key = None
+
+    def get_parser(self):
+        """
+        Summary :
+            Returns the parser registered for the extension of the file.
+        """
+        if self.file_type not in helics_parsers:
+            raise UnknownFileFormatError(f"HelicsParser : Unknown file extension '{self.file_type}'.")
+        return helics_parsers.get(self.file_type)(self.file_to_parse)
+
+    def get_cache_key(self) -> str:
+        """
+        Summary :
+            Returns the key of the cache entry of the parsed file, also used as the digest of the parsed object.
+        """
+        if self.cache_key is None:
+            self.cache_key = get_parse_key(self.file_to_parse, self.get_parser())
+        return self.cache_key
 
     def parse(self) -> ParsedFileObject:
         """
         Summary :
             Implementation of the abstract method from the parent class Parser.
         """
-        parser = None
+        parser = self.get_parser()
 
-        if self.file_type == FileType.XML:
-            parser = HelicsParserXML(self.file_to_parse)
-        else:
-            raise UnknownFileFormatError(f"HelicsParser : Unknown file extension '{self.file_type}'.")
+        if self.cache is not None:
+            return self.cache.parse_key(self.get_cache_key(), parser)
 
         return parser.parse()
@@ -0,0 +1,90 @@
+import sys
+
+from cycosim.domain.models.power_system import BaseComponent
+from cycosim.adapters.simulations import DynawoParameterStore, DynawoParameterType
+
+
+class StringInterner:
+    """_summary_
+    Replaces the strings by their interned version, counting the strings replaced and
+    the bytes of the copies that are not referenced by the interned objects anymore.
+    """
+
+    def __init__(self):
+        self.nbr_replaced = 0
+        self.bytes_saved = 0
+
+    def intern(self, val):
+        if not isinstance(val, str):
+            return val
+        interned = sys.intern(val)
+        if interned is not val:
+            self.nbr_replaced += 1
+            self.bytes_saved += sys.getsizeof(val)
+        return interned
+
+
+def intern_network(network: BaseComponent) -> dict:
+    """_summary_
+    Interns the flag names, the ids, the other string attributes and the keys and values of the
+    'info' dictionary of every component of the network, so that the strings repeated across the
+    components are held once.
+
+    Returns:
+        dict : The number of strings replaced and the estimated number of bytes saved.
+    """
+    interner = StringInterner()
+    stack = [network]
+    while stack:
+        cpnt = stack.pop()
+        for attribute, val in list(cpnt.get_attributes().items()):
+            if isinstance(val, str):
+                setattr(cpnt, attribute, interner.intern(val))
+        cpnt.info = {interner.intern(key): interner.intern(val) for key, val in cpnt.info.items()}
+        stack.extend(cpnt.sub_components)
+
+    # The keys of the index are the ids of the components, which have just been interned
+    if network.index is not None:
+        network.index = {sys.intern(cpnt_id): cpnt for cpnt_id, cpnt in network.index.items()}
+
+    return {"strings": interner.nbr_replaced, "bytes_saved": interner.bytes_saved}
+
+
+def get_store_size(store: DynawoParameterStore) -> int:
+    """_summary_
+    Returns an estimation of the memory used by the columns of the store, in bytes.
+    """
+    strings = store.values[DynawoParameterType.STRING]
+    return store.nbytes() + 8 * (len(store.parameter_names) + len(store.parameter_texts) + len(strings))
+
+
+def deduplicate_parameter_sets(store: DynawoParameterStore) -> dict:
+    """_summary_
+    Interns the strings of the store and makes the identical parameter sets share their payload.
+
+    Returns:
+        dict : The number of sets sharing the payload of another one and the estimated number of bytes saved.
+    """
+    size_before = get_store_size(store)
+    nbr_shared = store.deduplicate()
+    columns_saved = size_before - get_store_size(store)
+
+    interner_saved = store.intern_strings()
+    return {"shared_sets": nbr_shared, "bytes_saved": columns_saved + interner_saved}
+
+
+def intern_simulation(simulation) -> dict:
+    """_summary_
+    Runs the interning pass on the static network and on the parameter sets of the simulation.
+    The serialized files are left unchanged by this pass.
+
+    Returns:
+        dict : The report of every part and the total number of bytes saved.
+    """
+    report = {}
+    if simulation.static_network is not None:
+        report["static_network"] = intern_network(simulation.static_network)
+    if isinstance(simulation.parameter_sets, DynawoParameterStore):
+        report["parameter_sets"] = deduplicate_parameter_sets(simulation.parameter_sets)
+    report["bytes_saved"] = sum(part["bytes_saved"] for part in report.values())
+    return report
@@ -0,0 +1,62 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from cycosim.utils import dump_object, load_object
+
+from cycosim.services.input_files.global_parser import DynawoGlobalParser
+from cycosim.services.input_files.parse_cache import ParseCache
+
+
+def parse_dynawo_file(
+    file: str, streaming: bool = False, cache: ParseCache = None, compact: bool = False, with_key: bool = False
+):
+    """_summary_
+    Parses the given Dynawo file and returns the parsed object, along with the key of the parsed file
+    if 'with_key' is True. The key is the one computed to look the file up in the cache, if any.
+    """
+    global_parser = DynawoGlobalParser(file, streaming, cache, compact)
+    parsed_obj = global_parser.parse()
+    if with_key:
+        return parsed_obj, global_parser.get_cache_key()
+    return parsed_obj
+
+
+def parse_dynawo_file_pickled(*args) -> bytes:
+    """_summary_
+    Parses the given Dynawo file in a worker process and returns the result of parse_dynawo_file pickled.
+    The object is pickled here rather than by the pool so that the main process can
+    load it with load_object, which is much faster on large networks.
+    """
+    return dump_object(parse_dynawo_file(*args))
+
+
+def parse_dynawo_files(
+    files: list,
+    streaming: bool = False,
+    cache: ParseCache = None,
+    parallel: bool = True,
+    compact: bool = False,
+    with_keys: bool = False,
+) -> list:
+    """_summary_
+    Parses the given Dynawo files, at the same time in a pool of processes if 'parallel' is True.
+    The exceptions raised while parsing a file are raised again in the calling process.
+
+    Args:
+        files (list): The paths of the files to parse.
+        streaming (bool): Whether the IIDM file is parsed as a stream of xml events.
+        cache (ParseCache): The cache of the parsed files, None to always parse the files.
+        parallel (bool): Whether the files are parsed in parallel.
+        compact (bool): Whether the IIDM file is parsed into the slotted Compact components.
+        with_keys (bool): Whether the key of every parsed file is returned along with its object.
+
+    Returns:
+        list : The parsed objects, or the (parsed object, key) pairs, in the order of the given files.
+    """
+    if not parallel or len(files) < 2:
+        return [parse_dynawo_file(file, streaming, cache, compact, with_keys) for file in files]
+
+    with ProcessPoolExecutor(max_workers=len(files)) as pool:
+        futures = [
+            pool.submit(parse_dynawo_file_pickled, file, streaming, cache, compact, with_keys) for file in files
+        ]
+        return [load_object(future.result()) for future in futures]
@@ -0,0 +1,159 @@
+import os
+import hashlib
+import tempfile
+
+from cycosim.utils import dump_object, load_object, hash_file
+
+DEFAULT_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "cycosim")
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+
+CACHE_EXTENSION = ".pkl"
+
+
+def get_parse_key(file: str, parser, *options) -> str:
+    """_summary_
+    Returns the key of the object parsed from the given file : the hash of the content of the file
+    followed by the hash of the class, the version and the options of the parser.
+
+    Args:
+        file (str): The parsed file
+        parser: The parser used, its class and version are part of the key
+        options: The options of the parser that change the parsed object
+    """
+    parser_info = [type(parser).__name__, str(getattr(parser, "version", 0))] + [str(opt) for opt in options]
+    return f"{hash_file(file)}-{hashlib.sha256('|'.join(parser_info).encode()).hexdigest()[:16]}"
+
+
+class ParseCache:
+    """_summary_
+    On-disk cache of the objects returned by the parsers. An entry is keyed by the hash of the
+    content of the parsed file, the parser used, its version and its options, so it is reused
+    whatever the name or the location of the file. The 'version' class attribute of a parser must
+    be increased every time the objects it returns change, which invalidates its cached entries.
+
+    The objects are stored with pickle. When the size of the cache exceeds 'max_size', the least
+    recently used entries are removed.
+
+    Attributes:
+        cache_directory (str) : The folder where the entries are stored.
+        max_size (int) : The maximum size of the cache, in bytes.
+        hits (int) : The number of parsed objects loaded from the cache.
+        misses (int) : The number of parsed objects that were not in the cache.
+    """
+
+    def __init__(self, _cache_directory: str = DEFAULT_CACHE_DIRECTORY, _max_size: int = DEFAULT_MAX_SIZE):
+        self.cache_directory = _cache_directory
+        self.max_size = _max_size
+        self.hits = 0
+        self.misses = 0
+
+    def get_key(self, file: str, parser, *options) -> str:
+        """_summary_
+        Returns the key of the entry holding the object parsed from the given file.
+        """
+        return get_parse_key(file, parser, *options)
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.cache_directory, key + CACHE_EXTENSION)
+
+    def load(self, key: str):
+        """_summary_
+        Returns the object stored under the given key, None if there is no such entry.
+        """
+        path = self.get_path(key)
+        try:
+            with open(path, "rb") as in_file:
+                data = in_file.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        try:
+            obj = load_object(data)
+        except Exception:
+            # A corrupted entry is dropped and the file will be parsed again
+            os.remove(path)
+            self.misses += 1
+            return None
+
+        # The modification time is used to find the least recently used entries
+        os.utime(path)
+        self.hits += 1
+        return obj
+
+    def store(self, key: str, obj) -> None:
+        """_summary_
+        Stores the object under the given key. The entry is written in a temporary file first,
+        so a concurrent run never reads an incomplete entry.
+        """
+        os.makedirs(self.cache_directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out_file:
+                out_file.write(dump_object(obj))
+            os.replace(tmp_path, self.get_path(key))
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+        self.evict()
+
+    def get_entries(self) -> list:
+        """_summary_
+        Returns the (last use time, size, path) of every entry, from the least to the most recently used.
+        """
+        if not os.path.isdir(self.cache_directory):
+            return []
+
+        entries = []
+        for entry in os.scandir(self.cache_directory):
+            if entry.name.endswith(CACHE_EXTENSION):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        return entries
+
+    def get_size(self) -> int:
+        return sum(size for _, size, _ in self.get_entries())
+
+    def evict(self) -> None:
+        """_summary_
+        Removes the least recently used entries until the size of the cache is below max_size.
+        """
+        entries = self.get_entries()
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+    def clear(self) -> None:
+        """_summary_
+        Removes every entry of the cache.
+        """
+        for _, _, path in self.get_entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def parse(self, parser, file: str, *options):
+        """_summary_
+        Returns the object parsed from the given file by the given parser, loaded from the cache
+        if it has already been parsed, parsed and stored in the cache otherwise.
+        """
+        return self.parse_key(self.get_key(file, parser, *options), parser)
+
+    def parse_key(self, key: str, parser):
+        """_summary_
+        Same as parse, for a file whose key is already known.
+        """
+        obj = self.load(key)
+        if obj is None:
+            obj = parser.parse()
+            self.store(key, obj)
+        return obj
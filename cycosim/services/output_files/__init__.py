@@ -1 +1,8 @@
-from .global_serializer import GlobalSerializer  # noqa
+from cycosim.utils.lazy_loading import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "GlobalSerializer": ".global_serializer",
+    },
+)
@@ -1,37 +1,25 @@
-from cycosim.domain.ports import Serializer, ObjectToSerialize, FileType
+from cycosim.domain.ports import Serializer, ObjectToSerialize
 
-from cycosim.adapters.serializers.dynawo import (
-    DynawoSerializerIIDM,
-    DynawoSerializerJOBS,
-    DynawoSerializerDYD,
-    DynawoSerializerPAR,
-)
-
-from cycosim.adapters.parsers import UnknownFileFormatError
+from cycosim.adapters.parsers.exceptions import UnknownFileFormatError
+from cycosim.adapters.registry import serializers
 
 
 class GlobalSerializer(Serializer):
+    """
+    Summary :
+        Serializes an object with the serializer registered for the target file type in the
+        'serializers' registry, which is only imported when first used.
+    """
+
     def __init__(self, _object_to_serialize: ObjectToSerialize):
         super().__init__(_object_to_serialize)
 
     def serialize(self):
-        serializer = None
-
-        if self.object_to_serialize.target_file_type == FileType.IIDM:
-            serializer = DynawoSerializerIIDM(self.object_to_serialize)
-
-        elif self.object_to_serialize.target_file_type == FileType.JOBS:
-            serializer = DynawoSerializerJOBS(self.object_to_serialize)
-
-        elif self.object_to_serialize.target_file_type == FileType.DYD:
-            serializer = DynawoSerializerDYD(self.object_to_serialize)
-
-        elif self.object_to_serialize.target_file_type == FileType.PAR:
-            serializer = DynawoSerializerPAR(self.object_to_serialize)
-
-        else:
-            raise UnknownFileFormatError(
-                f"Unknown targeted output file type '{self.object_to_serialize.target_file_type}'."
-            )
+        target_file_type = self.object_to_serialize.target_file_type
+        if target_file_type not in serializers:
+            raise UnknownFileFormatError(f"Unknown targeted output file type '{target_file_type}'.")
 
+        serializer = serializers.get(target_file_type)(
+            self.object_to_serialize.output_path, self.object_to_serialize.object_to_serialize
+        )
         serializer.serialize()
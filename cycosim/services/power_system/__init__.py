@@ -1 +1,27 @@
-from .dynawo_simulation import DynawoSimulation  # noqa
+from cycosim.utils.lazy_loading import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "NetworkTables": ".network_tables",
+        "ComponentTable": ".network_tables",
+        "FingerprintNode": ".fingerprint",
+        "ElementFingerprints": ".fingerprint",
+        "fingerprint_network": ".fingerprint",
+        "fingerprint_dynamic_model": ".fingerprint",
+        "fingerprint_parameter_store": ".fingerprint",
+        "DiffReport": ".diff",
+        "diff_paths": ".diff",
+        "Contingency": ".contingencies",
+        "build_contingencies": ".contingencies",
+        "write_contingencies": ".contingencies",
+        "generate_contingencies": ".contingencies",
+        "Topology": ".topology",
+        "BusReduction": ".bus_reduction",
+        "AdmittanceMatrix": ".admittance",
+        "DCPowerFlow": ".dc_power_flow",
+        "DCScreeningReport": ".dc_power_flow",
+        "Sensitivities": ".sensitivities",
+        "OutageRanking": ".sensitivities",
+    },
+)
@@ -0,0 +1,252 @@
+import numpy as np
+import scipy.sparse as sp
+
+from cycosim.domain.models.power_system import BaseComponent
+
+from cycosim.services.input_files.global_parser import DynawoGlobalParser
+from cycosim.services.input_files.parse_cache import ParseCache
+from cycosim.services.power_system.network_tables import NetworkTables
+from cycosim.services.power_system.bus_reduction import BusReduction
+from cycosim.services.power_system.fingerprint import FINGERPRINT_VERSION, fingerprint_network
+from cycosim.services.power_system.diff import fingerprint_file
+
+# The base power of the per-unit system, in MVA
+S_BASE = 100.0
+
+# The tables of the branches of the admittance matrix, in the order of their branch kind code
+ADMITTANCE_BRANCH_FLAGS = ("line", "twoWindingsTransformer")
+
+# Must be increased every time the cached AdmittanceMatrix objects change
+ADMITTANCE_VERSION = 1
+
+
+def get_column(table, attribute: str) -> np.ndarray:
+    """_summary_
+    Returns the values of the column, the missing values being 0.
+    """
+    return np.nan_to_num(table[attribute])
+
+
+def get_transformer_ratios(tables: NetworkTables) -> np.ndarray:
+    """_summary_
+    Returns the ratio ratedU2 / ratedU1 of every transformer, the ratio of the nominal voltages of
+    its buses when its rated voltages are missing.
+    """
+    table = tables.transformers
+    ratio = table["rated_voltage_2"] / table["rated_voltage_1"]
+    nominal_ratio = tables.nominal_V[table["bus_2"]] / tables.nominal_V[table["bus_1"]]
+    return np.where(np.isnan(ratio), nominal_ratio, ratio)
+
+
+def get_branch_admittances(tables: NetworkTables, flag_name: str) -> tuple:
+    """_summary_
+    Returns the (y_11, y_12, y_21, y_22) admittances in Siemens of every branch of the table, the
+    currents injected at both ends being I_1 = y_11 V_1 + y_12 V_2 and I_2 = y_21 V_1 + y_22 V_2.
+
+    The lines are pi models with a shunt admittance at each end. The transformers follow the IIDM
+    convention : an ideal transformer of ratio ratedU2 / ratedU1 on side 1, then the series
+    impedance and the magnetizing admittance expressed on side 2. The tap changers are ignored.
+    """
+    table = tables.tables[flag_name]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y_series = 1.0 / (get_column(table, "resistance") + 1j * get_column(table, "reactance"))
+
+    if flag_name == "line":
+        y_1 = get_column(table, "half_shunt_conductance") + 1j * get_column(table, "half_shunt_susceptance")
+        y_2 = get_column(table, "half_shunt_conductance_2") + 1j * get_column(table, "half_shunt_susceptance_2")
+        return y_series + y_1, -y_series, -y_series, y_series + y_2
+
+    y_magnetizing = get_column(table, "magnetizing_conductance") + 1j * get_column(table, "magnetizing_susceptance")
+    ratio = get_transformer_ratios(tables)
+    return ratio**2 * (y_series + y_magnetizing), -ratio * y_series, -ratio * y_series, y_series
+
+
+class AdmittanceMatrix:
+    """_summary_
+    Bus admittance matrix (Ybus) of the static network, in per-unit, over the reduced buses of the
+    BusReduction : the buses joined by closed switches are a single node of the matrix. The branches
+    are the lines and the transformers connected on both sides, the shunts are added to the diagonal.
+
+    An admittance in Siemens between the buses i and j is converted to per-unit by multiplying it by
+    nominal_V[i] * nominal_V[j] / s_base, which handles the branches between different voltage levels.
+    The matrix is assembled in one pass from COO triplets, every branch and every bus having its
+    entries in the structure even when it is out of service, so switching a branch only changes four
+    values of 'matrix.data' in place (a rank-one update of the matrix).
+
+    Attributes:
+        s_base (float) : The base power, in MVA.
+        nbr_buses (int) : The number of reduced buses, the size of the matrix.
+        bus_ids (list) : The id of every reduced bus.
+        reduced_buses (np.ndarray) : The reduced bus of every original bus.
+        branch_kinds (np.ndarray) : The index of the flag of every branch in ADMITTANCE_BRANCH_FLAGS.
+        branch_rows (np.ndarray) : The row of every branch in the table of its flag.
+        branch_buses_1 (np.ndarray) : The first reduced bus of every branch.
+        branch_buses_2 (np.ndarray) : The second reduced bus of every branch.
+        branch_admittances (np.ndarray) : The (y_11, y_12, y_21, y_22) of every branch, in per-unit.
+        has_impedance (np.ndarray) : Whether every branch has a non-zero impedance, those without are left out.
+        in_service (np.ndarray) : Whether every branch is counted in the matrix.
+        positions (np.ndarray) : The positions in 'matrix.data' of the four entries of every branch.
+        matrix (sp.csr_matrix) : The complex admittance matrix.
+    """
+
+    def __init__(self, _tables: NetworkTables, _s_base: float = S_BASE, _reduction: BusReduction = None):
+        self.s_base = _s_base
+        reduction = _reduction if _reduction is not None else BusReduction(_tables)
+        self.nbr_buses = reduction.nbr_reduced_buses
+        self.bus_ids = reduction.get_reduced_ids()
+        self.reduced_buses = reduction.reduced_buses.copy()
+
+        nominal_V = _tables.nominal_V
+        kinds, rows, buses_1, buses_2, admittances = [], [], [], [], []
+        for kind, flag_name in enumerate(ADMITTANCE_BRANCH_FLAGS):
+            table = _tables.tables[flag_name]
+            branch_rows = np.flatnonzero((table["bus_1"] >= 0) & (table["bus_2"] >= 0)).astype(np.int32)
+            y_11, y_12, y_21, y_22 = (y[branch_rows] for y in get_branch_admittances(_tables, flag_name))
+
+            bus_1, bus_2 = table["bus_1"][branch_rows], table["bus_2"][branch_rows]
+            V_1, V_2 = nominal_V[bus_1], nominal_V[bus_2]
+            admittances.append(
+                np.stack([y_11 * V_1 * V_1, y_12 * V_1 * V_2, y_21 * V_2 * V_1, y_22 * V_2 * V_2], axis=1) / _s_base
+            )
+            kinds.append(np.full(len(branch_rows), kind, dtype=np.int8))
+            rows.append(branch_rows)
+            buses_1.append(reduction.reduced_buses[bus_1])
+            buses_2.append(reduction.reduced_buses[bus_2])
+
+        self.branch_kinds = np.concatenate(kinds)
+        self.branch_rows = np.concatenate(rows)
+        self.branch_buses_1 = np.concatenate(buses_1)
+        self.branch_buses_2 = np.concatenate(buses_2)
+        self.branch_admittances = np.concatenate(admittances)
+
+        # A branch without impedance cannot be in the matrix, it should be a switch
+        self.has_impedance = np.isfinite(self.branch_admittances).all(axis=1)
+        if not self.has_impedance.all():
+            print(f"Error : {int((~self.has_impedance).sum())} branches without impedance are left out of the matrix")
+        self.branch_admittances[~self.has_impedance] = 0.0
+        self.in_service = self.has_impedance.copy()
+
+        self.build(_tables)
+
+    @classmethod
+    def from_network(cls, network: BaseComponent, s_base: float = S_BASE, cache: ParseCache = None):
+        """_summary_
+        Returns the admittance matrix of the network. With a cache, the matrix is stored under the
+        Merkle fingerprint of the network, so it is found back for any network holding the same
+        components, whether it has been built in memory or read from any file.
+        """
+        if cache is None:
+            return cls(NetworkTables(network), s_base)
+        return cls.from_digest(fingerprint_network(network).digest.hex(), network, s_base, cache)
+
+    @classmethod
+    def from_digest(cls, digest: str, network, s_base: float, cache: ParseCache):
+        """_summary_
+        Returns the matrix cached under the given fingerprint digest, built from the network and
+        stored if there is none. The network can be a function returning it, only called then.
+        """
+        key = f"ybus-{ADMITTANCE_VERSION}-{s_base!r}-{digest}"
+        admittance = cache.load(key)
+        if admittance is None:
+            admittance = cls(NetworkTables(network() if callable(network) else network), s_base)
+            cache.store(key, admittance)
+        return admittance
+
+    @classmethod
+    def from_file(cls, iidm_file: str, s_base: float = S_BASE, cache: ParseCache = None):
+        """_summary_
+        Returns the admittance matrix of the network of the IIDM file. With a cache, the fingerprint
+        digest of the network is stored next to the parsed file, so that an unchanged file is neither
+        parsed nor fingerprinted again before the matrix is loaded.
+        """
+        global_parser = DynawoGlobalParser(iidm_file, _cache=cache, _compact=True)
+        if cache is None:
+            return cls.from_network(global_parser.parse(), s_base)
+
+        digest_key = f"{global_parser.get_cache_key()}-digest-{FINGERPRINT_VERSION}"
+        digest = cache.load(digest_key)
+        network = None
+        if digest is None:
+            fingerprints = fingerprint_file(iidm_file, cache)[1]
+            digest, network = fingerprints.digest.hex(), fingerprints.component
+            cache.store(digest_key, digest)
+        return cls.from_digest(digest, network or global_parser.parse, s_base, cache)
+
+    def __len__(self):
+        return len(self.branch_rows)
+
+    def get_branch_entries(self) -> tuple:
+        """_summary_
+        Returns the (rows, columns) of the four entries of every branch, as arrays of shape (nbr_branches, 4).
+        """
+        buses_1, buses_2 = self.branch_buses_1[:, None], self.branch_buses_2[:, None]
+        return (
+            np.hstack([buses_1, buses_1, buses_2, buses_2]),
+            np.hstack([buses_1, buses_2, buses_1, buses_2]),
+        )
+
+    def get_shunt_admittances(self, tables: NetworkTables) -> tuple:
+        """_summary_
+        Returns the reduced buses and the per-unit admittances of the connected shunts.
+        """
+        shunts = tables.shunts
+        rows = np.flatnonzero(shunts["bus"] >= 0)
+        bus_rows = shunts["bus"][rows]
+        susceptance = get_column(shunts, "susceptance_per_section")[rows] * get_column(shunts, "section_count")[rows]
+        return self.reduced_buses[bus_rows], 1j * susceptance * tables.nominal_V[bus_rows] ** 2 / self.s_base
+
+    def build(self, tables: NetworkTables):
+        """_summary_
+        Assembles the matrix from the COO triplets of the branches, the shunts and a zero diagonal, so
+        that every bus has a diagonal entry. The duplicated entries are summed by the conversion to CSR.
+        """
+        entry_rows, entry_cols = self.get_branch_entries()
+        shunt_buses, shunt_admittances = self.get_shunt_admittances(tables)
+        diagonal = np.arange(self.nbr_buses)
+
+        rows = np.concatenate([entry_rows.ravel(), shunt_buses, diagonal])
+        cols = np.concatenate([entry_cols.ravel(), shunt_buses, diagonal])
+        values = np.concatenate([self.branch_admittances.ravel(), shunt_admittances, np.zeros(self.nbr_buses)])
+        self.matrix = sp.coo_matrix((values, (rows, cols)), shape=(self.nbr_buses, self.nbr_buses)).tocsr()
+        self.matrix.sum_duplicates()
+        self.matrix.sort_indices()
+
+        # The CSR entries being sorted by row then column, their positions are found by a binary search
+        entry_keys = np.repeat(np.arange(self.nbr_buses, dtype=np.int64), np.diff(self.matrix.indptr))
+        entry_keys = entry_keys * self.nbr_buses + self.matrix.indices
+        self.positions = np.searchsorted(entry_keys, entry_rows.astype(np.int64) * self.nbr_buses + entry_cols)
+
+    def get_branch(self, flag_name: str, row: int) -> int:
+        """_summary_
+        Returns the index of the branch of the given table row, None if it is not in the matrix.
+        """
+        kind = ADMITTANCE_BRANCH_FLAGS.index(flag_name)
+        branches = np.flatnonzero((self.branch_kinds == kind) & (self.branch_rows == row))
+        return int(branches[0]) if len(branches) else None
+
+    def set_branch_status(self, branch: int, in_service: bool) -> bool:
+        """_summary_
+        Adds or removes the branch from the matrix by updating its four entries in place.
+        Returns whether the matrix changed.
+        """
+        if self.in_service[branch] == in_service or not self.has_impedance[branch]:
+            return False
+        sign = 1.0 if in_service else -1.0
+        np.add.at(self.matrix.data, self.positions[branch], sign * self.branch_admittances[branch])
+        self.in_service[branch] = in_service
+        return True
+
+    def get_update(self, branches: np.ndarray) -> tuple:
+        """_summary_
+        Returns the low-rank form U @ C @ U.T of the change of the matrix when the given branches in
+        service are removed : U is the (nbr_buses, 2 * nbr_branches) sparse incidence of their ends and
+        C the block diagonal matrix of their negated 2x2 admittances.
+        """
+        branches = np.asarray(branches)
+        nbr_branches = len(branches)
+        ends = np.stack([self.branch_buses_1[branches], self.branch_buses_2[branches]], axis=1).ravel()
+        incidence = sp.csr_matrix(
+            (np.ones(2 * nbr_branches), (ends, np.arange(2 * nbr_branches))), shape=(self.nbr_buses, 2 * nbr_branches)
+        )
+        blocks = -self.branch_admittances[branches].reshape(nbr_branches, 2, 2)
+        return incidence, sp.block_diag(list(blocks), format="csr")
@@ -0,0 +1,179 @@
+import numpy as np
+
+from cycosim.domain.models.power_system import BaseComponent
+from cycosim.utils.union_find import union_edges, get_labels
+
+from cycosim.services.power_system.network_tables import NetworkTables
+
+# The tables of the branches kept in the reduced network
+REDUCED_BRANCH_FLAGS = ("line", "twoWindingsTransformer")
+
+
+def get_csr(nbr_rows: int, rows: np.ndarray, values: np.ndarray) -> tuple:
+    """_summary_
+    Returns the (indptr, values) CSR arrays grouping the values by row.
+    """
+    order = np.argsort(rows, kind="stable")
+    indptr = np.zeros(nbr_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=nbr_rows), out=indptr[1:])
+    return indptr, values[order]
+
+
+class BusReduction:
+    """_summary_
+    Bus-branch view of the network, where the buses joined by closed switches are merged in a
+    single reduced bus. The switches are read from the NetworkTables, whose 'is_open' column is
+    kept up to date by open_switch and close_switch, which update the maps incrementally : only
+    the buses of the reduced buses joined or split by the switch are relabelled.
+
+    The reduced buses are numbered from 0 to nbr_reduced_buses - 1, every merge moving the last
+    reduced bus into the number freed, and every split adding the new reduced buses at the end.
+
+    Attributes:
+        tables (NetworkTables) : The tables of the network.
+        nbr_buses (int) : The number of buses of the original network.
+        reduced_buses (np.ndarray) : The reduced bus of every original bus.
+        members (list) : The sorted original buses of every reduced bus.
+        switch_indptr (np.ndarray) : The start of the switches of every bus in 'switch_rows', plus the end.
+        switch_rows (np.ndarray) : The switches connected to every bus, grouped by bus.
+    """
+
+    def __init__(self, _tables: NetworkTables):
+        self.tables = _tables
+        self.nbr_buses = len(_tables.buses)
+
+        switches = _tables.switches
+        connected = np.flatnonzero((switches["bus_1"] >= 0) & (switches["bus_2"] >= 0))
+        ends = np.concatenate([switches["bus_1"][connected], switches["bus_2"][connected]])
+        self.switch_indptr, self.switch_rows = get_csr(self.nbr_buses, ends, np.tile(connected, 2))
+
+        closed = connected[~switches["is_open"][connected]]
+        roots = union_edges(np.arange(self.nbr_buses), switches["bus_1"][closed], switches["bus_2"][closed])
+        nbr_reduced_buses, self.reduced_buses = get_labels(roots)
+
+        indptr, buses = get_csr(nbr_reduced_buses, self.reduced_buses, np.arange(self.nbr_buses, dtype=np.int32))
+        self.members = [buses[indptr[bus] : indptr[bus + 1]] for bus in range(nbr_reduced_buses)]
+
+    @classmethod
+    def from_network(cls, network: BaseComponent):
+        return cls(NetworkTables(network))
+
+    @property
+    def nbr_reduced_buses(self) -> int:
+        return len(self.members)
+
+    def get_inverse_map(self) -> tuple:
+        """_summary_
+        Returns the (indptr, original_buses) CSR arrays of the reduced buses : the original buses of
+        the reduced bus r are original_buses[indptr[r]:indptr[r + 1]].
+        """
+        indptr = np.zeros(self.nbr_reduced_buses + 1, dtype=np.int64)
+        np.cumsum([len(buses) for buses in self.members], out=indptr[1:])
+        original_buses = np.concatenate(self.members) if self.members else np.zeros(0, dtype=np.int32)
+        return indptr, original_buses
+
+    def reduce(self, bus_rows: np.ndarray) -> np.ndarray:
+        """_summary_
+        Returns the reduced bus of every given original bus, -1 being kept for the missing buses.
+        """
+        return np.where(bus_rows >= 0, self.reduced_buses[np.maximum(bus_rows, 0)], -1).astype(np.int32)
+
+    def get_reduced_ids(self) -> list:
+        """_summary_
+        Returns the id of every reduced bus, the id of its first original bus.
+        """
+        bus_ids = self.tables.buses.ids
+        return [bus_ids[buses[0]] for buses in self.members]
+
+    def get_reduced_nominal_V(self) -> np.ndarray:
+        return self.tables.nominal_V[[buses[0] for buses in self.members]]
+
+    def get_branches(self) -> dict:
+        """_summary_
+        Returns, for the lines and the transformers, the rows of the branches connected on both
+        sides and their two reduced buses. The branches whose two sides are merged in the same
+        reduced bus are left out.
+        """
+        branches = {}
+        for flag_name in REDUCED_BRANCH_FLAGS:
+            table = self.tables.tables[flag_name]
+            buses_1, buses_2 = self.reduce(table["bus_1"]), self.reduce(table["bus_2"])
+            rows = np.flatnonzero((buses_1 >= 0) & (buses_2 >= 0) & (buses_1 != buses_2)).astype(np.int32)
+            branches[flag_name] = (rows, buses_1[rows], buses_2[rows])
+        return branches
+
+    def get_switch_buses(self, switch_row: int) -> tuple:
+        switches = self.tables.switches
+        return int(switches["bus_1"][switch_row]), int(switches["bus_2"][switch_row])
+
+    def close_switch(self, switch_row: int) -> list:
+        """_summary_
+        Closes the switch and merges the reduced buses of its two sides, the smaller one into the
+        larger one. Returns the reduced buses whose original buses changed.
+        """
+        self.tables.switches["is_open"][switch_row] = False
+        bus_1, bus_2 = self.get_switch_buses(switch_row)
+        if bus_1 < 0 or bus_2 < 0:
+            return []
+
+        kept, removed = int(self.reduced_buses[bus_1]), int(self.reduced_buses[bus_2])
+        if kept == removed:
+            return []
+        if len(self.members[kept]) < len(self.members[removed]):
+            kept, removed = removed, kept
+
+        self.reduced_buses[self.members[removed]] = kept
+        self.members[kept] = np.union1d(self.members[kept], self.members[removed]).astype(np.int32)
+
+        # The last reduced bus takes the number freed by the merge
+        last = self.nbr_reduced_buses - 1
+        if removed == last:
+            self.members.pop()
+            return [kept]
+        self.members[removed] = self.members.pop()
+        self.reduced_buses[self.members[removed]] = removed
+        return [removed] if kept == last else [kept, removed]
+
+    def open_switch(self, switch_row: int) -> list:
+        """_summary_
+        Opens the switch and splits its reduced bus if its sides are not joined by other closed
+        switches anymore. The union-find runs again on the closed switches of this reduced bus only.
+        Returns the reduced buses whose original buses changed.
+        """
+        switches = self.tables.switches
+        switches["is_open"][switch_row] = True
+        bus_1, bus_2 = self.get_switch_buses(switch_row)
+        if bus_1 < 0 or bus_2 < 0:
+            return []
+
+        reduced_bus = int(self.reduced_buses[bus_1])
+        buses = self.members[reduced_bus]
+        if len(buses) < 2:
+            return []
+
+        rows = np.unique(
+            np.concatenate([self.switch_rows[self.switch_indptr[bus] : self.switch_indptr[bus + 1]] for bus in buses])
+        )
+        rows = rows[~switches["is_open"][rows]]
+        # The buses of the reduced bus are sorted, so searchsorted gives their local index
+        roots = union_edges(
+            np.arange(len(buses)),
+            np.searchsorted(buses, switches["bus_1"][rows]),
+            np.searchsorted(buses, switches["bus_2"][rows]),
+        )
+        nbr_parts, labels = get_labels(roots)
+        if nbr_parts == 1:
+            return []
+
+        changed = [reduced_bus]
+        self.members[reduced_bus] = buses[labels == 0]
+        for part in range(1, nbr_parts):
+            self.members.append(buses[labels == part])
+            self.reduced_buses[self.members[-1]] = self.nbr_reduced_buses - 1
+            changed.append(self.nbr_reduced_buses - 1)
+        return changed
+
+    def set_switch(self, switch_row: int, is_open: bool) -> list:
+        if is_open:
+            return self.open_switch(switch_row)
+        return self.close_switch(switch_row)
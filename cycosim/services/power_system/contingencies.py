@@ -0,0 +1,405 @@
+"""
+Generator of the N-1 contingencies of a Dynawo case: one JOBS directory per outage of a line, a
+transformer, a generator or a breaker, the event being added to the base case at the chosen time.
+
+    python -m cycosim contingencies case_folder output_folder --time 10 --workers 4
+"""
+import os
+import re
+import copy
+import time
+import shutil
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from cycosim.domain.models.power_system import BaseComponent, DynamicModel, DynamicComponent, Connection
+from cycosim.domain.ports.files import FileType
+from cycosim.adapters.simulations.dynawo_simulation import DynawoSimulationParameters
+from cycosim.adapters.simulations.dynawo_elements import DynawoParameterStore
+from cycosim.adapters.serializers.dynawo.iidm_serializer import get_iidm_attributes
+from cycosim.adapters.serializers.dynawo.jobs_serializer import DynawoSerializerJOBS
+from cycosim.adapters.serializers.dynawo.dyd_serializer import DynawoSerializerDYD
+from cycosim.adapters.serializers.dynawo.par_serializer import DynawoSerializerPAR
+
+from cycosim.services.input_files.global_parser import DynawoGlobalParser
+
+# The files written in every contingency directory, next to the links to the base files
+EVENT_DYD_FILE = "contingency.dyd"
+EVENT_PAR_FILE = "contingency.par"
+EVENT_MODEL_ID = "CONTINGENCY"
+BASE_DIRECTORY = "base"
+
+# The id of the network model in the DYD files
+NETWORK_MODEL_ID = "NETWORK"
+
+# The kinds of contingency, with the flag of the IIDM components they disconnect
+CONTINGENCY_FLAGS = {
+    "line": "line",
+    "transformer": "twoWindingsTransformer",
+    "generator": "generator",
+    "switch": "switch",
+}
+DEFAULT_KINDS = ("line", "generator")
+
+LINK_MODES = ("hardlink", "symlink", "copy")
+
+
+class Contingency:
+    """_summary_
+    The outage of a single element of the network, as the event model added to the base case.
+
+    Attributes:
+        id (str) : The id of the contingency, also the name of its directory and of its parameter set.
+        kind (str) : The kind of the disconnected element ('line', 'transformer', 'generator' or 'switch').
+        element_id (str) : The id of the disconnected element in the IIDM file.
+        library (str) : The Dynawo library of the event model.
+        connections (list) : The (event variable, model id, model variable) connections of the event model.
+        parameters (list) : The (name, type, value) parameters of the event model.
+    """
+
+    __slots__ = ("id", "kind", "element_id", "library", "connections", "parameters")
+
+    def __init__(self, _kind: str, _element_id: str, _library: str, _connections: list, _parameters: list):
+        self.id = re.sub(r"[^A-Za-z0-9_.-]", "_", f"{_kind}_{_element_id}")
+        self.kind = _kind
+        self.element_id = _element_id
+        self.library = _library
+        self.connections = _connections
+        self.parameters = _parameters
+
+
+def is_connected(attributes: dict) -> bool:
+    """_summary_
+    Returns False if the element is disconnected in a bus-breaker topology, one of its sides
+    having a connectable bus but no bus. The elements of a node-breaker topology are kept.
+    """
+    for side in ("", "1", "2"):
+        if f"connectableBus{side}" in attributes and f"bus{side}" not in attributes:
+            return False
+    return True
+
+
+def get_disconnection(kind: str, cpnt: BaseComponent, dynamic_model: DynamicModel, event_time: str) -> Contingency:
+    """_summary_
+    Returns the event disconnecting the component at the given time, None if the component is
+    already disconnected. The branches are opened on both sides, the generators having a dynamic
+    model are switched off through it, and the other generators and the breakers are disconnected
+    in the network model.
+    """
+    attributes = {key: str(val) for key, val in get_iidm_attributes(cpnt)}
+    if not is_connected(attributes):
+        return None
+
+    time_parameter = ("event_tEvent", "DOUBLE", event_time)
+    if kind in ("line", "transformer"):
+        return Contingency(
+            kind,
+            cpnt.id,
+            "EventQuadripoleDisconnection",
+            [("event_state1_value", NETWORK_MODEL_ID, f"{cpnt.id}_state_value")],
+            [
+                time_parameter,
+                ("event_disconnectOrigin", "BOOL", "true"),
+                ("event_disconnectExtremity", "BOOL", "true"),
+            ],
+        )
+
+    if kind == "switch" and (attributes.get("open") == "true" or attributes.get("kind", "BREAKER") != "BREAKER"):
+        return None
+
+    models = dynamic_model.get_black_box_models_by_static_id(cpnt.id) if kind == "generator" else None
+    if models:
+        return Contingency(
+            kind,
+            cpnt.id,
+            "EventSetPointBoolean",
+            [("event_state1", model.id, "generator_switchOffSignal2") for model in models],
+            [time_parameter, ("event_stateEvent1", "BOOL", "true")],
+        )
+
+    return Contingency(
+        kind,
+        cpnt.id,
+        "EventConnectedStatus",
+        [("event_state1_value", NETWORK_MODEL_ID, f"{cpnt.id}_state_value")],
+        [time_parameter, ("event_open", "BOOL", "true")],
+    )
+
+
+def build_contingencies(
+    network: BaseComponent, dynamic_model: DynamicModel, event_time: float, kinds: tuple = DEFAULT_KINDS
+) -> list:
+    """_summary_
+    Returns the contingencies of every connected element of the given kinds, in the order of the network.
+    """
+    flags = {CONTINGENCY_FLAGS[kind]: kind for kind in kinds}
+    event_time = str(event_time)
+    contingencies = []
+    stack = [network]
+    while stack:
+        cpnt = stack.pop()
+        kind = flags.get(cpnt.flag_name)
+        if kind is not None and cpnt.id is not None:
+            contingency = get_disconnection(kind, cpnt, dynamic_model, event_time)
+            if contingency is not None:
+                contingencies.append(contingency)
+        stack.extend(reversed(cpnt.sub_components))
+    return contingencies
+
+
+def select_contingencies(network: BaseComponent, contingencies: list, top_k: int, threshold: float = 1.0) -> list:
+    """_summary_
+    Returns the top_k contingencies of lines, transformers and generators whose DC outage is the most
+    severe, ranked with the LODF and PTDF of the network, the most severe first. The contingencies of
+    switches are not ranked and are all kept after them.
+    """
+    from cycosim.services.power_system.sensitivities import Sensitivities
+
+    ranked_kinds = ("line", "transformer", "generator")
+    by_element = {(cont.kind, cont.element_id): cont for cont in contingencies if cont.kind in ranked_kinds}
+    kinds = tuple({kind for kind, _ in by_element})
+    element_ids = {element_id for _, element_id in by_element}
+
+    rankings = Sensitivities.from_network(network).get_top_outages(top_k, threshold, kinds, element_ids)
+    selected = [by_element[(ranking.kind, ranking.element_id)] for ranking in rankings]
+    return selected + [cont for cont in contingencies if cont.kind not in ranked_kinds]
+
+
+def get_base_files(simulation_parameters: DynawoSimulationParameters, dynamic_model: DynamicModel) -> list:
+    """_summary_
+    Returns the paths, relative to the case folder, of the files every contingency shares with
+    the base case: the IIDM, DYD, PAR and CRV files of the JOBS file and the PAR files of the models.
+    """
+    files = [
+        simulation_parameters.iidm_file,
+        simulation_parameters.dyd_file,
+        simulation_parameters.network_parameter_file,
+        simulation_parameters.solver_parameter_file,
+        simulation_parameters.crv_file,
+        *(simulation_parameters.additional_dyd_files or []),
+        *(model.parameter_file for model in dynamic_model.black_box_models),
+    ]
+    return [file for file in dict.fromkeys(files) if file is not None]
+
+
+def link_file(source: str, destination: str, link_mode: str):
+    """_summary_
+    Makes the destination path refer to the source file without copying it. The hard links
+    fall back to symbolic links where they are not supported, such as between two file systems.
+    The symbolic links are relative, so that the output folder can be moved.
+    """
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    if os.path.lexists(destination):
+        os.remove(destination)
+
+    if link_mode == "copy":
+        shutil.copyfile(source, destination)
+        return
+    if link_mode == "hardlink":
+        try:
+            os.link(source, destination)
+            return
+        except OSError:
+            pass
+    os.symlink(os.path.relpath(source, os.path.dirname(destination)), destination)
+
+
+def write_contingency(
+    output_dir: str,
+    simulation_parameters: DynawoSimulationParameters,
+    contingency: Contingency,
+    base_files: list,
+    link_mode: str,
+):
+    """_summary_
+    Writes the JOBS directory of the contingency: its JOBS file, the DYD and PAR files of the
+    event, and the links to the base files. The JOBS file adds the DYD file of the event to
+    the ones of the base case.
+    """
+    case_dir = os.path.join(output_dir, contingency.id)
+    os.makedirs(case_dir, exist_ok=True)
+    for file in base_files:
+        link_file(os.path.join(output_dir, BASE_DIRECTORY, file), os.path.join(case_dir, file), link_mode)
+
+    event_model = DynamicModel()
+    event = DynamicComponent()
+    event.id = EVENT_MODEL_ID
+    event.library = contingency.library
+    event.parameter_file = EVENT_PAR_FILE
+    event.parameter_id = contingency.id
+    event_model.add_component(event)
+    for variable_1, model_id, variable_2 in contingency.connections:
+        connection = Connection()
+        connection.id_1 = EVENT_MODEL_ID
+        connection.variable_1 = variable_1
+        connection.id_2 = model_id
+        connection.variable_2 = variable_2
+        event_model.add_component(connection)
+    DynawoSerializerDYD(os.path.join(case_dir, EVENT_DYD_FILE), event_model).serialize()
+
+    parameter_sets = DynawoParameterStore()
+    row = parameter_sets.add_set(contingency.id)
+    for name, dynawo_type, value in contingency.parameters:
+        parameter_sets.add_parameter(row, name, dynawo_type, value)
+    DynawoSerializerPAR(os.path.join(case_dir, EVENT_PAR_FILE), parameter_sets).serialize()
+
+    jobs = copy.copy(simulation_parameters)
+    jobs.name = contingency.id
+    jobs.additional_dyd_files = [*(simulation_parameters.additional_dyd_files or []), EVENT_DYD_FILE]
+    DynawoSerializerJOBS(os.path.join(case_dir, f"{contingency.id}.{FileType.JOBS.value}"), jobs).serialize()
+
+
+def write_contingency_chunk(
+    output_dir: str,
+    simulation_parameters: DynawoSimulationParameters,
+    contingencies: list,
+    base_files: list,
+    link_mode: str,
+) -> int:
+    for contingency in contingencies:
+        write_contingency(output_dir, simulation_parameters, contingency, base_files, link_mode)
+    return len(contingencies)
+
+
+def write_contingencies(
+    case_dir: str,
+    output_dir: str,
+    simulation_parameters: DynawoSimulationParameters,
+    dynamic_model: DynamicModel,
+    contingencies: list,
+    link_mode: str = "hardlink",
+    workers: int = 1,
+) -> int:
+    """_summary_
+    Writes the JOBS directory of every contingency in the output folder. The base files are stored
+    once in its 'base' folder, linked from the case folder, and every contingency directory links to
+    them. With several workers, the contingencies are written by chunks from a pool of processes.
+
+    Returns:
+        int : The number of written contingencies.
+    """
+    if link_mode not in LINK_MODES:
+        raise ValueError(f"Unknown link mode '{link_mode}', the available modes are {list(LINK_MODES)}.")
+
+    base_files = []
+    for file in get_base_files(simulation_parameters, dynamic_model):
+        if os.path.isfile(os.path.join(case_dir, file)):
+            link_file(os.path.join(case_dir, file), os.path.join(output_dir, BASE_DIRECTORY, file), link_mode)
+            base_files.append(file)
+        else:
+            print(f"Error : The file '{file}' of the base case does not exist in '{case_dir}', it is not linked.")
+
+    if workers <= 1 or len(contingencies) < 2:
+        return write_contingency_chunk(output_dir, simulation_parameters, contingencies, base_files, link_mode)
+
+    # A few chunks per worker, so that the workers finishing first take the remaining ones
+    chunk_size = max(1, len(contingencies) // (workers * 4))
+    chunks = [contingencies[start : start + chunk_size] for start in range(0, len(contingencies), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(write_contingency_chunk, output_dir, simulation_parameters, chunk, base_files, link_mode)
+            for chunk in chunks
+        ]
+        return sum(future.result() for future in futures)
+
+
+def generate_contingencies(
+    case_dir: str,
+    output_dir: str,
+    event_time: float,
+    kinds: tuple = DEFAULT_KINDS,
+    link_mode: str = "hardlink",
+    workers: int = 1,
+    jobs_file: str = None,
+    top_k: int = None,
+    threshold: float = 1.0,
+) -> list:
+    """_summary_
+    Parses the base case given by the JOBS file of the case folder and writes its N-1 contingencies,
+    only the top_k most severe ones in DC if top_k is given.
+
+    Returns:
+        list : The written contingencies.
+    """
+    if jobs_file is None:
+        jobs_files = sorted(file for file in os.listdir(case_dir) if file.endswith(f".{FileType.JOBS.value}"))
+        if not jobs_files:
+            raise FileNotFoundError(f"No JOBS file in the directory '{case_dir}'.")
+        jobs_file = jobs_files[0]
+
+    simulation_parameters = DynawoGlobalParser(os.path.join(case_dir, jobs_file)).parse()
+    network = DynawoGlobalParser(os.path.join(case_dir, simulation_parameters.iidm_file), _compact=True).parse()
+    dynamic_model = DynawoGlobalParser(os.path.join(case_dir, simulation_parameters.dyd_file)).parse()
+
+    contingencies = build_contingencies(network, dynamic_model, event_time, kinds)
+    if top_k is not None:
+        contingencies = select_contingencies(network, contingencies, top_k, threshold)
+    write_contingencies(case_dir, output_dir, simulation_parameters, dynamic_model, contingencies, link_mode, workers)
+    return contingencies
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(
+        prog="cycosim contingencies",
+        description="Writes one JOBS directory per N-1 contingency of a Dynawo case, the files of the base case "
+        "being stored once and linked from every directory.",
+    )
+    parser.add_argument("case", help="The folder of the base case.")
+    parser.add_argument("output", help="The folder where the contingencies are written.")
+    parser.add_argument("--time", help="The time of the disconnection events, in seconds.", type=float, required=True)
+    parser.add_argument(
+        "--jobs", help="The JOBS file of the base case. If not specified, the first .jobs file is used."
+    )
+    parser.add_argument(
+        "--kinds",
+        help="The kinds of element disconnected by the contingencies.",
+        nargs="+",
+        choices=list(CONTINGENCY_FLAGS),
+        default=list(DEFAULT_KINDS),
+    )
+    parser.add_argument(
+        "--link",
+        help="How the contingency directories refer to the base files.",
+        choices=LINK_MODES,
+        default="hardlink",
+    )
+    parser.add_argument(
+        "--workers", help="The number of processes writing the contingencies.", type=int, default=os.cpu_count() or 1
+    )
+    parser.add_argument(
+        "--top",
+        help="Only write the given number of contingencies, the most severe ones ranked by a DC power flow "
+        "and its LODF and PTDF sensitivities. The switch contingencies are not ranked and always written.",
+        type=int,
+    )
+    parser.add_argument(
+        "--threshold", help="The loading above which a branch counts in the severity.", type=float, default=1.0
+    )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    contingencies = generate_contingencies(
+        args.case,
+        args.output,
+        args.time,
+        tuple(args.kinds),
+        args.link,
+        args.workers,
+        args.jobs,
+        args.top,
+        args.threshold,
+    )
+    wall_time = time.perf_counter() - start
+
+    counts = {}
+    for contingency in contingencies:
+        counts[contingency.kind] = counts.get(contingency.kind, 0) + 1
+    print(
+        f"{len(contingencies)} contingencies written in '{args.output}' "
+        f"({', '.join(f'{count} {kind}' for kind, count in counts.items()) or 'none'}) in {wall_time:.3f} s."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
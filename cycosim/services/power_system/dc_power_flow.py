@@ -0,0 +1,387 @@
+"""
+DC power flow screening of the static network, run before launching Dynawo to spot the operating
+points that are infeasible or whose branches are already overloaded.
+
+    python -m cycosim dc_flow case_folder
+    python -m cycosim dc_flow network.iidm --threshold 0.9 --output screening.json
+"""
+import json
+import time
+import argparse
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+from cycosim.domain.models.power_system import BaseComponent
+from cycosim.utils.union_find import union_edges, get_labels
+
+from cycosim.services.input_files.global_parser import DynawoGlobalParser
+from cycosim.services.power_system.network_tables import NetworkTables, read_value, to_number
+from cycosim.services.power_system.bus_reduction import BusReduction
+from cycosim.services.power_system.admittance import S_BASE, ADMITTANCE_BRANCH_FLAGS, get_transformer_ratios
+from cycosim.services.power_system.topology import get_iidm_file
+
+# The flags of the current limits of the two sides of a branch
+CURRENT_LIMITS_FLAGS = ("currentLimits1", "currentLimits2")
+
+
+def get_current_limits(table, nominal_V: np.ndarray) -> np.ndarray:
+    """_summary_
+    Returns the active power limit in MW of every branch of the table, computed from the permanent
+    current limit of each side at the nominal voltage of its bus and a unity power factor. The limit
+    of a branch is the lowest of its sides, NaN if it has no current limit.
+    """
+    limits = np.full(len(table), np.nan)
+    for row, cpnt in enumerate(table.components):
+        for sub_cpnt in cpnt.sub_components:
+            if sub_cpnt.flag_name not in CURRENT_LIMITS_FLAGS:
+                continue
+            bus = table["bus_1" if sub_cpnt.flag_name == CURRENT_LIMITS_FLAGS[0] else "bus_2"][row]
+            current = to_number(read_value(sub_cpnt, "permanent_limit", "permanentLimit"), np.float64)
+            if bus >= 0 and not np.isnan(current):
+                limits[row] = np.fmin(limits[row], np.sqrt(3) * nominal_V[bus] * current / 1000.0)
+    return limits
+
+
+class DCScreeningReport:
+    """_summary_
+    Result of the DC power flow screening of one operating point.
+
+    Attributes:
+        flows (np.ndarray) : The active power flow of every branch from its side 1 to its side 2, in MW.
+        loadings (np.ndarray) : The ratio of the absolute flow to the limit of every branch, NaN without limit.
+        overloads (list) : The (branch id, flow, limit, loading) of the branches over the threshold,
+                           the most loaded first.
+        slack_powers (np.ndarray) : The power the generators of every island produce in addition to
+                                    their targets to balance the island, in MW.
+        infeasible_islands (list) : The islands whose slack power exceeds the headroom of their generators
+                                    above their targetP, or their whole targetP when it is negative.
+        dead_load (float) : The load of the islands without generator, which cannot be supplied, in MW.
+    """
+
+    def __init__(self):
+        self.flows = None
+        self.loadings = None
+        self.overloads = []
+        self.slack_powers = None
+        self.infeasible_islands = []
+        self.dead_load = 0.0
+
+    def is_secure(self) -> bool:
+        return not self.overloads and not self.infeasible_islands and self.dead_load == 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "secure": self.is_secure(),
+            "overloads": [
+                {"branch": branch_id, "flow": flow, "limit": limit, "loading": loading}
+                for branch_id, flow, limit, loading in self.overloads
+            ],
+            "slack_powers": self.slack_powers.tolist(),
+            "infeasible_islands": self.infeasible_islands,
+            "dead_load": self.dead_load,
+        }
+
+    def get_lines(self, max_lines: int = 20) -> list:
+        lines = [
+            f"{len(self.overloads)} overloaded branches, {len(self.infeasible_islands)} infeasible islands, "
+            f"{self.dead_load:.1f} MW of load without generator"
+        ]
+        for branch_id, flow, limit, loading in self.overloads[:max_lines]:
+            lines.append(
+                f"  {branch_id:<30} {flow:>10.1f} MW   limit {limit:>10.1f} MW   loading {100 * loading:6.1f} %"
+            )
+        if len(self.overloads) > max_lines:
+            lines.append(f"  ... {len(self.overloads) - max_lines} other overloaded branches")
+        return lines
+
+
+class DCPowerFlow:
+    """_summary_
+    DC power flow over the reduced buses of the BusReduction : the voltages are 1 per-unit, the
+    resistances are neglected and the flow of a branch is b (theta_1 - theta_2), b being the inverse
+    of its per-unit reactance. The imbalance of every island is shared by its generators in proportion
+    to their targetP (distributed slack) and the angle of the bus of its largest generator is the
+    reference. The islands without generator are left out. The susceptance matrix without the reference
+    buses is factorized once by a sparse LU, which is then reused for every vector of injections : a
+    batch of operating points is solved at once by giving the injections as the columns of a matrix.
+
+    Attributes:
+        s_base (float) : The base power, in MVA.
+        tables (NetworkTables) : The tables of the network.
+        reduction (BusReduction) : The bus-branch reduction the buses are taken from.
+        nbr_buses (int) : The number of reduced buses.
+        branch_ids (list) : The id of every branch.
+        branch_kinds (np.ndarray) : The index of the flag of every branch in ADMITTANCE_BRANCH_FLAGS.
+        branch_buses_1 (np.ndarray) : The first reduced bus of every branch.
+        branch_buses_2 (np.ndarray) : The second reduced bus of every branch.
+        susceptances (np.ndarray) : The per-unit susceptance of every branch.
+        limits (np.ndarray) : The active power limit of every branch in MW, NaN without limit.
+        nbr_islands (int) : The number of islands.
+        islands (np.ndarray) : The island of every reduced bus.
+        island_incidence (sp.csr_matrix) : The (nbr_islands, nbr_buses) matrix summing the buses by island.
+        reference_buses (np.ndarray) : The reference bus of every island, -1 for the islands without generator.
+        participations (np.ndarray) : The share of the imbalance of its island taken by every reduced bus.
+        solved_buses (np.ndarray) : The buses whose angle is solved, neither reference nor in a dead island.
+        generator_incidence (sp.csr_matrix) : The (nbr_buses, nbr_generators) matrix summing the generators by bus.
+        load_incidence (sp.csr_matrix) : The (nbr_buses, nbr_loads) matrix summing the loads by bus.
+        factor (SuperLU) : The LU factorization of the susceptance matrix of the solved buses.
+    """
+
+    def __init__(self, _tables: NetworkTables, _s_base: float = S_BASE, _reduction: BusReduction = None):
+        self.s_base = _s_base
+        self.tables = _tables
+        self.reduction = _reduction if _reduction is not None else BusReduction(_tables)
+        self.nbr_buses = self.reduction.nbr_reduced_buses
+
+        ids, kinds, buses_1, buses_2, susceptances, limits = [], [], [], [], [], []
+        nominal_V = _tables.nominal_V
+        for kind, flag_name in enumerate(ADMITTANCE_BRANCH_FLAGS):
+            table = _tables.tables[flag_name]
+            reactances = np.nan_to_num(table["reactance"])
+            connected = (table["bus_1"] >= 0) & (table["bus_2"] >= 0)
+            rows = np.flatnonzero(connected & (reactances != 0.0))
+            if len(rows) < connected.sum():
+                print(f"Error : the {flag_name} branches without reactance are left out of the DC power flow")
+
+            bus_1, bus_2 = table["bus_1"][rows], table["bus_2"][rows]
+            ratio = get_transformer_ratios(_tables)[rows] if flag_name == "twoWindingsTransformer" else 1.0
+            susceptances.append(ratio * nominal_V[bus_1] * nominal_V[bus_2] / (_s_base * reactances[rows]))
+            limits.append(get_current_limits(table, nominal_V)[rows])
+            ids.extend(table.ids[row] for row in rows)
+            kinds.append(np.full(len(rows), kind, dtype=np.int8))
+            buses_1.append(self.reduction.reduced_buses[bus_1])
+            buses_2.append(self.reduction.reduced_buses[bus_2])
+
+        self.branch_ids = ids
+        self.branch_kinds = np.concatenate(kinds)
+        self.branch_buses_1 = np.concatenate(buses_1)
+        self.branch_buses_2 = np.concatenate(buses_2)
+        self.susceptances = np.concatenate(susceptances)
+        self.limits = np.concatenate(limits)
+
+        self.generator_incidence = self.get_incidence(_tables.generators)
+        self.load_incidence = self.get_incidence(_tables.loads)
+
+        roots = union_edges(np.arange(self.nbr_buses), self.branch_buses_1, self.branch_buses_2)
+        self.nbr_islands, self.islands = get_labels(roots)
+        self.island_incidence = sp.csr_matrix(
+            (np.ones(self.nbr_buses), (self.islands, np.arange(self.nbr_buses))),
+            shape=(self.nbr_islands, self.nbr_buses),
+        )
+        self.find_reference_buses()
+        self.get_participations()
+        self.factorize()
+
+    @classmethod
+    def from_network(cls, network: BaseComponent, s_base: float = S_BASE):
+        return cls(NetworkTables(network), s_base)
+
+    def __len__(self):
+        return len(self.branch_ids)
+
+    def get_incidence(self, table) -> sp.csr_matrix:
+        """_summary_
+        Returns the sparse matrix summing the values of the connected components of the table by reduced bus.
+        """
+        rows = np.flatnonzero(table["bus"] >= 0)
+        return sp.csr_matrix(
+            (np.ones(len(rows)), (self.reduction.reduced_buses[table["bus"][rows]], rows)),
+            shape=(self.nbr_buses, len(table)),
+        )
+
+    def get_generator_capacities(self) -> np.ndarray:
+        """_summary_
+        Returns the maximal active power of the generators of every reduced bus, in MW.
+        """
+        generators = self.tables.generators
+        capacities = np.where(
+            np.isnan(generators["active_power_max"]), generators["active_power_target"], generators["active_power_max"]
+        )
+        return self.generator_incidence @ np.nan_to_num(capacities)
+
+    def find_reference_buses(self):
+        """_summary_
+        Takes as reference bus of every island its bus of largest generator capacity, none if it has no generator.
+        """
+        has_generator = np.asarray(self.generator_incidence.sum(axis=1)).ravel() > 0
+        capacities = self.get_generator_capacities()
+
+        buses = np.flatnonzero(has_generator)
+        # The buses sorted by island then by decreasing capacity, the first of every island is its reference
+        order = np.lexsort((-capacities[buses], self.islands[buses]))
+        buses = buses[order]
+        first = np.r_[True, self.islands[buses][1:] != self.islands[buses][:-1]]
+        self.reference_buses = np.full(self.nbr_islands, -1, dtype=np.int64)
+        self.reference_buses[self.islands[buses[first]]] = buses[first]
+
+        solved = self.reference_buses[self.islands] >= 0
+        solved[self.reference_buses[self.reference_buses >= 0]] = False
+        self.solved_buses = np.flatnonzero(solved)
+
+    def get_participations(self):
+        """_summary_
+        Shares the imbalance of every island between its buses in proportion to the targetP of their
+        generators. An island whose generators have no positive targetP leaves it to its reference bus.
+        """
+        generators = self.tables.generators
+        targets = self.generator_incidence @ np.clip(np.nan_to_num(generators["active_power_target"]), 0.0, None)
+        island_targets = self.get_island_sums(targets)
+        without_target = np.flatnonzero((island_targets == 0.0) & (self.reference_buses >= 0))
+        targets[self.reference_buses[without_target]] = 1.0
+        island_targets[without_target] = 1.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.participations = np.nan_to_num(targets / island_targets[self.islands])
+
+    def factorize(self):
+        """_summary_
+        Assembles the susceptance matrix of the solved buses and computes its LU factorization.
+        """
+        buses_1, buses_2, b = self.branch_buses_1, self.branch_buses_2, self.susceptances
+        rows = np.concatenate([buses_1, buses_2, buses_1, buses_2])
+        cols = np.concatenate([buses_1, buses_2, buses_2, buses_1])
+        matrix = sp.coo_matrix(
+            (np.concatenate([b, b, -b, -b]), (rows, cols)), shape=(self.nbr_buses, self.nbr_buses)
+        ).tocsc()
+        if not len(self.solved_buses):
+            self.factor = None
+            return
+        # The matrix being symmetric, a minimum degree ordering of its pattern and no pivoting keep the factors sparse
+        self.factor = splu(
+            matrix[self.solved_buses][:, self.solved_buses].tocsc(),
+            permc_spec="MMD_AT_PLUS_A",
+            diag_pivot_thresh=0.0,
+            options={"SymmetricMode": True},
+        )
+
+    def get_injections(self, generation: np.ndarray = None, load: np.ndarray = None) -> np.ndarray:
+        """_summary_
+        Returns the active power injected at every reduced bus in MW, from the given generator and load
+        powers, by default from the targetP of the generators and the p0 of the loads. Each array may have
+        one column per operating point, which gives one column of injections per operating point.
+        """
+        if generation is None:
+            generation = np.nan_to_num(self.tables.generators["active_power_target"])
+        if load is None:
+            load = np.nan_to_num(self.tables.loads["active_power_setpoint"])
+        # Transposed, a vector is broadcast against every column of a matrix
+        return ((self.generator_incidence @ generation).T - (self.load_incidence @ load).T).T
+
+    def get_imbalances(self, injections: np.ndarray) -> np.ndarray:
+        """_summary_
+        Returns the power the generators of every island produce in addition to their injections to
+        balance it, in MW, with one column per column of the injections.
+        """
+        return -(self.island_incidence @ injections)
+
+    def solve(self, injections: np.ndarray) -> tuple:
+        """_summary_
+        Solves the DC power flow for the given injections in MW, a vector or a matrix with one column per
+        operating point, once the imbalances of the islands are shared by their generators. Returns the
+        angles of the reduced buses in radians and the flows of the branches in MW, with the same number
+        of columns.
+        """
+        imbalances = self.get_imbalances(injections)
+        balanced = injections + (self.participations * imbalances[self.islands].T).T
+        angles = np.zeros(injections.shape)
+        if self.factor is not None:
+            angles[self.solved_buses] = self.factor.solve(balanced[self.solved_buses] / self.s_base)
+        flows = self.s_base * (self.susceptances * (angles[self.branch_buses_1] - angles[self.branch_buses_2]).T).T
+        return angles, flows
+
+    def get_island_sums(self, values: np.ndarray) -> np.ndarray:
+        return np.bincount(self.islands, weights=values, minlength=self.nbr_islands)
+
+    def screen(self, injections: np.ndarray = None, threshold: float = 1.0) -> list:
+        """_summary_
+        Screens the operating points given by the columns of the injections, by default the one of the
+        network, and returns the DCScreeningReport of every operating point. The branches whose loading
+        is over the threshold are reported as overloaded.
+        """
+        if injections is None:
+            injections = self.get_injections()
+        injections = injections.reshape(self.nbr_buses, -1)
+        _, flows = self.solve(injections)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            loadings = np.abs(flows) / self.limits[:, None]
+
+        generation = self.get_island_sums(
+            self.generator_incidence @ np.nan_to_num(self.tables.generators["active_power_target"])
+        )
+        headroom = self.get_island_sums(self.get_generator_capacities()) - generation
+        energized = self.reference_buses >= 0
+        dead = ~energized[self.islands]
+
+        reports = []
+        for column in range(injections.shape[1]):
+            report = DCScreeningReport()
+            report.flows, report.loadings = flows[:, column], loadings[:, column]
+
+            overloaded = np.flatnonzero(report.loadings > threshold)
+            for branch in overloaded[np.argsort(-report.loadings[overloaded], kind="stable")]:
+                report.overloads.append(
+                    (
+                        self.branch_ids[branch],
+                        float(report.flows[branch]),
+                        float(self.limits[branch]),
+                        float(report.loadings[branch]),
+                    )
+                )
+
+            report.slack_powers = self.get_imbalances(injections[:, column])
+            infeasible = (report.slack_powers > headroom) | (report.slack_powers < -generation)
+            report.infeasible_islands = np.flatnonzero(energized & infeasible).tolist()
+            report.dead_load = float(np.clip(-injections[dead, column], 0.0, None).sum())
+            reports.append(report)
+        return reports
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(
+        prog="cycosim dc_flow",
+        description="Screens the operating point of an IIDM file or of a case folder with a DC power flow.",
+    )
+    parser.add_argument("path", help="The IIDM file (.iidm, .xiidm, .jiidm, .biidm) or the case folder.")
+    parser.add_argument("--threshold", help="The loading above which a branch is reported.", type=float, default=1.0)
+    parser.add_argument("--max_lines", help="The number of overloaded branches printed.", type=int, default=20)
+    parser.add_argument("--output", help="Also write the screening report in the given JSON file.")
+    parser.add_argument("--rank", help="Also print the given number of most severe N-1 outages.", type=int)
+    args = parser.parse_args(argv)
+
+    network = DynawoGlobalParser(get_iidm_file(args.path), _compact=True).parse()
+    start = time.perf_counter()
+    power_flow = DCPowerFlow.from_network(network)
+    factorization_time = time.perf_counter() - start
+    start = time.perf_counter()
+    report = power_flow.screen(threshold=args.threshold)[0]
+    solve_time = time.perf_counter() - start
+
+    for line in report.get_lines(args.max_lines):
+        print(line)
+    print(f"DC power flow factorized in {factorization_time:.3f} s and solved in {solve_time:.3f} s.")
+
+    if args.rank is not None:
+        from cycosim.services.power_system.sensitivities import Sensitivities
+
+        start = time.perf_counter()
+        rankings = Sensitivities(power_flow).get_top_outages(
+            args.rank, args.threshold, ("line", "transformer", "generator")
+        )
+        for ranking in rankings:
+            print(
+                f"  {ranking.kind:<12} {ranking.element_id:<30} severity {ranking.severity:>10.1f} MW   "
+                f"{ranking.nbr_overloads:>5} overloads   max loading {100 * ranking.max_loading:6.1f} %"
+                f"{'   islanding' if ranking.islanding else ''}"
+                f"{f'   {ranking.lost_load:.1f} MW lost' if ranking.lost_load else ''}"
+            )
+        print(f"Outages ranked in {time.perf_counter() - start:.3f} s.")
+
+    if args.output is not None:
+        with open(args.output, "w") as out_file:
+            json.dump(report.to_dict(), out_file, indent=2)
+    return 0 if report.is_secure() else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
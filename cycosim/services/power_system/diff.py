@@ -0,0 +1,293 @@
+"""
+Structural diff of two networks, or of two Dynawo cases, using their Merkle fingerprints.
+
+    python -m cycosim diff old.iidm new.iidm
+    python -m cycosim diff old_case_folder new_case_folder --output report.json
+"""
+import gc
+import os
+import json
+import time
+import argparse
+
+from cycosim.domain.ports.files import FileType
+from cycosim.services.input_files.global_parser import DynawoGlobalParser
+from cycosim.services.input_files.parse_cache import ParseCache, DEFAULT_CACHE_DIRECTORY
+
+from cycosim.services.power_system.fingerprint import (
+    FINGERPRINT_VERSION,
+    FingerprintNode,
+    ElementFingerprints,
+    fingerprint_network,
+    fingerprint_dynamic_model,
+    fingerprint_parameter_store,
+)
+
+# The kinds of compared file, by file type
+IIDM_TYPES = (FileType.IIDM, FileType.XIIDM, FileType.JIIDM, FileType.BIIDM)
+FILE_KINDS = {FileType.DYD: "dyd", FileType.PAR: "par"} | {file_type: "iidm" for file_type in IIDM_TYPES}
+
+
+def get_path(parent_path: str, key: tuple) -> str:
+    return f"{parent_path}/{key[0]}:{key[1]}"
+
+
+class DiffReport:
+    """_summary_
+    The differences found between two networks or two cases.
+
+    Attributes:
+        added (list) : The elements only in the new version, with their kind and path.
+        removed (list) : The elements only in the old version, with their kind and path.
+        changed (list) : The elements in both versions, with the old and new value of what changed.
+        compared (int) : The number of elements whose content has been compared.
+        skipped (int) : The number of elements skipped as part of an identical subtree or collection.
+        loading_time (float) : The time spent parsing and fingerprinting the files, in seconds.
+        comparison_time (float) : The time spent comparing the fingerprints, in seconds.
+    """
+
+    def __init__(self):
+        self.added = []
+        self.removed = []
+        self.changed = []
+        self.compared = 0
+        self.skipped = 0
+        self.loading_time = 0.0
+        self.comparison_time = 0.0
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def to_dict(self) -> dict:
+        return {
+            "added": self.added,
+            "removed": self.removed,
+            "changed": self.changed,
+            "compared": self.compared,
+            "skipped": self.skipped,
+            "loading_time": self.loading_time,
+            "comparison_time": self.comparison_time,
+        }
+
+    def get_lines(self) -> list:
+        lines = [f"+ {entry['kind']} {entry['path']}" for entry in self.added]
+        lines += [f"- {entry['kind']} {entry['path']}" for entry in self.removed]
+        for entry in self.changed:
+            lines.append(f"~ {entry['kind']} {entry['path']}")
+            for name, (old, new) in entry["changes"].items():
+                lines.append(f"    {name} : {old} -> {new}")
+        return lines
+
+
+def compare_contents(old: dict, new: dict) -> dict:
+    """_summary_
+    Returns the [old, new] values of every entry that differs between the two contents,
+    None standing for a missing entry.
+    """
+    changes = {}
+    for name in sorted(old.keys() | new.keys()):
+        old_val, new_val = old.get(name), new.get(name)
+        if old_val != new_val:
+            changes[name] = [old_val, new_val]
+    return changes
+
+
+def diff_networks(old: FingerprintNode, new: FingerprintNode, report: DiffReport, kind: str = "iidm") -> DiffReport:
+    """_summary_
+    Adds to the report the components added, removed and changed between the two fingerprinted
+    networks. The subtrees having the same digest, such as the untouched substations, are skipped
+    without going through their components.
+    """
+    stack = [(old, new, f"{old.key[0]}:{old.key[1]}")]
+    while stack:
+        old_node, new_node, path = stack.pop()
+        if old_node.digest == new_node.digest:
+            report.skipped += old_node.size
+            continue
+
+        report.compared += 1
+        if old_node.own_digest != new_node.own_digest:
+            changes = compare_contents(old_node.get_attributes(), new_node.get_attributes())
+            if old_node.component.flag_name != new_node.component.flag_name:
+                changes["flag"] = [old_node.component.flag_name, new_node.component.flag_name]
+            report.changed.append({"kind": kind, "path": path, "changes": changes})
+
+        for key, old_child in old_node.children.items():
+            new_child = new_node.children.get(key)
+            if new_child is None:
+                report.removed.append({"kind": kind, "path": get_path(path, key)})
+            else:
+                stack.append((old_child, new_child, get_path(path, key)))
+
+        for key in new_node.children.keys() - old_node.children.keys():
+            report.added.append({"kind": kind, "path": get_path(path, key)})
+
+    return report
+
+
+def diff_elements(old: ElementFingerprints, new: ElementFingerprints, report: DiffReport, kind: str) -> DiffReport:
+    """_summary_
+    Adds to the report the elements added, removed and changed between the two fingerprinted
+    collections, which are skipped at once when their digests are the same.
+    """
+    if old.digest == new.digest:
+        report.skipped += len(old.digests)
+        return report
+
+    for key, old_digest in old.digests.items():
+        new_digest = new.digests.get(key)
+        path = "/".join(map(str, key))
+        if new_digest is None:
+            report.removed.append({"kind": kind, "path": path})
+        elif new_digest == old_digest:
+            report.skipped += 1
+        else:
+            report.compared += 1
+            report.changed.append(
+                {"kind": kind, "path": path, "changes": compare_contents(old.contents[key], new.contents[key])}
+            )
+
+    for key in new.digests.keys() - old.digests.keys():
+        report.added.append({"kind": kind, "path": "/".join(map(str, key))})
+
+    return report
+
+
+def get_file_kind(path: str) -> str:
+    extension = path.split(".")[-1]
+    if extension not in {file_type.value for file_type in FILE_KINDS}:
+        raise ValueError(
+            f"The file '{path}' can not be compared, the known extensions are {[ft.value for ft in FILE_KINDS]}."
+        )
+    return FILE_KINDS[FileType(extension)]
+
+
+def fingerprint_file(path: str, cache: ParseCache = None):
+    """_summary_
+    Returns the kind and the fingerprints of the IIDM, DYD or PAR file. With a cache of parsed
+    files, the fingerprints are stored next to the parsed object, so an unchanged file is neither
+    parsed nor hashed again : the fingerprints hold the components they are computed from.
+    """
+    kind = get_file_kind(path)
+    global_parser = DynawoGlobalParser(path, _cache=cache)
+    if cache is not None:
+        key = f"{global_parser.get_cache_key()}-fingerprint-{FINGERPRINT_VERSION}"
+        fingerprints = cache.load(key)
+        if fingerprints is not None:
+            return kind, fingerprints
+
+    parsed_obj = global_parser.parse()
+    if kind == "iidm":
+        fingerprints = fingerprint_network(parsed_obj)
+    elif kind == "dyd":
+        fingerprints = fingerprint_dynamic_model(parsed_obj)
+    else:
+        fingerprints = fingerprint_parameter_store(parsed_obj)
+
+    if cache is not None:
+        cache.store(key, fingerprints)
+    return kind, fingerprints
+
+
+def get_case_files(case_dir: str, cache: ParseCache = None) -> dict:
+    """_summary_
+    Returns the path of the IIDM, DYD and PAR files of the case, given by the first JOBS file of the folder.
+    """
+    for file in sorted(os.listdir(case_dir)):
+        if file.endswith(".jobs"):
+            jobs = DynawoGlobalParser(os.path.join(case_dir, file), _cache=cache).parse()
+            files = {"iidm": jobs.iidm_file, "dyd": jobs.dyd_file, "par": jobs.network_parameter_file}
+            return {kind: os.path.join(case_dir, path) for kind, path in files.items() if path is not None}
+
+    raise FileNotFoundError(f"No JOBS file in the directory '{case_dir}'.")
+
+
+def diff_fingerprints(old, new, kind: str, report: DiffReport) -> DiffReport:
+    if kind == "iidm":
+        return diff_networks(old, new, report, kind)
+    return diff_elements(old, new, report, kind)
+
+
+def diff_paths(old_path: str, new_path: str, cache: ParseCache = None) -> DiffReport:
+    """_summary_
+    Returns the differences between two files of the same kind, or between the IIDM, DYD and
+    PAR files of two case folders. The time spent loading and fingerprinting the files and the
+    time spent comparing the fingerprints are added to the report.
+    """
+    if os.path.isdir(old_path) and os.path.isdir(new_path):
+        old_files = get_case_files(old_path, cache)
+        new_files = get_case_files(new_path, cache)
+        pairs = [(old_files[kind], new_files[kind]) for kind in sorted(old_files.keys() & new_files.keys())]
+    else:
+        pairs = [(old_path, new_path)]
+
+    for old_file, new_file in pairs:
+        old_kind, new_kind = get_file_kind(old_file), get_file_kind(new_file)
+        if old_kind != new_kind:
+            raise ValueError(
+                f"Can not compare a {old_kind} file ('{old_file}') with a {new_kind} file ('{new_file}')."
+            )
+
+    report = DiffReport()
+    for old_file, new_file in pairs:
+        start = time.perf_counter()
+        kind, old_fingerprints = fingerprint_file(old_file, cache)
+        new_fingerprints = fingerprint_file(new_file, cache)[1]
+
+        middle = time.perf_counter()
+        # The collector would go through all the nodes held by the fingerprints without anything to collect
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            diff_fingerprints(old_fingerprints, new_fingerprints, kind, report)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        report.loading_time += middle - start
+        report.comparison_time += time.perf_counter() - middle
+    return report
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(
+        prog="cycosim diff",
+        description="Compares two networks (.iidm, .xiidm, .jiidm, .biidm), two DYD or PAR files, or two case "
+        "folders, and lists the components and parameters added, removed and changed.",
+    )
+    parser.add_argument("old", help="The old file or case folder.")
+    parser.add_argument("new", help="The new file or case folder.")
+    parser.add_argument("--output", help="Also write the differences in the given JSON report.")
+    parser.add_argument("--quiet", help="Only print the summary of the differences.", action="store_true")
+    parser.add_argument(
+        "--cache",
+        help="Load the parsed files from the cache of parsed files, and store them there, so that only the "
+        "files changed since the previous diff are parsed again.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--cache_dir", help="The folder where the parsed files are cached.", default=DEFAULT_CACHE_DIRECTORY
+    )
+    args = parser.parse_args(argv)
+
+    report = diff_paths(args.old, args.new, ParseCache(args.cache_dir) if args.cache else None)
+
+    if not args.quiet:
+        for line in report.get_lines():
+            print(line)
+    print(
+        f"{len(report.added)} added, {len(report.removed)} removed, {len(report.changed)} changed "
+        f"({report.compared} compared, {report.skipped} skipped as identical)"
+    )
+    print(
+        f"Loaded and fingerprinted in {report.loading_time:.3f} s, compared in {report.comparison_time:.3f} s."
+    )
+
+    if args.output is not None:
+        with open(args.output, "w") as out_file:
+            json.dump(report.to_dict(), out_file, indent=2)
+
+    return 0 if report.is_empty() else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
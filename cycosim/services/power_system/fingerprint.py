@@ -0,0 +1,192 @@
+import gc
+import hashlib
+
+from cycosim.domain.models.power_system import BaseComponent, DynamicModel
+from cycosim.adapters.serializers.dynawo.iidm_serializer import get_iidm_attributes
+
+DIGEST_SIZE = 16
+
+# Must be increased every time the cached fingerprints change
+FINGERPRINT_VERSION = 1
+
+
+def get_digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=DIGEST_SIZE).digest()
+
+
+def combine_digests(digests) -> bytes:
+    """_summary_
+    Returns the digest of a group of digests, whatever their order.
+    """
+    return hashlib.blake2b(b"".join(sorted(digests)), digest_size=DIGEST_SIZE).digest()
+
+
+def get_attributes_text(cpnt: BaseComponent) -> str:
+    """_summary_
+    Returns the text hashed for the flag name and the xml attributes of the component,
+    the attributes being sorted so that their order does not matter.
+    """
+    return repr((cpnt.flag_name, sorted((key, str(val)) for key, val in get_iidm_attributes(cpnt))))
+
+
+class FingerprintNode:
+    """_summary_
+    Merkle fingerprint of a component and of the components below it. Two subtrees holding the
+    same components with the same attributes have the same digest, whatever the order of the
+    siblings, so the identical parts of two networks are recognized without going through them.
+
+    Attributes:
+        key (tuple) : The flag name and the id of the component. The components without id are
+                      keyed by their position among the siblings of their flag without id.
+        component (BaseComponent) : The fingerprinted component.
+        own_digest (bytes) : The digest of the flag name and of the attributes of the component.
+        digest (bytes) : The digest of the component and of all its sub components.
+        children (dict) : The fingerprints of the sub components, by key.
+        size (int) : The number of components of the subtree.
+    """
+
+    __slots__ = ("key", "component", "own_digest", "digest", "children", "size")
+
+    def __init__(self, _key: tuple, _component: BaseComponent):
+        self.key = _key
+        self.component = _component
+        self.own_digest = get_digest(get_attributes_text(_component))
+        self.digest = None
+        self.children = {}
+        self.size = 1
+
+    def get_attributes(self) -> dict:
+        """_summary_
+        Returns the xml attributes of the component, by name. They are only read again
+        for the components whose own digest differs.
+        """
+        return {key: str(val) for key, val in get_iidm_attributes(self.component)}
+
+
+def get_children_keys(cpnt: BaseComponent) -> list:
+    keys = []
+    positions = {}
+    for sub_cpnt in cpnt.sub_components:
+        if sub_cpnt.id is not None:
+            keys.append((sub_cpnt.flag_name, sub_cpnt.id))
+        else:
+            position = positions[sub_cpnt.flag_name] = positions.get(sub_cpnt.flag_name, -1) + 1
+            keys.append((sub_cpnt.flag_name, f"#{position}"))
+    return keys
+
+
+def fingerprint_component(key: tuple, cpnt: BaseComponent) -> FingerprintNode:
+    node = FingerprintNode(key, cpnt)
+    if cpnt.sub_components:
+        children = node.children
+        for sub_key, sub_cpnt in zip(get_children_keys(cpnt), cpnt.sub_components):
+            children[sub_key] = fingerprint_component(sub_key, sub_cpnt)
+        node.size += sum(child.size for child in children.values())
+        children_digests = b"".join(sorted(child.digest for child in children.values()))
+        node.digest = hashlib.blake2b(node.own_digest + children_digests, digest_size=DIGEST_SIZE).digest()
+    else:
+        node.digest = node.own_digest
+    return node
+
+
+def fingerprint_network(network: BaseComponent) -> FingerprintNode:
+    """_summary_
+    Returns the fingerprint of the network, every subtree digest being computed once from the
+    own digest of its root and the digests of its children. The tree of an IIDM network being
+    a few levels deep, it is walked recursively. The garbage collector is paused meanwhile, as
+    it slows down a lot the creation of the nodes without having anything to collect.
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return fingerprint_component((network.flag_name, network.id), network)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+class ElementFingerprints:
+    """_summary_
+    Fingerprints of a flat collection of elements, such as the models of a DYD file or the sets
+    of a PAR file. Every element has a digest and the collection a digest of all of them, so two
+    identical collections are recognized by comparing a single digest.
+
+    Attributes:
+        digests (dict) : The digest of every element, by key.
+        contents (dict) : The content compared when two elements of the same key differ, by key.
+        digest (bytes) : The digest of the whole collection.
+    """
+
+    def __init__(self):
+        self.digests = {}
+        self.contents = {}
+        self.digest = None
+
+    def add(self, key, content: dict):
+        self.contents[key] = content
+        self.digests[key] = get_digest(repr(sorted((name, str(val)) for name, val in content.items())))
+
+    def close(self):
+        self.digest = combine_digests(get_digest(str(key)) + digest for key, digest in self.digests.items())
+        return self
+
+
+def fingerprint_dynamic_model(dynamic_model: DynamicModel) -> ElementFingerprints:
+    """_summary_
+    Returns the fingerprints of the blackBoxModels, macroConnectors and connections of the model.
+    The connections are keyed by their two ends and their variables, they are thus added or removed,
+    never changed.
+    """
+    fingerprints = ElementFingerprints()
+    for model in dynamic_model.black_box_models:
+        content = {
+            "lib": model.library,
+            "parFile": model.parameter_file,
+            "parId": model.parameter_id,
+            "staticId": model.static_id,
+        }
+        for ref in model.static_references:
+            content[f"staticRef {ref.variable}"] = ref.static_variable
+        fingerprints.add(("blackBoxModel", model.id), content)
+
+    for connector in dynamic_model.connectors:
+        content = {}
+        for connection in connector.connections:
+            content[f"connect {connection.variable_1}"] = connection.variable_2
+        fingerprints.add(("macroConnector", connector.id), content)
+
+    for connection in dynamic_model.connections:
+        flag_name = "macroConnect" if connection.is_macro else "connect"
+        key = (flag_name, connection.id_1, connection.variable_1, connection.id_2, connection.variable_2)
+        fingerprints.add(key, {"connector": connection.connector, "index1": connection.index_1})
+
+    for ref in dynamic_model.static_references:
+        fingerprints.add(("staticRef", ref.variable), {"staticVar": ref.static_variable})
+
+    return fingerprints.close()
+
+
+def fingerprint_parameter_store(store) -> ElementFingerprints:
+    """_summary_
+    Returns the fingerprints of the parameter sets of a DynawoParameterStore, keyed by set id.
+    The sets sharing their payload are only read once.
+    """
+    fingerprints = ElementFingerprints()
+    payload_contents = {}
+    for row, set_id in enumerate(store.set_ids):
+        payload = store.set_parameters[row]
+        content = payload_contents.get(id(payload))
+        if content is None:
+            content = {}
+            for idx in payload:
+                content[store.parameter_names[idx]] = f"{store.get_value_at(idx)} ({store.get_type(idx).value})"
+            payload_contents[id(payload)] = content
+
+        if row in store.references:
+            content = dict(content)
+            for ref in store.references[row].values():
+                dynawo_type = getattr(ref.dynawo_type, "value", ref.dynawo_type)
+                content[f"reference {ref.name}"] = f"{ref.original_data_source}:{ref.original_name} ({dynawo_type})"
+        fingerprints.add(("set", set_id), content)
+
+    return fingerprints.close()
@@ -0,0 +1,330 @@
+import numpy as np
+
+from cycosim.domain.models.power_system import BaseComponent
+from cycosim.adapters.serializers.dynawo import DynawoSerializerIIDM
+
+# For every xml flag gathered in a table, the typed columns given as
+# attribute name : (name of the attribute in the IIDM file, dtype)
+table_columns = {
+    "bus": {
+        "V": ("v", np.float64),
+        "phase": ("angle", np.float64),
+    },
+    "generator": {
+        "active_power_min": ("minP", np.float64),
+        "active_power_max": ("maxP", np.float64),
+        "is_voltage_regulation": ("voltageRegulatorOn", np.bool_),
+        "active_power_target": ("targetP", np.float64),
+        "voltage_magnitude_target": ("targetV", np.float64),
+        "reactive_power_target": ("targetQ", np.float64),
+        "active_power_output": ("p", np.float64),
+        "reactive_power_output": ("q", np.float64),
+    },
+    "load": {
+        "active_power_setpoint": ("p0", np.float64),
+        "reactive_power_setpoint": ("q0", np.float64),
+        "active_power_output": ("p", np.float64),
+        "reactive_power_output": ("q", np.float64),
+    },
+    "switch": {
+        "is_open": ("open", np.bool_),
+    },
+    "line": {
+        "resistance": ("r", np.float64),
+        "reactance": ("x", np.float64),
+        "half_shunt_susceptance": ("b1", np.float64),
+        "half_shunt_susceptance_2": ("b2", np.float64),
+        "half_shunt_conductance": ("g1", np.float64),
+        "half_shunt_conductance_2": ("g2", np.float64),
+    },
+    "twoWindingsTransformer": {
+        "resistance": ("r", np.float64),
+        "reactance": ("x", np.float64),
+        "magnetizing_susceptance": ("b", np.float64),
+        "magnetizing_conductance": ("g", np.float64),
+        "rated_voltage_1": ("ratedU1", np.float64),
+        "rated_voltage_2": ("ratedU2", np.float64),
+    },
+    "shunt": {
+        "susceptance_per_section": ("bPerSection", np.float64),
+        "section_count": ("currentSectionCount", np.float64),
+    },
+}
+
+# For every xml flag gathered in a table, the references to buses given as
+# attribute name : name of the attribute in the IIDM file
+table_bus_columns = {
+    "bus": {},
+    "generator": {"bus": "bus"},
+    "load": {"bus": "bus"},
+    "switch": {"bus_1": "bus1", "bus_2": "bus2"},
+    "line": {"bus_1": "bus1", "bus_2": "bus2"},
+    "twoWindingsTransformer": {"bus_1": "bus1", "bus_2": "bus2"},
+    "shunt": {"bus": "bus"},
+}
+
+
+def read_value(cpnt: BaseComponent, attribute: str, iidm_name: str):
+    """_summary_
+    Returns the raw value of an attribute of the component, whether it has been stored
+    in its own variable or in the 'info' dictionary during the parsing.
+    """
+    val = getattr(cpnt, attribute, None)
+    if val is None:
+        val = cpnt.info.get(iidm_name)
+    return val
+
+
+def write_value(cpnt: BaseComponent, attribute: str, iidm_name: str, val: str):
+    """_summary_
+    Stores the raw value of an attribute at the place it has been read from.
+    If the value is None, the attribute is removed from the component.
+    """
+    if getattr(cpnt, attribute, None) is not None:
+        if val is None:
+            delattr(cpnt, attribute)
+        else:
+            setattr(cpnt, attribute, val)
+
+    elif val is None:
+        cpnt.remove_info(iidm_name)
+    else:
+        cpnt.set_info(iidm_name, val)
+
+
+def read_shunt_models(table: "ComponentTable"):
+    """_summary_
+    Fills the susceptance per section and the section count of the shunts written with the layout
+    of the IIDM versions after 1.0 : the count in the 'sectionCount' attribute and the susceptance in
+    a 'shuntLinearModel' child, or in the 'section' children of a 'shuntNonLinearModel', whose 'b' is
+    the susceptance of that section and all the previous ones. For those, the susceptance per section
+    is the one of the active sections divided by their number. These values are not written back.
+    """
+    for row in np.flatnonzero(np.isnan(table["susceptance_per_section"]) | np.isnan(table["section_count"])):
+        cpnt = table.components[row]
+        section_count = to_number(cpnt.info.get("sectionCount"), np.float64)
+        if np.isnan(table["section_count"][row]):
+            table["section_count"][row] = section_count
+
+        for model in cpnt.sub_components:
+            if model.flag_name == "shuntLinearModel":
+                table["susceptance_per_section"][row] = to_number(model.info.get("bPerSection"), np.float64)
+            elif model.flag_name == "shuntNonLinearModel":
+                sections = [sub_cpnt for sub_cpnt in model.sub_components if sub_cpnt.flag_name == "section"]
+                if section_count == 0:
+                    table["susceptance_per_section"][row] = 0.0
+                elif 0 < section_count <= len(sections):
+                    susceptance = to_number(sections[int(section_count) - 1].info.get("b"), np.float64)
+                    table["susceptance_per_section"][row] = susceptance / section_count
+
+    missing = np.isnan(table["susceptance_per_section"]) | np.isnan(table["section_count"])
+    if missing.any():
+        print(
+            f"Error : The susceptance of {int(missing.sum())} shunts can not be read, "
+            f"they are left out of the admittances (first one : {table.ids[np.flatnonzero(missing)[0]]})"
+        )
+    table.snapshot()
+
+
+def to_number(val: str, dtype):
+    if dtype == np.bool_:
+        return val == "true"
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def to_string(val, dtype):
+    if dtype == np.bool_:
+        return "true" if val else "false"
+    if np.isnan(val):
+        return None
+    return repr(float(val))
+
+
+class ComponentTable:
+    """_summary_
+    Columnar view of all the components sharing the same xml flag.
+
+    Attributes:
+        flag_name (str) : The xml flag of the components.
+        ids (list) : The id of every component, the position in the list is the row of the component.
+        components (list) : The Component objects the rows have been read from.
+        columns (dict) : For every typed attribute, a NumPy array holding the value of every component.
+                         The missing float values are NaN.
+        bus_columns (dict) : For every reference to a bus, an integer array holding the row of the bus
+                             in the bus table, -1 if the component is not connected.
+    """
+
+    def __init__(self, flag_name: str, components: list, bus_rows: dict):
+        self.flag_name = flag_name
+        self.components = components
+        self.ids = [cpnt.id for cpnt in components]
+        self.rows = {cpnt_id: row for row, cpnt_id in enumerate(self.ids)}
+
+        self.columns = {}
+        for attribute, (iidm_name, dtype) in table_columns[flag_name].items():
+            self.columns[attribute] = np.array(
+                [to_number(read_value(cpnt, attribute, iidm_name), dtype) for cpnt in components], dtype=dtype
+            )
+
+        self.bus_columns = {}
+        for attribute, iidm_name in table_bus_columns[flag_name].items():
+            self.bus_columns[attribute] = np.array(
+                [bus_rows.get(read_value(cpnt, attribute, iidm_name), -1) for cpnt in components], dtype=np.int32
+            )
+
+        self.snapshot()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, attribute: str) -> np.ndarray:
+        if attribute in self.columns:
+            return self.columns[attribute]
+        return self.bus_columns[attribute]
+
+    def __setitem__(self, attribute: str, values):
+        self[attribute][:] = values
+
+    def row(self, cpnt_id: str) -> int:
+        """_summary_
+        Returns the row of the component with the given id, None if it is not in the table.
+        """
+        return self.rows.get(cpnt_id)
+
+    def snapshot(self):
+        """_summary_
+        Keeps a copy of the current values, used to write back only the values that changed.
+        """
+        self.saved_columns = {att: col.copy() for att, col in self.columns.items()}
+        self.saved_bus_columns = {att: col.copy() for att, col in self.bus_columns.items()}
+
+    def write_back(self, bus_ids: list) -> int:
+        """_summary_
+        Writes the values modified since the last snapshot to the Component objects.
+
+        Args:
+            bus_ids (list): The ids of the buses, indexed by their row.
+
+        Returns:
+            int : The number of values written.
+        """
+        nbr_written = 0
+        for attribute, (iidm_name, dtype) in table_columns[self.flag_name].items():
+            col, saved = self.columns[attribute], self.saved_columns[attribute]
+            if dtype == np.bool_:
+                changed = np.flatnonzero(col != saved)
+            else:
+                changed = np.flatnonzero((col != saved) & ~(np.isnan(col) & np.isnan(saved)))
+
+            for row in changed:
+                write_value(self.components[row], attribute, iidm_name, to_string(col[row], dtype))
+            nbr_written += len(changed)
+
+        for attribute, iidm_name in table_bus_columns[self.flag_name].items():
+            col, saved = self.bus_columns[attribute], self.saved_bus_columns[attribute]
+            changed = np.flatnonzero(col != saved)
+            for row in changed:
+                write_value(self.components[row], attribute, iidm_name, bus_ids[col[row]] if col[row] >= 0 else None)
+            nbr_written += len(changed)
+
+        self.snapshot()
+        return nbr_written
+
+
+class NetworkTables:
+    """_summary_
+    Struct-of-arrays representation of the static network, with one ComponentTable per kind
+    of component. The numerical values are converted once from the strings of the IIDM file
+    and the references to buses are replaced by integer rows, which allows vectorized
+    computations over the whole network.
+
+    Attributes:
+        network (Component) : The network the tables have been built from.
+        tables (dict) : The ComponentTable of every xml flag listed in table_columns.
+        nominal_V (np.ndarray) : The nominal voltage of every bus, taken from its voltage level.
+    """
+
+    def __init__(self, network: BaseComponent):
+        self.network = network
+
+        components = {flag_name: [] for flag_name in table_columns}
+        nominal_V = []
+
+        # Depth-first walk keeping the nominal voltage of the enclosing voltage level
+        stack = [(network, np.nan)]
+        while stack:
+            cpnt, curr_nominal_V = stack.pop()
+            if cpnt.flag_name == "voltageLevel":
+                curr_nominal_V = to_number(read_value(cpnt, "nominal_V", "nominalV"), np.float64)
+
+            if cpnt.flag_name in components:
+                components[cpnt.flag_name].append(cpnt)
+                if cpnt.flag_name == "bus":
+                    nominal_V.append(curr_nominal_V)
+
+            for sub_cpnt in reversed(cpnt.sub_components):
+                stack.append((sub_cpnt, curr_nominal_V))
+
+        bus_rows = {cpnt.id: row for row, cpnt in enumerate(components["bus"])}
+        self.tables = {
+            flag_name: ComponentTable(flag_name, cpnts, bus_rows) for flag_name, cpnts in components.items()
+        }
+        self.nominal_V = np.array(nominal_V, dtype=np.float64)
+        read_shunt_models(self.shunts)
+
+    @property
+    def buses(self) -> ComponentTable:
+        return self.tables["bus"]
+
+    @property
+    def generators(self) -> ComponentTable:
+        return self.tables["generator"]
+
+    @property
+    def loads(self) -> ComponentTable:
+        return self.tables["load"]
+
+    @property
+    def switches(self) -> ComponentTable:
+        return self.tables["switch"]
+
+    @property
+    def lines(self) -> ComponentTable:
+        return self.tables["line"]
+
+    @property
+    def transformers(self) -> ComponentTable:
+        return self.tables["twoWindingsTransformer"]
+
+    @property
+    def shunts(self) -> ComponentTable:
+        return self.tables["shunt"]
+
+    def nbytes(self) -> int:
+        """_summary_
+        Returns the memory used by the arrays of all the tables, in bytes.
+        """
+        nbr_bytes = self.nominal_V.nbytes
+        for table in self.tables.values():
+            nbr_bytes += sum(col.nbytes for col in table.columns.values())
+            nbr_bytes += sum(col.nbytes for col in table.bus_columns.values())
+        return nbr_bytes
+
+    def write_back(self) -> int:
+        """_summary_
+        Writes the values modified in the tables to the Component tree of the network.
+
+        Returns:
+            int : The number of values written.
+        """
+        return sum(table.write_back(self.buses.ids) for table in self.tables.values())
+
+    def serialize(self, output_path: str):
+        """_summary_
+        Writes the modified values back to the network and serializes it to an IIDM file.
+        """
+        self.write_back()
+        DynawoSerializerIIDM(output_path, self.network).serialize()
@@ -0,0 +1,492 @@
+import numpy as np
+import scipy.sparse as sp
+
+from cycosim.domain.models.power_system import BaseComponent
+
+from cycosim.services.power_system.dc_power_flow import DCPowerFlow
+
+# The memory allowed to every block of sensitivities, in bytes
+DEFAULT_BLOCK_MEMORY = 256 * 1024 * 1024
+
+# The kind of contingency of every branch kind of the DC power flow
+BRANCH_KINDS = ("line", "transformer")
+
+# Below this value of 1 - PTDF of a branch on itself, its outage splits an island
+ISLANDING_TOLERANCE = 1e-6
+
+# The margin given to the bounds of the islanding outages against the rounding of their solves
+BOUND_TOLERANCE = 1e-6
+
+
+class OutageRanking:
+    """_summary_
+    Effect of a single outage on the DC flows of the other branches.
+
+    Attributes:
+        element_id (str) : The id of the disconnected branch or generator.
+        kind (str) : The kind of the disconnected element ('line', 'transformer' or 'generator').
+        severity (float) : The sum of the flows over the threshold of their limit, in MW.
+        nbr_overloads (int) : The number of branches over the threshold of their limit.
+        max_loading (float) : The highest loading of the remaining branches.
+        worst_branch_id (str) : The id of the most loaded remaining branch, None without limits.
+        islanding (bool) : Whether the outage splits an island, each part being balanced by its own generators.
+        lost_load (float) : The power cut off from the buses left without generation, in MW.
+    """
+
+    __slots__ = (
+        "element_id",
+        "kind",
+        "severity",
+        "nbr_overloads",
+        "max_loading",
+        "worst_branch_id",
+        "islanding",
+        "lost_load",
+    )
+
+    def __init__(self, _element_id: str, _kind: str):
+        self.element_id = _element_id
+        self.kind = _kind
+        self.severity = 0.0
+        self.nbr_overloads = 0
+        self.max_loading = np.nan
+        self.worst_branch_id = None
+        self.islanding = False
+        self.lost_load = 0.0
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def get_scores(rankings: list) -> tuple:
+    """_summary_
+    Returns the severities and the maximal loadings of the rankings, 0 without limits, as arrays.
+    """
+    severities = np.array([ranking.severity for ranking in rankings], dtype=float)
+    loadings = np.nan_to_num(np.array([ranking.max_loading for ranking in rankings], dtype=float), nan=0.0)
+    return severities, loadings
+
+
+def select_top(rankings: list, top_k: int) -> list:
+    """_summary_
+    Returns the top_k rankings of highest severity, then of highest maximal loading, in that order. Only
+    the selected ones are sorted.
+    """
+    if top_k <= 0:
+        return []
+    severities, loadings = get_scores(rankings)
+    selected = np.arange(len(rankings))
+    if top_k < len(rankings):
+        scores = np.empty(len(rankings), dtype=[("severity", float), ("loading", float)])
+        scores["severity"], scores["loading"] = -severities, -loadings
+        selected = np.argpartition(scores, top_k - 1, order=("severity", "loading"))[:top_k]
+    selected = selected[np.lexsort((-loadings[selected], -severities[selected]))]
+    return [rankings[index] for index in selected]
+
+
+class Sensitivities:
+    """_summary_
+    PTDF (power transfer distribution factors) and LODF (line outage distribution factors) of the
+    DC power flow, computed by blocks of columns with the LU factorization of the power flow, so that
+    the memory used never exceeds 'max_block_memory' whatever the size of the network.
+
+    PTDF[l, j] is the change of flow on the branch l when 1 MW is injected at the bus j and taken at
+    the reference bus of its island, or shared by its generators if distributed. LODF[l, m] is the
+    change of flow on the branch l when the branch m is disconnected, per MW flowing on m before.
+
+    Attributes:
+        power_flow (DCPowerFlow) : The DC power flow the sensitivities are computed from.
+        max_block_memory (int) : The memory allowed to every block, in bytes.
+        incidence (sp.csr_matrix) : The (nbr_branches, nbr_buses) matrix, +1 at the first bus of every
+                                    branch and -1 at the second one.
+    """
+
+    def __init__(self, _power_flow: DCPowerFlow, _max_block_memory: int = DEFAULT_BLOCK_MEMORY):
+        self.power_flow = _power_flow
+        self.max_block_memory = _max_block_memory
+
+        nbr_branches = len(_power_flow)
+        branches = np.arange(nbr_branches)
+        self.incidence = sp.csr_matrix(
+            (
+                np.r_[np.ones(nbr_branches), -np.ones(nbr_branches)],
+                (np.r_[branches, branches], np.r_[_power_flow.branch_buses_1, _power_flow.branch_buses_2]),
+            ),
+            shape=(nbr_branches, _power_flow.nbr_buses),
+        )
+
+    @classmethod
+    def from_network(cls, network: BaseComponent, max_block_memory: int = DEFAULT_BLOCK_MEMORY):
+        return cls(DCPowerFlow.from_network(network), max_block_memory)
+
+    def get_block_size(self, column_length: int) -> int:
+        """_summary_
+        Returns the number of columns of a block. Every column holds about three vectors of buses (the
+        injections, their copy by the solver and the angles) and six vectors of the length of the columns
+        (the transfers, the factors, the flows, the loadings and the temporaries of the rating).
+        """
+        return max(1, self.max_block_memory // (8 * (3 * self.power_flow.nbr_buses + 6 * column_length)))
+
+    def solve_angles(self, rhs: np.ndarray) -> np.ndarray:
+        """_summary_
+        Returns the per-unit angles of the reduced buses for the per-unit injections given as columns,
+        the angles of the reference buses and of the dead islands being 0.
+        """
+        power_flow = self.power_flow
+        angles = np.zeros(rhs.shape)
+        if power_flow.factor is not None:
+            angles[power_flow.solved_buses] = power_flow.factor.solve(rhs[power_flow.solved_buses])
+        return angles
+
+    def get_ptdf_block(self, buses: np.ndarray, distributed: bool = False) -> np.ndarray:
+        """_summary_
+        Returns the (nbr_branches, len(buses)) columns of the PTDF of the given buses.
+        """
+        power_flow = self.power_flow
+        islands, bus_islands = np.unique(power_flow.islands[buses], return_inverse=True) if distributed else ([], None)
+        rhs = np.zeros((power_flow.nbr_buses, len(buses) + len(islands)))
+        rhs[buses, np.arange(len(buses))] = 1.0
+        # The additional columns inject the participations of every island, the response of its generators
+        for column, island in enumerate(islands, len(buses)):
+            in_island = power_flow.islands == island
+            rhs[in_island, column] = power_flow.participations[in_island]
+
+        ptdf = power_flow.susceptances[:, None] * (self.incidence @ self.solve_angles(rhs))
+        if distributed:
+            return ptdf[:, : len(buses)] - ptdf[:, len(buses) + bus_islands]
+        return ptdf
+
+    def iter_ptdf(self, buses: np.ndarray = None, distributed: bool = False):
+        """_summary_
+        Yields the (buses, PTDF columns) of the given buses, by default all of them, block by block.
+        With distributed, the injection is taken by the generators of the island of the bus in proportion
+        to their participations.
+        """
+        buses = np.arange(self.power_flow.nbr_buses) if buses is None else np.asarray(buses)
+        block_size = self.get_block_size(len(self.power_flow))
+        for start in range(0, len(buses), block_size):
+            block = buses[start : start + block_size]
+            yield block, self.get_ptdf_block(block, distributed)
+
+    def get_ptdf(self, buses: np.ndarray = None, distributed: bool = False) -> np.ndarray:
+        """_summary_
+        Returns the (nbr_branches, nbr_buses) PTDF matrix, only meant for the small networks.
+        """
+        blocks = [ptdf for _, ptdf in self.iter_ptdf(buses, distributed)]
+        return np.hstack(blocks) if blocks else np.zeros((len(self.power_flow), 0))
+
+    def get_lodf_block(self, outages: np.ndarray) -> tuple:
+        """_summary_
+        Returns the (nbr_branches, len(outages)) columns of the LODF of the given branches and whether
+        each outage splits an island, in which case its column is NaN.
+        """
+        power_flow = self.power_flow
+        # The flows caused by a transfer of 1 per-unit between the two ends of every outaged branch
+        transfers = power_flow.susceptances[:, None] * (
+            self.incidence @ self.solve_angles(self.incidence[outages].T.toarray())
+        )
+        columns = np.arange(len(outages))
+        denominators = 1.0 - transfers[outages, columns]
+        islanding = np.abs(denominators) < ISLANDING_TOLERANCE
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lodf = transfers / denominators
+        lodf[outages, columns] = -1.0
+        lodf[:, islanding] = np.nan
+        return lodf, islanding
+
+    def iter_lodf(self, outages: np.ndarray = None):
+        """_summary_
+        Yields the (outages, LODF columns, islanding) of the given branches, by default all of them,
+        block by block.
+        """
+        outages = np.arange(len(self.power_flow)) if outages is None else np.asarray(outages)
+        block_size = self.get_block_size(len(self.power_flow))
+        for start in range(0, len(outages), block_size):
+            block = outages[start : start + block_size]
+            yield (block,) + self.get_lodf_block(block)
+
+    def rate_flows(self, rankings: list, flows: np.ndarray, excluded: np.ndarray, threshold: float):
+        """_summary_
+        Fills the rankings from the post-outage flows given as columns, the excluded branch of every
+        column, if any, being left out of its loadings.
+        """
+        power_flow = self.power_flow
+        with np.errstate(divide="ignore", invalid="ignore"):
+            loadings = np.abs(flows) / power_flow.limits[:, None]
+        loadings[excluded[excluded >= 0], np.flatnonzero(excluded >= 0)] = np.nan
+
+        excesses = np.nan_to_num(np.abs(flows) - threshold * power_flow.limits[:, None], nan=0.0)
+        severities = np.clip(excesses, 0.0, None).sum(axis=0)
+        nbr_overloads = (np.nan_to_num(loadings) > threshold).sum(axis=0)
+        has_limit = ~np.isnan(loadings).all(axis=0)
+        worst = np.argmax(np.nan_to_num(loadings, nan=-1.0), axis=0)
+
+        for column, ranking in enumerate(rankings):
+            ranking.severity = float(severities[column])
+            ranking.nbr_overloads = int(nbr_overloads[column])
+            if has_limit[column]:
+                ranking.max_loading = float(loadings[worst[column], column])
+                ranking.worst_branch_id = power_flow.branch_ids[worst[column]]
+
+    def get_islanding_flows(self, outages: np.ndarray, base_flows: np.ndarray) -> tuple:
+        """_summary_
+        Returns the post-outage flows of the given branches whose outage splits an island, as columns,
+        and the load cut off by each of them. Once split, each part of the island balances the flow it
+        exchanged through the branch with its own generators, in proportion to their participations,
+        which adds to the flows the response to the injections f (e_1 - p_1) - f (e_2 - p_2). A part
+        without generation is de-energized : its branches carry no flow and its load is lost.
+        """
+        power_flow = self.power_flow
+        columns = np.arange(len(outages))
+        buses_1, buses_2 = power_flow.branch_buses_1[outages], power_flow.branch_buses_2[outages]
+        exchanged = base_flows[outages]
+
+        # A transfer between the two ends of a bridge flows through it only, so every bus of a part has
+        # the angle of the end of the bridge on its side
+        angles = self.solve_angles(self.incidence[outages].T.toarray())
+        in_island = power_flow.islands[:, None] == power_flow.islands[buses_1]
+        sides_1 = in_island & (np.abs(angles - angles[buses_1, columns]) < np.abs(angles - angles[buses_2, columns]))
+        sides_2 = in_island & ~sides_1
+        del angles, in_island
+
+        rhs = np.zeros((power_flow.nbr_buses, len(outages)))
+        dead = np.zeros((power_flow.nbr_buses, len(outages)), dtype=bool)
+        lost_load = np.zeros(len(outages))
+        for sides, buses, flows in ((sides_1, buses_1, exchanged), (sides_2, buses_2, -exchanged)):
+            participations = power_flow.participations[:, None] * sides
+            totals = participations.sum(axis=0)
+            alive = totals > 0.0
+            rhs[buses, columns] += np.where(alive, flows, 0.0)
+            rhs -= participations * (np.where(alive, flows, 0.0) / np.where(alive, totals, 1.0))
+            dead |= sides & ~alive
+            lost_load += np.where(alive, 0.0, np.abs(flows))
+
+        flows = base_flows[:, None] + power_flow.susceptances[:, None] * (self.incidence @ self.solve_angles(rhs))
+        flows[dead[power_flow.branch_buses_1]] = 0.0
+        flows[outages, columns] = 0.0
+        return flows, lost_load
+
+    def get_islanding_bounds(
+        self, outages: np.ndarray, base_flows: np.ndarray, threshold: float, kth_loading: float = np.inf
+    ) -> tuple:
+        """_summary_
+        Returns upper bounds of the severity and of the maximal loading of the given outages splitting an
+        island, without solving them. Each part only takes the flow f_m it exchanged through the branch m
+        from its own generators, a transfer from the end b of m changing the flow of another branch l by
+        f_m (PTDF[l, b] - the PTDF of l averaged over the generators of the part), so at most by |f_m|.
+
+        The branches l that could be overloaded or loaded above kth_loading with that cap are the only
+        ones that can rank an outage. If they are fewer than the outages, their PTDF rows are solved,
+        the rows of the symmetric DC power flow being the solves of their own transfers, and their cap is
+        lowered to |f_m| max |PTDF[l, b] - PTDF[l, g]| over both ends b and the generator buses g.
+        """
+        power_flow = self.power_flow
+        exchanged = np.abs(base_flows[outages])
+        base = np.abs(base_flows)
+        block_size = self.get_block_size(len(power_flow))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            loose = (base + exchanged.max(initial=0.0)) / power_flow.limits
+            overloaded = base + exchanged.max(initial=0.0) > threshold * power_flow.limits
+            hot = np.flatnonzero((loose + BOUND_TOLERANCE >= kth_loading) | overloaded)
+        if len(hot) < len(outages) and len(hot) <= block_size:
+            cold_loading = np.nan_to_num(np.delete(loose, hot), nan=0.0).max(initial=0.0)
+            rows = power_flow.susceptances[hot, None] * self.solve_angles(self.incidence[hot].T.toarray()).T
+            generators = power_flow.participations > 0.0
+            lowest = rows[:, generators].min(axis=1, initial=0.0)[:, None]
+            highest = rows[:, generators].max(axis=1, initial=0.0)[:, None]
+            hot_base, hot_limits = base[hot, None], power_flow.limits[hot, None]
+
+            severities, loadings = np.empty(len(outages)), np.empty(len(outages))
+            for start in range(0, len(outages), self.get_block_size(len(hot))):
+                block = slice(start, start + self.get_block_size(len(hot)))
+                caps = np.zeros((len(hot), len(outages[block])))
+                for buses in (power_flow.branch_buses_1[outages[block]], power_flow.branch_buses_2[outages[block]]):
+                    caps = np.maximum(caps, np.maximum(rows[:, buses] - lowest, highest - rows[:, buses]))
+                bounds = hot_base + exchanged[block] * caps
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    excesses = np.nan_to_num(bounds - threshold * hot_limits, nan=0.0)
+                    severities[block] = np.clip(excesses, 0.0, None).sum(axis=0)
+                    loadings[block] = np.nan_to_num(bounds / hot_limits, nan=0.0).max(axis=0, initial=cold_loading)
+            return severities, loadings
+
+        # The severity bound sums |f_m| - v_l over the margins v_l = threshold * limit - |f_l| below |f_m|
+        margins = threshold * power_flow.limits - base
+        margins = np.sort(margins[np.isfinite(margins)])
+        counts = np.searchsorted(margins, exchanged)
+        severities = counts * exchanged - np.r_[0.0, np.cumsum(margins)][counts]
+
+        loadings = np.empty(len(outages))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for start in range(0, len(outages), block_size):
+                block = slice(start, start + block_size)
+                bounds = (base[:, None] + exchanged[block]) / power_flow.limits[:, None]
+                loadings[block] = np.nan_to_num(bounds, nan=0.0).max(axis=0)
+        return severities, loadings
+
+    def rank_islanding_outages(self, outages: np.ndarray, threshold: float = 1.0, base_flows=None) -> list:
+        """_summary_
+        Returns the OutageRanking of the outage of every given branch splitting an island, block by block.
+        """
+        power_flow = self.power_flow
+        base_flows = self.get_base_flows(base_flows)
+
+        rankings = []
+        block_size = self.get_block_size(len(power_flow))
+        for start in range(0, len(outages), block_size):
+            block = outages[start : start + block_size]
+            flows, lost_load = self.get_islanding_flows(block, base_flows)
+            block_rankings = [
+                OutageRanking(power_flow.branch_ids[branch], BRANCH_KINDS[power_flow.branch_kinds[branch]])
+                for branch in block
+            ]
+            for ranking, load in zip(block_rankings, lost_load):
+                ranking.islanding = True
+                ranking.lost_load = float(load)
+            self.rate_flows(block_rankings, flows, block, threshold)
+            rankings.extend(block_rankings)
+        return rankings
+
+    def get_base_flows(self, base_flows: np.ndarray = None) -> np.ndarray:
+        if base_flows is None:
+            _, base_flows = self.power_flow.solve(self.power_flow.get_injections())
+        return base_flows
+
+    def rank_branch_outages(
+        self, outages: np.ndarray = None, threshold: float = 1.0, base_flows=None, islanding_outages: list = None
+    ) -> list:
+        """_summary_
+        Returns the OutageRanking of the outage of every given branch, by default of all of them, in
+        the order of the branches. The post-outage flows are base_flows + LODF[:, m] * base_flows[m].
+        If a list is given as islanding_outages, the branches splitting an island are added to it and
+        left out of the rankings instead of being solved.
+        """
+        power_flow = self.power_flow
+        base_flows = self.get_base_flows(base_flows)
+
+        rankings = []
+        for block, lodf, islanding in self.iter_lodf(outages):
+            block_rankings = [
+                OutageRanking(power_flow.branch_ids[branch], BRANCH_KINDS[power_flow.branch_kinds[branch]])
+                for branch in block
+            ]
+            flows = base_flows[:, None] + np.nan_to_num(lodf) * base_flows[block]
+            del lodf
+            if islanding_outages is not None and islanding.any():
+                islanding_outages.extend(block[islanding])
+                block, flows = block[~islanding], flows[:, ~islanding]
+                block_rankings = [ranking for ranking, split in zip(block_rankings, islanding) if not split]
+            # The LODF of a branch splitting an island is undefined, its parts are solved apart
+            elif islanding.any():
+                flows[:, islanding], lost_load = self.get_islanding_flows(block[islanding], base_flows)
+                for column, load in zip(np.flatnonzero(islanding), lost_load):
+                    block_rankings[column].islanding = True
+                    block_rankings[column].lost_load = float(load)
+
+            self.rate_flows(block_rankings, flows, block, threshold)
+            rankings.extend(block_rankings)
+        return rankings
+
+    def rank_generator_outages(self, generators: np.ndarray = None, threshold: float = 1.0, base_flows=None) -> list:
+        """_summary_
+        Returns the OutageRanking of the outage of every given connected generator, by default of all of
+        them. The lost output, its targetP plus its share s = targetP / island targetP of the imbalance of
+        its island, is taken by the other generators in proportion to their participations.
+
+        The distributed PTDF of a bus shares the injection between all the generators of its island,
+        the disconnected one included. Without its share, the flows change by the distributed PTDF divided
+        by 1 - s. A generator holding the whole share leaves its island without generation, which is
+        de-energized.
+        """
+        power_flow = self.power_flow
+        base_flows = self.get_base_flows(base_flows)
+        table = power_flow.tables.generators
+        connected = np.flatnonzero(table["bus"] >= 0)
+        generators = connected if generators is None else np.intersect1d(generators, connected)
+        buses = power_flow.reduction.reduced_buses[table["bus"][generators]]
+        targets = np.nan_to_num(table["active_power_target"][generators])
+
+        # The same shares as the participations of the power flow, by generator
+        all_targets = np.clip(np.nan_to_num(table["active_power_target"]), 0.0, None)
+        island_targets = power_flow.get_island_sums(power_flow.generator_incidence @ all_targets)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            shares = np.nan_to_num(all_targets[generators] / island_targets[power_flow.islands[buses]])
+        loads = np.nan_to_num(power_flow.tables.loads["active_power_setpoint"])
+        island_loads = power_flow.get_island_sums(power_flow.load_incidence @ loads)
+        imbalances = power_flow.get_imbalances(power_flow.get_injections())
+        outputs = targets + shares * imbalances[power_flow.islands[buses]]
+
+        rankings = []
+        block_size = self.get_block_size(len(power_flow))
+        for start in range(0, len(generators), block_size):
+            block = slice(start, start + block_size)
+            remaining = 1.0 - shares[block]
+            blackout = remaining < ISLANDING_TOLERANCE
+            ptdf = self.get_ptdf_block(buses[block], distributed=True)
+            flows = base_flows[:, None] - ptdf * (outputs[block] / np.where(blackout, 1.0, remaining))
+            del ptdf
+
+            block_rankings = [OutageRanking(table.ids[row], "generator") for row in generators[block]]
+            for column in np.flatnonzero(blackout):
+                island = power_flow.islands[buses[block][column]]
+                flows[:, column] = np.where(power_flow.islands[power_flow.branch_buses_1] == island, 0.0, base_flows)
+                block_rankings[column].lost_load = float(island_loads[island])
+            self.rate_flows(block_rankings, flows, np.full(len(block_rankings), -1), threshold)
+            rankings.extend(block_rankings)
+        return rankings
+
+    def get_top_outages(
+        self, top_k: int, threshold: float = 1.0, kinds: tuple = ("line", "transformer"), element_ids: set = None
+    ) -> list:
+        """_summary_
+        Returns the OutageRanking of the top_k most severe outages of the given kinds, only among the
+        given elements if element_ids is given. They are sorted by decreasing severity, which the
+        islanding outages get from the overloads of the parts they leave, then by decreasing maximal
+        loading. The load an outage cuts off is reported in its lost_load, it does not rank it.
+
+        The outages splitting an island need their own solves, so they are ranked last, by decreasing
+        bound, and those whose bound cannot reach the top_k already found are not solved.
+        """
+        power_flow = self.power_flow
+        base_flows = self.get_base_flows()
+        rankings = []
+
+        branch_kinds = [code for code, kind in enumerate(BRANCH_KINDS) if kind in kinds]
+        outages = np.isin(power_flow.branch_kinds, branch_kinds)
+        if element_ids is not None:
+            outages &= np.array([branch_id in element_ids for branch_id in power_flow.branch_ids], dtype=bool)
+        islanding_outages = []
+        if outages.any():
+            outages = np.flatnonzero(outages)
+            rankings.extend(self.rank_branch_outages(outages, threshold, base_flows, islanding_outages))
+
+        if "generator" in kinds:
+            generator_ids = power_flow.tables.generators.ids
+            generators = np.arange(len(generator_ids))
+            if element_ids is not None:
+                generators = generators[[generator_id in element_ids for generator_id in generator_ids]]
+            if len(generators):
+                rankings.extend(self.rank_generator_outages(generators, threshold, base_flows))
+        rankings = select_top(rankings, top_k)
+
+        candidates = np.array(islanding_outages, dtype=int)
+        kth_loading = get_scores(rankings)[1][-1] if 0 < top_k == len(rankings) else np.inf
+        severity_bounds, loading_bounds = self.get_islanding_bounds(candidates, base_flows, threshold, kth_loading)
+        order = np.lexsort((-loading_bounds, -severity_bounds))
+        candidates, severity_bounds, loading_bounds = candidates[order], severity_bounds[order], loading_bounds[order]
+        block_size = self.get_block_size(len(power_flow))
+        while len(candidates) and top_k > 0:
+            if len(rankings) == top_k:
+                kth_severity, kth_loading = (scores[-1] for scores in get_scores(rankings))
+                # The severities closer than the tolerance are ties, ranked by their loadings
+                reachable = (severity_bounds > kth_severity + BOUND_TOLERANCE) | (
+                    (severity_bounds + BOUND_TOLERANCE >= kth_severity)
+                    & (loading_bounds + BOUND_TOLERANCE >= kth_loading)
+                )
+                candidates, severity_bounds = candidates[reachable], severity_bounds[reachable]
+                loading_bounds = loading_bounds[reachable]
+            block, candidates = candidates[:block_size], candidates[block_size:]
+            severity_bounds, loading_bounds = severity_bounds[block_size:], loading_bounds[block_size:]
+            rankings = select_top(rankings + self.rank_islanding_outages(block, threshold, base_flows), top_k)
+        return rankings
@@ -0,0 +1,236 @@
+"""
+Electrical connectivity of the static network: the adjacency of the buses and their islands.
+
+    python -m cycosim topology case_folder
+    python -m cycosim topology network.iidm --output islands.json
+"""
+import os
+import json
+import time
+import argparse
+
+import numpy as np
+
+from cycosim.domain.models.power_system import BaseComponent
+from cycosim.utils.union_find import union_edges, get_labels
+
+from cycosim.services.input_files.global_parser import DynawoGlobalParser
+from cycosim.services.power_system.network_tables import NetworkTables
+
+# The tables whose components join two buses, in the order of their branch kind code
+BRANCH_FLAGS = ("line", "twoWindingsTransformer", "switch")
+
+
+class Topology:
+    """_summary_
+    Connectivity of the buses of a network, computed from the rows of its NetworkTables. The branches
+    are the lines, the transformers and the closed switches connected on both sides. The adjacency is
+    held in CSR arrays (compressed sparse rows) : the neighbours of the bus b are
+    indices[indptr[b]:indptr[b + 1]], joined by the branches branches[indptr[b]:indptr[b + 1]].
+
+    Attributes:
+        tables (NetworkTables) : The tables the topology has been computed from.
+        nbr_buses (int) : The number of buses.
+        branch_buses_1 (np.ndarray) : The first bus of every branch.
+        branch_buses_2 (np.ndarray) : The second bus of every branch.
+        branch_kinds (np.ndarray) : The index of the flag of every branch in BRANCH_FLAGS.
+        branch_rows (np.ndarray) : The row of every branch in the table of its flag.
+        indptr (np.ndarray) : The start of the neighbours of every bus in 'indices', plus the end.
+        indices (np.ndarray) : The neighbour buses of every bus, grouped by bus.
+        branches (np.ndarray) : The branch joining every bus to each of its neighbours.
+        nbr_islands (int) : The number of islands, an isolated bus being an island.
+        islands (np.ndarray) : The island of every bus, numbered from 0 in the order of their first bus.
+    """
+
+    def __init__(self, _tables: NetworkTables):
+        self.tables = _tables
+        self.nbr_buses = len(_tables.buses)
+
+        buses_1, buses_2, kinds, rows = [], [], [], []
+        for kind, flag_name in enumerate(BRANCH_FLAGS):
+            table = _tables.tables[flag_name]
+            connected = (table["bus_1"] >= 0) & (table["bus_2"] >= 0)
+            if flag_name == "switch":
+                connected &= ~table["is_open"]
+            branch_rows = np.flatnonzero(connected).astype(np.int32)
+            buses_1.append(table["bus_1"][branch_rows])
+            buses_2.append(table["bus_2"][branch_rows])
+            kinds.append(np.full(len(branch_rows), kind, dtype=np.int8))
+            rows.append(branch_rows)
+
+        self.branch_buses_1 = np.concatenate(buses_1)
+        self.branch_buses_2 = np.concatenate(buses_2)
+        self.branch_kinds = np.concatenate(kinds)
+        self.branch_rows = np.concatenate(rows)
+
+        self.build_adjacency()
+        self.find_islands()
+
+    @classmethod
+    def from_network(cls, network: BaseComponent):
+        return cls(NetworkTables(network))
+
+    def __len__(self):
+        return len(self.branch_rows)
+
+    def build_adjacency(self):
+        """_summary_
+        Builds the CSR arrays, every branch being stored once from each of its ends.
+        """
+        starts = np.concatenate([self.branch_buses_1, self.branch_buses_2])
+        ends = np.concatenate([self.branch_buses_2, self.branch_buses_1])
+        branches = np.tile(np.arange(len(self), dtype=np.int32), 2)
+
+        order = np.argsort(starts, kind="stable")
+        self.indices = ends[order]
+        self.branches = branches[order]
+        self.indptr = np.zeros(self.nbr_buses + 1, dtype=np.int64)
+        np.cumsum(np.bincount(starts, minlength=self.nbr_buses), out=self.indptr[1:])
+
+    def find_islands(self):
+        roots = union_edges(np.arange(self.nbr_buses), self.branch_buses_1, self.branch_buses_2)
+        self.nbr_islands, self.islands = get_labels(roots)
+
+    def get_degrees(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def get_neighbours(self, bus_row: int) -> np.ndarray:
+        return self.indices[self.indptr[bus_row] : self.indptr[bus_row + 1]]
+
+    def get_island_buses(self, island: int) -> list:
+        """_summary_
+        Returns the ids of the buses of the island.
+        """
+        bus_ids = self.tables.buses.ids
+        return [bus_ids[row] for row in np.flatnonzero(self.islands == island)]
+
+    def get_injection_islands(self, flag_name: str) -> np.ndarray:
+        """_summary_
+        Returns the island of every generator or load, -1 for those which are not connected.
+        """
+        bus_rows = self.tables.tables[flag_name]["bus"]
+        return np.where(bus_rows >= 0, self.islands[np.maximum(bus_rows, 0)], -1)
+
+    def get_summary(self) -> dict:
+        """_summary_
+        Returns, as arrays indexed by island, the number of buses, branches, generators and loads of
+        every island, its generation and load targets, and whether it is energized, that is whether
+        it holds a connected generator. The main island is the one with the most buses.
+        """
+        nbr_islands = self.nbr_islands
+        summary = {
+            "buses": np.bincount(self.islands, minlength=nbr_islands),
+            "branches": np.bincount(self.islands[self.branch_buses_1], minlength=nbr_islands),
+        }
+        for name, flag_name, attribute in (
+            ("generation", "generator", "active_power_target"),
+            ("load", "load", "active_power_setpoint"),
+        ):
+            islands = self.get_injection_islands(flag_name)
+            connected = islands >= 0
+            values = np.nan_to_num(self.tables.tables[flag_name][attribute][connected])
+            summary[f"{flag_name}s"] = np.bincount(islands[connected], minlength=nbr_islands)
+            summary[name] = np.bincount(islands[connected], weights=values, minlength=nbr_islands)
+
+        summary["energized"] = summary["generators"] > 0
+        summary["main_island"] = int(np.argmax(summary["buses"])) if nbr_islands else -1
+        return summary
+
+    def get_disconnected_buses(self) -> list:
+        """_summary_
+        Returns the ids of the buses out of the main island.
+        """
+        if self.nbr_islands < 2:
+            return []
+        main_island = int(np.argmax(np.bincount(self.islands)))
+        bus_ids = self.tables.buses.ids
+        return [bus_ids[row] for row in np.flatnonzero(self.islands != main_island)]
+
+
+def get_summary_lines(topology: Topology, max_islands: int = 20) -> list:
+    """_summary_
+    Returns the lines printing the summary of the islands, the largest ones first.
+    """
+    summary = topology.get_summary()
+    lines = [
+        f"{topology.nbr_buses} buses, {len(topology)} branches, {topology.nbr_islands} islands, "
+        f"{int((~summary['energized']).sum())} without generator"
+    ]
+    order = np.argsort(-summary["buses"], kind="stable")
+    for island in order[:max_islands]:
+        first_bus = topology.tables.buses.ids[int(np.argmax(topology.islands == island))]
+        lines.append(
+            f"  island {island:<6} {summary['buses'][island]:>8} buses {summary['branches'][island]:>8} branches "
+            f"{summary['generators'][island]:>6} generators {summary['loads'][island]:>6} loads "
+            f"{summary['generation'][island]:>12.1f} MW generated {summary['load'][island]:>12.1f} MW consumed "
+            f"(first bus {first_bus}{'' if summary['energized'][island] else ', not energized'})"
+        )
+    if topology.nbr_islands > max_islands:
+        lines.append(f"  ... {topology.nbr_islands - max_islands} other islands")
+    return lines
+
+
+def get_iidm_file(path: str) -> str:
+    """_summary_
+    Returns the IIDM file of the path, given by the first JOBS file of the folder if the path is a case folder.
+    """
+    if not os.path.isdir(path):
+        return path
+
+    for file in sorted(os.listdir(path)):
+        if file.endswith(".jobs"):
+            return os.path.join(path, DynawoGlobalParser(os.path.join(path, file)).parse().iidm_file)
+    raise FileNotFoundError(f"No JOBS file in the directory '{path}'.")
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(
+        prog="cycosim topology", description="Prints the islands of the network of an IIDM file or of a case folder."
+    )
+    parser.add_argument("path", help="The IIDM file (.iidm, .xiidm, .jiidm, .biidm) or the case folder.")
+    parser.add_argument("--max_islands", help="The number of islands printed.", type=int, default=20)
+    parser.add_argument("--output", help="Also write the summary of every island in the given JSON file.")
+    parser.add_argument("--reduce", help="Also print the bus-branch reduction of the network.", action="store_true")
+    args = parser.parse_args(argv)
+
+    network = DynawoGlobalParser(get_iidm_file(args.path), _compact=True).parse()
+    start = time.perf_counter()
+    topology = Topology.from_network(network)
+    wall_time = time.perf_counter() - start
+
+    for line in get_summary_lines(topology, args.max_islands):
+        print(line)
+    print(f"Topology computed in {wall_time:.3f} s.")
+
+    if args.reduce:
+        from cycosim.services.power_system.bus_reduction import BusReduction
+
+        start = time.perf_counter()
+        reduction = BusReduction(topology.tables)
+        branches = reduction.get_branches()
+        print(
+            f"Bus-branch reduction : {reduction.nbr_buses} buses merged in {reduction.nbr_reduced_buses} "
+            f"reduced buses, {sum(len(rows) for rows, _, _ in branches.values())} branches kept, "
+            f"computed in {time.perf_counter() - start:.3f} s."
+        )
+
+    if args.output is not None:
+        summary = topology.get_summary()
+        with open(args.output, "w") as out_file:
+            json.dump(
+                {
+                    "main_island": summary.pop("main_island"),
+                    "islands": [
+                        {name: values[island].item() for name, values in summary.items()}
+                        for island in range(topology.nbr_islands)
+                    ],
+                    "disconnected_buses": topology.get_disconnected_buses(),
+                },
+                out_file,
+                indent=2,
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1 +1,24 @@
-from .parsing_tools import remove_superfluous  # noqa
+from .lazy_loading import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "remove_superfluous": ".parsing_tools",
+        "strip_namespace": ".parsing_tools",
+        "XMLEventReader": ".parsing_tools",
+        "dump_object": ".pickling_tools",
+        "load_object": ".pickling_tools",
+        "hash_file": ".file_tools",
+        "open_output_file": ".file_tools",
+        "OutputManifest": ".file_tools",
+        "get_model_digest": ".file_tools",
+        "serialize_output": ".file_tools",
+        "Profiler": ".profiling",
+        "get_profiler": ".profiling",
+        "profile_stage": ".profiling",
+        "profiled": ".profiling",
+        "AdapterRegistry": ".registry",
+        "union_edges": ".union_find",
+        "get_labels": ".union_find",
+    },
+)
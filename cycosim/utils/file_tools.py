@@ -0,0 +1,139 @@
+import os
+import json
+import uuid
+import hashlib
+from contextlib import contextmanager
+
+MANIFEST_NAME = ".manifest.json"
+
+# Must be increased every time the file serialized from a model changes
+MANIFEST_VERSION = 2
+
+
+def hash_file(file: str) -> str:
+    """_summary_
+    Returns the sha256 hash of the content of the given file.
+    """
+    file_hash = hashlib.sha256()
+    with open(file, "rb") as in_file:
+        for chunk in iter(lambda: in_file.read(1024 * 1024), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+class OutputManifest:
+    """_summary_
+    Keeps, for every file written in a folder, the digest of the model it has been serialized from
+    along with its size and modification time when it was written. A file whose model has the same
+    digest and which has not been modified since is not serialized again.
+
+    The manifest is stored in the '.manifest.json' file of the folder.
+
+    Attributes:
+        directory (str) : The folder of the written files.
+        files (dict) : For every file name, its 'digest', 'size' and 'mtime_ns'.
+        nbr_written (int) : The number of files written since the manifest has been loaded.
+        nbr_skipped (int) : The number of files left untouched since the manifest has been loaded.
+    """
+
+    def __init__(self, _directory: str):
+        self.directory = _directory
+        self.files = {}
+        self.nbr_written = 0
+        self.nbr_skipped = 0
+
+        path = os.path.join(self.directory, MANIFEST_NAME)
+        if os.path.isfile(path):
+            try:
+                with open(path, "r", encoding="utf-8") as in_file:
+                    content = json.load(in_file)
+                if content["version"] == MANIFEST_VERSION:
+                    self.files = content["files"]
+            except (ValueError, KeyError):
+                # An unreadable manifest only means that every file is written again
+                self.files = {}
+
+    def get_name(self, path: str) -> str:
+        return os.path.relpath(path, self.directory)
+
+    def is_up_to_date(self, path: str, digest: str) -> bool:
+        """_summary_
+        Returns True if the file at the given path has been serialized from a model of the given digest.
+        """
+        entry = self.files.get(self.get_name(path))
+        if digest is None or entry is None or entry["digest"] != digest:
+            return False
+
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return False
+        return stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]
+
+    def update(self, path: str, digest: str):
+        stat = os.stat(path)
+        self.files[self.get_name(path)] = {"digest": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def save(self):
+        """_summary_
+        Writes the manifest in its folder.
+        """
+        with open_output_file(os.path.join(self.directory, MANIFEST_NAME)) as out_file:
+            json.dump({"version": MANIFEST_VERSION, "files": self.files}, out_file, indent=2, sort_keys=True)
+
+
+def get_model_digest(*parts) -> str:
+    """_summary_
+    Returns the digest of a model from the strings describing it, such as the key of the parsed file
+    it comes from and the elements added to it since. If any part is None, the model can not be
+    described and None is returned, so that its file is always written.
+    """
+    if any(part is None for part in parts):
+        return None
+    return hashlib.sha256("|".join(map(str, parts)).encode("utf-8")).hexdigest()
+
+
+def serialize_output(serializer, digest: str = None, manifest: OutputManifest = None) -> bool:
+    """_summary_
+    Calls the serializer unless the manifest states that its output file has been serialized from
+    a model of the same digest and has not been modified since, so that an unchanged model is
+    neither serialized nor hashed again.
+
+    Args:
+        serializer: The serializer of the model, with its 'output_path' and its 'serialize' method.
+        digest (str): The digest of the serialized model, None if it is not known.
+        manifest (OutputManifest): The manifest of the folder of the file, None to always write the file.
+
+    Returns:
+        bool : Whether the file has been written.
+    """
+    if manifest is not None and manifest.is_up_to_date(serializer.output_path, digest):
+        manifest.nbr_skipped += 1
+        return False
+
+    serializer.serialize()
+    if manifest is not None:
+        manifest.update(serializer.output_path, digest)
+        manifest.nbr_written += 1
+    return True
+
+
+@contextmanager
+def open_output_file(path: str, binary: bool = False):
+    """_summary_
+    Opens a temporary file to write in, which replaces the file at the given path once closed,
+    so that the file at the given path is never seen half-written.
+
+    Args:
+        path (str): The path of the file to write
+        binary (bool): Whether the file is opened in binary mode instead of text mode.
+    """
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, "xb") if binary else open(tmp_path, "x", encoding="utf-8") as out_file:
+            yield out_file
+
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -0,0 +1,32 @@
+import sys
+import importlib
+
+
+def lazy_attributes(package: str, attributes: dict) -> tuple:
+    """_summary_
+    Returns the module level __getattr__ and __dir__ functions (PEP 562) of a package whose
+    attributes are only imported from their module when they are first accessed, so that importing
+    the package does not import every adapter and its dependencies. Once imported, the attribute is
+    stored in the package, and the next accesses do not go through __getattr__ anymore.
+
+    Args:
+        package (str): The name of the package, __name__ in its __init__ file.
+        attributes (dict): The module of every attribute, relative to the package ('.iidm_parser').
+
+    Returns:
+        tuple : The __getattr__ and __dir__ functions of the package.
+    """
+
+    def __getattr__(name: str):
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+        val = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, val)
+        return val
+
+    def __dir__() -> list:
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
@@ -1,3 +1,6 @@
+from xml.etree.ElementTree import iterparse
+
+
 def remove_superfluous(xml_dict: dict, to_remove: list[str]):
     """_summary_
     Return the given dictionary where the key values have been freed from the
@@ -28,3 +31,102 @@ def remove_superfluous(xml_dict: dict, to_remove: list[str]):
 
             light_dict[key] = val
     return light_dict
+
+
+def strip_namespace(name: str):
+    """_summary_
+    Return the given xml tag or attribute name without its namespace, whether it is
+    written as a prefix ('iidm:bus') or in the expanded form ('{http://...}bus').
+
+    Args:
+        name (str): The name to clean
+
+    Returns:
+        (str): The local name
+    """
+    if name[0] == "{":
+        return name[name.index("}") + 1 :]
+    return name[name.find(":") + 1 :]
+
+
+class XMLEventReader:
+    """_summary_
+    Reads an xml file as a stream of events and calls the callbacks registered for the local
+    name of every element, when the element opens and when it closes. The namespaces and the
+    prefixes are removed from the tags and the attribute names while reading, and each element is
+    freed once closed, so the whole document is never held in memory, whatever its size.
+    The repeated elements are thus handled one by one, in the order of the document.
+
+    The callbacks are called with the local name of the element and its attributes. The namespaces
+    declared by an element are given among its attributes, as 'xmlns' or 'xmlns:prefix'.
+
+    Attributes:
+        xml_source : The path or the binary stream of the file to read.
+        start_callbacks (dict) : The function called when an element opens, by local name.
+        end_callbacks (dict) : The function called when an element closes, by local name.
+        path (list) : The local names of the elements currently open, from the root.
+    """
+
+    def __init__(self, _xml_source):
+        self.xml_source = _xml_source
+        self.start_callbacks = {}
+        self.end_callbacks = {}
+        self.path = []
+
+    def on_start(self, tag: str, callback):
+        """_summary_
+        Registers the function called with (tag, attributes) when an element opens.
+        If tag is None, the function is called for the elements without any callback of their own.
+        A None callback makes the elements of the given tag ignored.
+        """
+        self.start_callbacks[tag] = callback
+
+    def on_end(self, tag: str, callback):
+        """_summary_
+        Registers the function called with (tag, attributes) when an element closes.
+        If tag is None, the function is called for the elements without any callback of their own.
+        """
+        self.end_callbacks[tag] = callback
+
+    def get_parent(self) -> str:
+        """_summary_
+        Returns the local name of the parent of the current element, None for the root.
+        """
+        return self.path[-2] if len(self.path) > 1 else None
+
+    def read(self):
+        namespaces = {}
+        stack = []
+        default_start = self.start_callbacks.get(None)
+        default_end = self.end_callbacks.get(None)
+
+        for event, elem in iterparse(self.xml_source, events=("start-ns", "start", "end")):
+            if event == "start-ns":
+                prefix, uri = elem
+                namespaces["xmlns:" + prefix if prefix else "xmlns"] = uri
+                continue
+
+            tag = strip_namespace(elem.tag)
+            if event == "start":
+                attributes = namespaces
+                namespaces = {}
+                for key, val in elem.attrib.items():
+                    attributes[strip_namespace(key)] = val
+
+                self.path.append(tag)
+                stack.append((elem, attributes))
+                callback = self.start_callbacks.get(tag, default_start)
+                if callback is not None:
+                    callback(tag, attributes)
+
+            else:
+                _, attributes = stack.pop()
+                callback = self.end_callbacks.get(tag, default_end)
+                if callback is not None:
+                    callback(tag, attributes)
+                self.path.pop()
+
+                # The closed element is the last child of its parent, so removing it is immediate
+                elem.clear()
+                if stack:
+                    stack[-1][0].remove(elem)
@@ -0,0 +1,30 @@
+import gc
+import pickle
+
+
+def dump_object(obj) -> bytes:
+    """_summary_
+    Return the given object pickled with the fastest available protocol.
+    """
+    return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_object(data: bytes):
+    """_summary_
+    Return the object pickled in the given bytes. The garbage collector is paused while
+    the objects are rebuilt, as it slows down a lot the loading of large object trees
+    without having anything to collect.
+
+    Args:
+        data (bytes): The pickled object
+
+    Returns:
+        The unpickled object
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(data)
+    finally:
+        if gc_enabled:
+            gc.enable()
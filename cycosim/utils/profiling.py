@@ -0,0 +1,178 @@
+import sys
+import json
+import time
+import platform
+import functools
+import tracemalloc
+from contextlib import contextmanager
+
+BYTES_PER_MB = 1024 * 1024
+
+# The profiler collecting the measures, None when the profiling is disabled
+active_profiler = None
+
+
+def get_profiler():
+    return active_profiler
+
+
+def new_measure() -> dict:
+    return {"calls": 0, "wall_time": 0.0, "cpu_time": 0.0, "peak_memory_mb": 0.0}
+
+
+class Profiler:
+    """_summary_
+    Collects the wall time, the cpu time and the peak memory of the stages of a run and of
+    every file parsed or serialized. The files are measured by the Parser and Serializer
+    ports, so every adapter inheriting from them is measured without any change.
+
+    The peak memory is the maximum of the memory allocated by Python during a measure,
+    as traced by tracemalloc. The measures can be nested, a stage containing the files
+    handled during it.
+
+    Attributes:
+        trace_memory (bool) : Whether the peak memory is measured, which slows the run down.
+        stages (dict) : The measures accumulated for every stage name.
+        files (list) : The measure of every parse or serialize call.
+        current_stages (list) : The names of the stages being measured.
+    """
+
+    def __init__(self, _trace_memory: bool = True):
+        self.trace_memory = _trace_memory
+        self.stages = {}
+        self.files = []
+        self.current_stages = []
+        self.running_peaks = []
+        self.depth = 0
+        self.started_tracing = False
+
+    def start(self):
+        """_summary_
+        Makes this profiler the one used by the ports and starts tracing the memory.
+        """
+        global active_profiler
+        active_profiler = self
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+
+    def stop(self):
+        global active_profiler
+        active_profiler = None
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    @contextmanager
+    def measure(self, result: dict):
+        """_summary_
+        Adds the wall time, the cpu time and the peak memory of the enclosed code to the given measure.
+        """
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # The peak of the enclosing measure is kept before the tracemalloc peak is reset
+            if self.running_peaks:
+                self.running_peaks[-1] = max(self.running_peaks[-1], peak)
+            tracemalloc.reset_peak()
+            self.running_peaks.append(current)
+
+        self.depth += 1
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield result
+        finally:
+            self.depth -= 1
+            result["calls"] += 1
+            result["wall_time"] += time.perf_counter() - start_wall
+            result["cpu_time"] += time.process_time() - start_cpu
+
+            if self.trace_memory:
+                peak = max(tracemalloc.get_traced_memory()[1], self.running_peaks.pop())
+                if self.running_peaks:
+                    self.running_peaks[-1] = max(self.running_peaks[-1], peak)
+                result["peak_memory_mb"] = max(result["peak_memory_mb"], peak / BYTES_PER_MB)
+
+    @contextmanager
+    def stage(self, name: str):
+        """_summary_
+        Measures the enclosed code as a part of the given stage. The measures of the
+        stages entered several times are accumulated.
+        """
+        self.current_stages.append(name)
+        try:
+            with self.measure(self.stages.setdefault(name, new_measure())):
+                yield
+        finally:
+            self.current_stages.pop()
+
+    @contextmanager
+    def file(self, operation: str, adapter: str, path: str):
+        """_summary_
+        Measures the parsing or the serialization of a file by the given adapter.
+        """
+        result = new_measure()
+        result.update(
+            {
+                "operation": operation,
+                "adapter": adapter,
+                "file": path,
+                "stage": self.current_stages[-1] if self.current_stages else None,
+                "depth": self.depth,
+            }
+        )
+        self.files.append(result)
+        with self.measure(result):
+            yield
+
+    def get_report(self) -> dict:
+        return {
+            "metadata": {
+                "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "command": sys.argv,
+                "trace_memory": self.trace_memory,
+            },
+            "stages": self.stages,
+            "files": self.files,
+        }
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as out_file:
+            json.dump(self.get_report(), out_file, indent=2)
+
+
+@contextmanager
+def profile_stage(name: str):
+    """_summary_
+    Measures the enclosed code as a part of the given stage if a profiler is running,
+    does nothing otherwise.
+    """
+    if active_profiler is None:
+        yield
+    else:
+        with active_profiler.stage(name):
+            yield
+
+
+def profiled(operation: str, get_file):
+    """_summary_
+    Decorator measuring every call of a parse or serialize method when a profiler is running.
+
+    Args:
+        operation (str): The name of the measured operation.
+        get_file: Function returning the path of the handled file from the adapter.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if active_profiler is None:
+                return method(self, *args, **kwargs)
+            with active_profiler.file(operation, type(self).__name__, get_file(self)):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
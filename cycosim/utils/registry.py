@@ -0,0 +1,54 @@
+import importlib
+
+
+class AdapterRegistry:
+    """_summary_
+    Maps keys, such as file types or simulator names, to the adapter classes handling them.
+    The adapters are given by the path of their class, 'package.module:ClassName', and their
+    module is only imported when the adapter is first requested, so that a run only imports
+    the adapters it uses.
+
+    Attributes:
+        name (str) : The kind of adapters registered, used in the error messages.
+        paths (dict) : The path of the class of every key.
+        options (dict) : The names of the options given to the constructor of every adapter,
+                         after its mandatory arguments.
+        classes (dict) : The classes already imported, by key.
+    """
+
+    def __init__(self, _name: str):
+        self.name = _name
+        self.paths = {}
+        self.options = {}
+        self.classes = {}
+
+    def __contains__(self, key) -> bool:
+        return key in self.paths
+
+    def register(self, key, path: str, options: tuple = ()):
+        """_summary_
+        Registers the adapter of the given key, replacing the previous one if any.
+        """
+        self.paths[key] = path
+        self.options[key] = options
+        self.classes.pop(key, None)
+
+    def get_names(self) -> list:
+        return list(self.paths)
+
+    def get_options(self, key) -> tuple:
+        return self.options[key]
+
+    def get(self, key):
+        """_summary_
+        Returns the adapter class of the given key, importing its module on the first call.
+        Raises a KeyError if no adapter has been registered for the key.
+        """
+        cls = self.classes.get(key)
+        if cls is None:
+            if key not in self.paths:
+                raise KeyError(f"No {self.name} registered for '{key}'. The registered ones are : {self.get_names()}")
+
+            module_name, class_name = self.paths[key].split(":")
+            cls = self.classes[key] = getattr(importlib.import_module(module_name), class_name)
+        return cls
@@ -0,0 +1,54 @@
+import numpy as np
+
+
+def compress(parent: np.ndarray) -> np.ndarray:
+    """_summary_
+    Makes every node of the forest point directly to its root, by pointer jumping.
+    """
+    while True:
+        grand_parent = parent[parent]
+        if np.array_equal(grand_parent, parent):
+            return parent
+        parent = grand_parent
+
+
+def union_edges(parent: np.ndarray, nodes_1: np.ndarray, nodes_2: np.ndarray) -> np.ndarray:
+    """_summary_
+    Vectorized union-find : merges the sets of the two ends of every edge and returns the parent
+    array where every node points to the smallest node of its set. Each round hooks the roots of the
+    edges joining two sets on the smaller root, in O(n + m) for n nodes and m edges, then compresses
+    the paths by pointer jumping, each pass being O(n) and halving the depth of the trees, hence
+    O(n log n). A round thus costs O((n + m) log n), and the rounds stop once no edge joins two sets.
+    The parent array given must already point to the roots.
+
+    Args:
+        parent (np.ndarray): The root of every node, np.arange(nbr_nodes) for singletons.
+        nodes_1 (np.ndarray): The first end of every edge.
+        nodes_2 (np.ndarray): The second end of every edge.
+
+    Returns:
+        np.ndarray : The root of every node once the edges are merged.
+    """
+    parent = parent.copy()
+    while len(nodes_1):
+        roots_1, roots_2 = parent[nodes_1], parent[nodes_2]
+        joining = roots_1 != roots_2
+        if not joining.any():
+            break
+        roots_1, roots_2 = roots_1[joining], roots_2[joining]
+        nodes_1, nodes_2 = nodes_1[joining], nodes_2[joining]
+
+        # The larger root is hooked, so no cycle can appear
+        np.minimum.at(parent, np.maximum(roots_1, roots_2), np.minimum(roots_1, roots_2))
+        parent = compress(parent)
+    return parent
+
+
+def get_labels(roots: np.ndarray) -> tuple:
+    """_summary_
+    Returns the number of sets and the label of every node, the sets being numbered from 0
+    in the order of their smallest node.
+    """
+    is_root = roots == np.arange(len(roots))
+    labels_of_roots = np.cumsum(is_root) - 1
+    return int(is_root.sum()), labels_of_roots[roots].astype(np.int32)
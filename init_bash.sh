@@ -40,6 +40,8 @@ apt-get update && apt-get install -y \
     libxml2-utils \
     python3-lxml \
     python3-psutil \
+    python3-numpy \
+    python3-scipy \
     wget \
     libcurl4-openssl-dev \
     rsync \
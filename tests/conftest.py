@@ -0,0 +1,23 @@
+import pytest
+
+from cycosim.benchmarks.grid_generator import generate_grid
+from cycosim.services.input_files.global_parser import DynawoGlobalParser
+from cycosim.services.power_system.network_tables import NetworkTables
+
+# The number of buses of the generated grid shared by the tests
+GRID_SIZE = 120
+
+
+@pytest.fixture(scope="session")
+def grid_paths(tmp_path_factory) -> dict:
+    return generate_grid(str(tmp_path_factory.mktemp("grid")), GRID_SIZE)
+
+
+@pytest.fixture
+def network(grid_paths):
+    return DynawoGlobalParser(grid_paths["iidm"], _compact=True).parse()
+
+
+@pytest.fixture
+def tables(network) -> NetworkTables:
+    return NetworkTables(network)
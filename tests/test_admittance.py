@@ -0,0 +1,117 @@
+import shutil
+
+import numpy as np
+import pytest
+
+from cycosim.services.input_files.global_parser import DynawoGlobalParser
+from cycosim.services.input_files.parse_cache import ParseCache
+from cycosim.services.power_system.network_tables import NetworkTables
+from cycosim.services.power_system.admittance import AdmittanceMatrix, S_BASE
+
+
+def get_reference_matrix(tables: NetworkTables, admittance: AdmittanceMatrix) -> np.ndarray:
+    """_summary_
+    Returns the dense per-unit admittance matrix, built branch by branch.
+    """
+    matrix = np.zeros((admittance.nbr_buses, admittance.nbr_buses), dtype=complex)
+    nominal_V = tables.nominal_V
+    for table in (tables.lines, tables.transformers):
+        for row in range(len(table)):
+            bus_1, bus_2 = table["bus_1"][row], table["bus_2"][row]
+            if bus_1 < 0 or bus_2 < 0:
+                continue
+            y = 1.0 / (table["resistance"][row] + 1j * table["reactance"][row])
+            if table is tables.lines:
+                y_11 = y + table["half_shunt_conductance"][row] + 1j * table["half_shunt_susceptance"][row]
+                y_22 = y + table["half_shunt_conductance_2"][row] + 1j * table["half_shunt_susceptance_2"][row]
+                y_12 = -y
+            else:
+                ratio = table["rated_voltage_2"][row] / table["rated_voltage_1"][row]
+                y_m = np.nan_to_num(table["magnetizing_conductance"][row] + 1j * table["magnetizing_susceptance"][row])
+                y_11, y_12, y_22 = ratio**2 * (y + y_m), -ratio * y, y
+
+            V_1, V_2 = nominal_V[bus_1], nominal_V[bus_2]
+            reduced_1, reduced_2 = admittance.reduced_buses[bus_1], admittance.reduced_buses[bus_2]
+            matrix[reduced_1, reduced_1] += y_11 * V_1 * V_1 / S_BASE
+            matrix[reduced_1, reduced_2] += y_12 * V_1 * V_2 / S_BASE
+            matrix[reduced_2, reduced_1] += y_12 * V_1 * V_2 / S_BASE
+            matrix[reduced_2, reduced_2] += y_22 * V_2 * V_2 / S_BASE
+    return matrix
+
+
+def test_matrix_matches_branch_by_branch(tables):
+    admittance = AdmittanceMatrix(tables)
+    assert admittance.nbr_buses == len(tables.buses) - len(tables.switches)
+    assert np.allclose(admittance.matrix.toarray(), get_reference_matrix(tables, admittance))
+    assert np.allclose(admittance.matrix.toarray(), admittance.matrix.toarray().T)
+
+
+def test_branch_switching_matches_rebuild(tables):
+    admittance = AdmittanceMatrix(tables)
+    initial = admittance.matrix.toarray()
+    rows = [0, 5, 17]
+    for row in rows:
+        assert admittance.set_branch_status(admittance.get_branch("line", row), False)
+    assert not admittance.set_branch_status(admittance.get_branch("line", rows[0]), False)
+
+    tables.lines["bus_1"][rows] = -1
+    rebuilt = AdmittanceMatrix(tables)
+    assert np.allclose(admittance.matrix.toarray(), rebuilt.matrix.toarray())
+    assert np.allclose(admittance.matrix.toarray(), get_reference_matrix(tables, admittance))
+
+    for row in rows:
+        admittance.set_branch_status(admittance.get_branch("line", row), True)
+    assert np.allclose(admittance.matrix.toarray(), initial)
+
+
+def test_low_rank_update_removes_the_branches(tables):
+    admittance = AdmittanceMatrix(tables)
+    branches = np.array([admittance.get_branch("line", 3), admittance.get_branch("twoWindingsTransformer", 1)])
+    incidence, blocks = admittance.get_update(branches)
+    updated = admittance.matrix + incidence @ blocks @ incidence.T
+
+    for branch in branches:
+        admittance.set_branch_status(branch, False)
+    assert np.allclose(updated.toarray(), admittance.matrix.toarray())
+
+
+def test_cache_is_keyed_on_the_network_fingerprint(grid_paths, tmp_path):
+    cache = ParseCache(str(tmp_path / "cache"))
+    admittance = AdmittanceMatrix.from_file(grid_paths["iidm"], cache=cache)
+    misses = cache.misses
+    cached = AdmittanceMatrix.from_file(grid_paths["iidm"], cache=cache)
+    assert cache.misses == misses
+    assert np.allclose(cached.matrix.toarray(), admittance.matrix.toarray())
+
+    # A copy of the file is parsed again, but the matrix is found from its fingerprint
+    copy = str(tmp_path / "copy.iidm")
+    shutil.copyfile(grid_paths["iidm"], copy)
+    with open(copy, "a", encoding="utf-8") as out_file:
+        out_file.write("\n")
+    hits = cache.hits
+    AdmittanceMatrix.from_file(copy, cache=cache)
+    assert cache.hits > hits
+
+    # So is the matrix of a network built in memory, until it is edited
+    network = DynawoGlobalParser(grid_paths["iidm"], _compact=True).parse()
+    hits = cache.hits
+    AdmittanceMatrix.from_network(network, cache=cache)
+    assert cache.hits == hits + 1
+
+    tables = NetworkTables(network)
+    tables.lines["reactance"][0] *= 2.0
+    tables.write_back()
+    misses = cache.misses
+    edited = AdmittanceMatrix.from_network(network, cache=cache)
+    assert cache.misses == misses + 1
+    assert np.allclose(edited.matrix.toarray(), AdmittanceMatrix(NetworkTables(network)).matrix.toarray())
+    assert not np.allclose(edited.matrix.toarray(), admittance.matrix.toarray())
+
+
+@pytest.mark.parametrize("s_base", [100.0, 1000.0])
+def test_cache_is_keyed_on_the_base_power(grid_paths, tmp_path, s_base):
+    cache = ParseCache(str(tmp_path / "cache"))
+    admittance = AdmittanceMatrix.from_file(grid_paths["iidm"], s_base, cache)
+    assert admittance.s_base == s_base
+    reference = AdmittanceMatrix.from_file(grid_paths["iidm"])
+    assert np.allclose(admittance.matrix.toarray() * s_base / S_BASE, reference.matrix.toarray())
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from cycosim.services.input_files.global_parser import DynawoGlobalParser
+from cycosim.services.power_system.network_tables import NetworkTables
+from cycosim.services.power_system.bus_reduction import BusReduction
+
+# The switches joining the buses of the meshed voltage level, as pairs of bus numbers
+MESHED_SWITCHES = [(bus, (bus + 1) % 8) for bus in range(8)] + [(0, 4), (2, 6), (1, 5), (8, 9)]
+
+
+def write_meshed_iidm(path: str):
+    """_summary_
+    Writes a voltage level of 10 buses joined by a ring of switches, some chords, and a pair of
+    buses joined by a switch, linked to the ring by two lines.
+    """
+    buses = "".join(f'        <iidm:bus id="B{bus}" v="400.0" angle="0.0"/>\n' for bus in range(10))
+    switches = "".join(
+        f'        <iidm:switch id="SW{bus_1}_{bus_2}" kind="BREAKER" retained="true" open="false" '
+        f'bus1="B{bus_1}" bus2="B{bus_2}"/>\n'
+        for bus_1, bus_2 in MESHED_SWITCHES
+    )
+    lines = "".join(
+        f'  <iidm:line id="L{bus_1}_{bus_2}" r="0.5" x="5.0" g1="0.0" b1="0.0" g2="0.0" b2="0.0" '
+        f'bus1="B{bus_1}" connectableBus1="B{bus_1}" voltageLevelId1="VL" '
+        f'bus2="B{bus_2}" connectableBus2="B{bus_2}" voltageLevelId2="VL"/>\n'
+        for bus_1, bus_2 in ((3, 8), (7, 9), (1, 2))
+    )
+    with open(path, "w", encoding="utf-8") as out_file:
+        out_file.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<iidm:network xmlns:iidm="http://www.itesla_project.eu/schema/iidm/1_0" id="meshed" '
+            'caseDate="2023-01-01T00:00:00.000+01:00" forecastDistance="0" sourceFormat="test">\n'
+            '  <iidm:substation id="S" country="FR">\n'
+            '    <iidm:voltageLevel id="VL" nominalV="400.0" topologyKind="BUS_BREAKER">\n'
+            "      <iidm:busBreakerTopology>\n"
+            f"{buses}{switches}"
+            "      </iidm:busBreakerTopology>\n"
+            "    </iidm:voltageLevel>\n"
+            "  </iidm:substation>\n"
+            f"{lines}"
+            "</iidm:network>\n"
+        )
+
+
+@pytest.fixture
+def meshed_tables(tmp_path) -> NetworkTables:
+    path = str(tmp_path / "meshed.iidm")
+    write_meshed_iidm(path)
+    return NetworkTables(DynawoGlobalParser(path, _compact=True).parse())
+
+
+def get_partition(reduction: BusReduction) -> set:
+    return {tuple(buses.tolist()) for buses in reduction.members}
+
+
+def check_against_recompute(reduction: BusReduction):
+    full = BusReduction(reduction.tables)
+    assert get_partition(reduction) == get_partition(full)
+    assert reduction.nbr_reduced_buses == full.nbr_reduced_buses
+    for reduced_bus, buses in enumerate(reduction.members):
+        assert (np.diff(buses) > 0).all()
+        assert (reduction.reduced_buses[buses] == reduced_bus).all()
+
+    indptr, original_buses = reduction.get_inverse_map()
+    assert sorted(original_buses.tolist()) == list(range(reduction.nbr_buses))
+    for reduced_bus, buses in enumerate(reduction.members):
+        assert (original_buses[indptr[reduced_bus] : indptr[reduced_bus + 1]] == buses).all()
+
+    # The same branches are kept, between the same sets of original buses
+    for flag_name, (rows, buses_1, buses_2) in reduction.get_branches().items():
+        full_rows, full_buses_1, full_buses_2 = full.get_branches()[flag_name]
+        assert (rows == full_rows).all()
+        for bus, full_bus in zip(np.r_[buses_1, buses_2], np.r_[full_buses_1, full_buses_2]):
+            assert (reduction.members[bus] == full.members[full_bus]).all()
+
+
+def test_initial_reduction(meshed_tables):
+    reduction = BusReduction(meshed_tables)
+    assert get_partition(reduction) == {tuple(range(8)), (8, 9)}
+    assert len(reduction.get_branches()["line"][0]) == 2
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_switching_matches_recompute(meshed_tables, seed):
+    rng = np.random.default_rng(seed)
+    reduction = BusReduction(meshed_tables)
+    for _ in range(60):
+        row = int(rng.integers(len(MESHED_SWITCHES)))
+        before = [set(buses.tolist()) for buses in reduction.members]
+        changed = reduction.set_switch(row, bool(rng.random() < 0.6))
+
+        # Every reduced bus left whose original buses changed is returned
+        after = [set(buses.tolist()) for buses in reduction.members]
+        moved = {bus for bus in range(len(after)) if bus >= len(before) or before[bus] != after[bus]}
+        assert moved <= set(changed)
+        check_against_recompute(reduction)
+
+
+def test_switching_the_generated_grid(tables):
+    reduction = BusReduction(tables)
+    assert reduction.nbr_reduced_buses == reduction.nbr_buses - len(tables.switches)
+    rng = np.random.default_rng(0)
+    for _ in range(40):
+        reduction.set_switch(int(rng.integers(len(tables.switches))), bool(rng.random() < 0.5))
+        check_against_recompute(reduction)
@@ -0,0 +1,89 @@
+import numpy as np
+import scipy.sparse as sp
+
+from cycosim.services.power_system.dc_power_flow import DCPowerFlow
+
+
+def get_incidence(power_flow: DCPowerFlow) -> sp.csr_matrix:
+    branches = np.arange(len(power_flow))
+    return sp.csr_matrix(
+        (
+            np.r_[np.ones(len(branches)), -np.ones(len(branches))],
+            (np.r_[branches, branches], np.r_[power_flow.branch_buses_1, power_flow.branch_buses_2]),
+        ),
+        shape=(len(power_flow), power_flow.nbr_buses),
+    )
+
+
+def get_balanced_injections(power_flow: DCPowerFlow, injections: np.ndarray) -> np.ndarray:
+    imbalances = power_flow.get_imbalances(injections)
+    balanced = injections + power_flow.participations * imbalances[power_flow.islands]
+    return np.where(power_flow.reference_buses[power_flow.islands] >= 0, balanced, 0.0)
+
+
+def test_nodal_balance(tables):
+    power_flow = DCPowerFlow(tables)
+    injections = power_flow.get_injections()
+    angles, flows = power_flow.solve(injections)
+
+    # The flows leaving every bus add up to its injection once the imbalance of its island is shared
+    balanced = get_balanced_injections(power_flow, injections)
+    assert np.allclose(get_incidence(power_flow).T @ flows, balanced, atol=1e-6)
+    assert np.allclose(power_flow.get_island_sums(balanced), 0.0, atol=1e-6)
+    assert (angles[power_flow.reference_buses] == 0.0).all()
+    assert np.isclose(power_flow.participations.sum(), power_flow.nbr_islands)
+
+
+def test_flows_match_a_dense_solve(tables):
+    power_flow = DCPowerFlow(tables)
+    injections = power_flow.get_injections()
+    incidence = get_incidence(power_flow).toarray()
+    susceptance = incidence.T @ np.diag(power_flow.susceptances) @ incidence
+
+    solved = power_flow.solved_buses
+    angles = np.zeros(power_flow.nbr_buses)
+    balanced = get_balanced_injections(power_flow, injections) / power_flow.s_base
+    angles[solved] = np.linalg.solve(susceptance[np.ix_(solved, solved)], balanced[solved])
+    expected = power_flow.s_base * power_flow.susceptances * (incidence @ angles)
+    assert np.allclose(power_flow.solve(injections)[1], expected)
+
+
+def test_batch_of_operating_points(tables):
+    power_flow = DCPowerFlow(tables)
+    rng = np.random.default_rng(0)
+    generation = np.nan_to_num(tables.generators["active_power_target"])[:, None] * rng.uniform(0.5, 1.5, (1, 4))
+    batch = power_flow.get_injections(generation)
+    loads = np.tile(tables.loads["active_power_setpoint"][:, None], 4)
+    assert np.allclose(batch, power_flow.get_injections(generation, loads))
+    _, flows = power_flow.solve(batch)
+    assert flows.shape == (len(power_flow), 4)
+    for column in range(4):
+        assert np.allclose(flows[:, column], power_flow.solve(batch[:, column])[1])
+
+    reports = power_flow.screen(batch, threshold=0.0)
+    assert len(reports) == 4
+    for column, report in enumerate(reports):
+        assert np.allclose(report.flows, flows[:, column])
+        loadings = [loading for _, _, _, loading in report.overloads]
+        assert loadings == sorted(loadings, reverse=True)
+        # The transformers have no limit, so no loading
+        assert len(loadings) == (np.abs(flows[:, column]) / power_flow.limits > 0.0).sum()
+
+
+def test_dead_island_carries_no_flow(tables):
+    transformers = tables.transformers
+    load_bus = transformers["bus_2"][0]
+    transformers["bus_1"][0] = -1
+    power_flow = DCPowerFlow(tables)
+
+    dead_bus = power_flow.reduction.reduced_buses[load_bus]
+    island = power_flow.islands[dead_bus]
+    assert power_flow.reference_buses[island] == -1
+    assert dead_bus not in power_flow.solved_buses
+
+    report = power_flow.screen()[0]
+    load = tables.loads["active_power_setpoint"][tables.loads["bus"] == load_bus].sum()
+    assert np.isclose(report.dead_load, load)
+    assert not report.is_secure()
+    balanced = get_balanced_injections(power_flow, power_flow.get_injections())
+    assert np.allclose(get_incidence(power_flow).T @ report.flows, balanced, atol=1e-6)
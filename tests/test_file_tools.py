@@ -0,0 +1,120 @@
+import os
+import json
+
+import pytest
+
+from cycosim.utils.file_tools import (
+    MANIFEST_NAME,
+    OutputManifest,
+    get_model_digest,
+    open_output_file,
+    serialize_output,
+)
+
+
+class CountingSerializer:
+    """_summary_
+    Serializer writing a fixed content and counting its calls.
+    """
+
+    def __init__(self, _output_path: str, _content: str = "content"):
+        self.output_path = _output_path
+        self.content = _content
+        self.nbr_calls = 0
+
+    def serialize(self):
+        self.nbr_calls += 1
+        with open_output_file(self.output_path) as out_file:
+            out_file.write(self.content)
+
+
+def get_tmp_files(directory) -> list:
+    return [name for name in os.listdir(directory) if name.endswith(".tmp")]
+
+
+def test_output_file_replaces_the_file_once_closed(tmp_path):
+    path = str(tmp_path / "out.txt")
+    with open(path, "w", encoding="utf-8") as out_file:
+        out_file.write("old")
+
+    with open_output_file(path) as out_file:
+        out_file.write("new")
+        with open(path, encoding="utf-8") as in_file:
+            assert in_file.read() == "old"
+    with open(path, encoding="utf-8") as in_file:
+        assert in_file.read() == "new"
+    assert get_tmp_files(tmp_path) == []
+
+    with open_output_file(path, binary=True) as out_file:
+        out_file.write(b"\x00\x01")
+    with open(path, "rb") as in_file:
+        assert in_file.read() == b"\x00\x01"
+
+
+def test_failed_write_keeps_the_previous_file(tmp_path):
+    path = str(tmp_path / "out.txt")
+    with open_output_file(path) as out_file:
+        out_file.write("complete")
+
+    with pytest.raises(RuntimeError):
+        with open_output_file(path) as out_file:
+            out_file.write("half")
+            raise RuntimeError("interrupted")
+    with open(path, encoding="utf-8") as in_file:
+        assert in_file.read() == "complete"
+    assert get_tmp_files(tmp_path) == []
+
+
+def test_model_digest():
+    assert get_model_digest("a", "b") == get_model_digest("a", "b")
+    assert get_model_digest("a", "b") != get_model_digest("ab")
+    assert get_model_digest("a", None) is None
+
+
+def test_manifest_skips_unchanged_files(tmp_path):
+    path = str(tmp_path / "model.txt")
+    serializer = CountingSerializer(path)
+    digest = get_model_digest("key", 1)
+
+    manifest = OutputManifest(str(tmp_path))
+    assert serialize_output(serializer, digest, manifest)
+    manifest.save()
+
+    # A new run reads the manifest back and leaves the file untouched
+    manifest = OutputManifest(str(tmp_path))
+    mtime_ns = os.stat(path).st_mtime_ns
+    assert not serialize_output(serializer, digest, manifest)
+    assert (manifest.nbr_written, manifest.nbr_skipped, serializer.nbr_calls) == (0, 1, 1)
+    assert os.stat(path).st_mtime_ns == mtime_ns
+
+    # A new digest, an unknown digest or no manifest write the file again
+    assert serialize_output(serializer, get_model_digest("key", 2), manifest)
+    assert serialize_output(serializer, None, manifest)
+    assert serialize_output(serializer, digest)
+    assert serializer.nbr_calls == 4
+
+
+def test_manifest_writes_modified_or_missing_files(tmp_path):
+    path = str(tmp_path / "model.txt")
+    serializer = CountingSerializer(path)
+    manifest = OutputManifest(str(tmp_path))
+    serialize_output(serializer, "digest", manifest)
+
+    with open(path, "a", encoding="utf-8") as out_file:
+        out_file.write(" edited")
+    assert serialize_output(serializer, "digest", manifest)
+    with open(path, encoding="utf-8") as in_file:
+        assert in_file.read() == "content"
+
+    os.remove(path)
+    assert serialize_output(serializer, "digest", manifest)
+    assert os.path.isfile(path)
+
+
+@pytest.mark.parametrize("content", ["not json", json.dumps({"version": -1, "files": {"model.txt": {}}}), "{}"])
+def test_unreadable_manifest_writes_everything(tmp_path, content):
+    with open(tmp_path / MANIFEST_NAME, "w", encoding="utf-8") as out_file:
+        out_file.write(content)
+    manifest = OutputManifest(str(tmp_path))
+    assert manifest.files == {}
+    assert serialize_output(CountingSerializer(str(tmp_path / "model.txt")), "digest", manifest)
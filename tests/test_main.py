@@ -0,0 +1,61 @@
+import os
+import sys
+import subprocess
+
+from cycosim.benchmarks.grid_generator import generate_grid
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_cycosim(directory: str, *options):
+    env = dict(os.environ, PYTHONPATH=ROOT_DIRECTORY)
+    subprocess.run(
+        [sys.executable, "-m", "cycosim", "--dynawo_data", "case", "--helics_data", "case/helics", "--no_cache"]
+        + list(options),
+        cwd=directory,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+
+
+def get_outputs(directory: str) -> dict:
+    """_summary_
+    Returns the (modification time, content) of every serialized file.
+    """
+    output_directory = os.path.join(directory, "case", "serialized")
+    outputs = {}
+    for name in os.listdir(output_directory):
+        with open(os.path.join(output_directory, name), "rb") as in_file:
+            outputs[name] = (os.stat(os.path.join(output_directory, name)).st_mtime_ns, in_file.read())
+    return outputs
+
+
+def test_unchanged_inputs_are_not_serialized_again(tmp_path):
+    paths = generate_grid(str(tmp_path / "case"), 40)
+    run_cycosim(str(tmp_path))
+    first = get_outputs(str(tmp_path))
+    assert {"generated.iidm", "generated.par", "generated.dyd", "generated.jobs", ".manifest.json"} <= set(first)
+    assert not [name for name in first if name.endswith(".tmp")]
+
+    run_cycosim(str(tmp_path))
+    second = get_outputs(str(tmp_path))
+    assert {name: output for name, output in second.items() if name != ".manifest.json"} == {
+        name: output for name, output in first.items() if name != ".manifest.json"
+    }
+
+    # Only the file serialized from the edited input is written again, as a full run would write it
+    with open(paths["par"], encoding="utf-8") as in_file:
+        content = in_file.read()
+    with open(paths["par"], "w", encoding="utf-8") as out_file:
+        out_file.write(content.replace('name="load_alpha" value="1.5"', 'name="load_alpha" value="1.25"'))
+    run_cycosim(str(tmp_path))
+    third = get_outputs(str(tmp_path))
+    changed = {name for name in first if name != ".manifest.json" and third[name] != first[name]}
+    assert changed == {"generated.par"}
+    assert b'value="1.25"' in third["generated.par"][1]
+
+    run_cycosim(str(tmp_path), "--rewrite_all")
+    rewritten = get_outputs(str(tmp_path))
+    assert all(rewritten[name][0] != third[name][0] for name in first if name != ".manifest.json")
+    assert all(rewritten[name][1] == third[name][1] for name in first if name != ".manifest.json")
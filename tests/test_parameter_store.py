@@ -0,0 +1,132 @@
+import pytest
+
+from cycosim.adapters.parsers.dynawo.par_parser import DynawoParserPAR
+from cycosim.adapters.serializers.dynawo.par_serializer import DynawoSerializerPAR
+from cycosim.adapters.simulations.dynawo_elements import DynawoParameterStore, DynawoParameterType
+
+# A PAR file written as the serializer writes it, with values whose text differs from their typed value
+PAR_CONTENT = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<parametersSet xmlns="http://www.rte-france.com/dynawo">\n'
+    '  <set id="GEN">\n'
+    '    <par type="DOUBLE" name="generator_H" value="5.400000"/>\n'
+    '    <par type="DOUBLE" name="generator_Snom" value="1e3"/>\n'
+    '    <par type="INT" name="generator_ExcitationPu" value="1.0"/>\n'
+    '    <par type="BOOL" name="generator_UseApproximation" value="TRUE"/>\n'
+    '    <par type="STRING" name="generator_Kind" value=" thermal "/>\n'
+    '    <reference name="generator_P0Pu" origData="IIDM" origName="p_pu" type="DOUBLE"/>\n'
+    "  </set>\n"
+    '  <set id="LOAD_1">\n'
+    '    <par type="DOUBLE" name="load_alpha" value="1.50"/>\n'
+    '    <par type="DOUBLE" name="load_beta" value="2.5"/>\n'
+    "  </set>\n"
+    '  <set id="LOAD_2">\n'
+    '    <par type="DOUBLE" name="load_alpha" value="1.50"/>\n'
+    '    <par type="DOUBLE" name="load_beta" value="2.5"/>\n'
+    "  </set>\n"
+    '  <set id="LOAD_3">\n'
+    '    <par type="DOUBLE" name="load_alpha" value="1.5"/>\n'
+    '    <par type="DOUBLE" name="load_beta" value="2.5"/>\n'
+    "  </set>\n"
+    '  <set id="LOAD_1">\n'
+    '    <par type="DOUBLE" name="load_alpha" value="1.50"/>\n'
+    '    <par type="DOUBLE" name="load_beta" value="2.5"/>\n'
+    "  </set>\n"
+    "</parametersSet>"
+)
+
+
+@pytest.fixture
+def par_file(tmp_path) -> str:
+    path = str(tmp_path / "input.par")
+    with open(path, "w", encoding="utf-8") as out_file:
+        out_file.write(PAR_CONTENT)
+    return path
+
+
+def serialize(store: DynawoParameterStore, path: str) -> str:
+    DynawoSerializerPAR(path, store).serialize()
+    with open(path, encoding="utf-8") as in_file:
+        return in_file.read()
+
+
+def test_round_trip_keeps_the_texts(par_file, tmp_path):
+    store = DynawoParserPAR(par_file).parse()
+    assert serialize(store, str(tmp_path / "output.par")) == PAR_CONTENT
+
+    generator = store.get_set("GEN")
+    assert generator.get_parameter("generator_H").value == "5.400000"
+    assert generator.get_value("generator_H") == 5.4
+    assert generator.get_parameter("generator_ExcitationPu").get_typed_value() == 1
+    assert generator.get_value("generator_UseApproximation") is True
+    assert generator.get_value("generator_Kind") == " thermal "
+    assert generator.get_reference("generator_P0Pu").original_name == "p_pu"
+
+
+def test_changed_values_are_written_from_their_type(par_file, tmp_path):
+    store = DynawoParserPAR(par_file).parse()
+    store.set_values("load_beta", {"LOAD_3": 3.0})
+    store.get_set("GEN").add_parameter("generator_H", DynawoParameterType.DOUBLE, 6.25)
+    store.get_set("GEN").add_parameter("generator_ExcitationPu", DynawoParameterType.INT, "2")
+
+    content = serialize(store, str(tmp_path / "output.par"))
+    assert '<par type="DOUBLE" name="generator_H" value="6.25"/>' in content
+    assert '<par type="INT" name="generator_ExcitationPu" value="2"/>' in content
+    assert '<par type="DOUBLE" name="generator_Snom" value="1e3"/>' in content
+    assert content.count('name="load_beta" value="3"') == 1
+    assert content.count('name="load_beta" value="2.5"') == 3
+
+    with pytest.raises(ValueError):
+        store.get_set("GEN").add_parameter("generator_H", DynawoParameterType.DOUBLE, "fast")
+
+
+def test_deduplicate_shares_identical_sets(par_file, tmp_path):
+    store = DynawoParserPAR(par_file).parse()
+    nbytes = store.nbytes()
+    # The third load writes 1.5 instead of 1.50, so it keeps its own payload
+    assert store.deduplicate() == 2
+    assert store.deduplicate() == 0
+    assert store.set_parameters[1] is store.set_parameters[2] is store.set_parameters[4]
+    assert store.set_parameters[3] is not store.set_parameters[1]
+    assert store.nbytes() < nbytes
+
+    assert serialize(store, str(tmp_path / "output.par")) == PAR_CONTENT
+    assert sorted(store.get_rows("load_alpha")) == [1, 2, 3, 4]
+    assert store.get_values("load_beta") == {"LOAD_1": 2.5, "LOAD_2": 2.5, "LOAD_3": 2.5}
+
+
+def test_modified_shared_set_gets_its_own_payload(par_file):
+    store = DynawoParserPAR(par_file).parse()
+    store.deduplicate()
+
+    store.get_set("LOAD_2").add_parameter("load_alpha", DynawoParameterType.DOUBLE, 2.0)
+    assert store[2].get_value("load_alpha") == 2.0
+    assert store[1].get_value("load_alpha") == store[4].get_value("load_alpha") == 1.5
+    assert store[1].get_parameter("load_alpha").value == "1.50"
+    assert store.set_parameters[1] is store.set_parameters[4]
+    assert store.set_parameters[2] is not store.set_parameters[1]
+
+    # The value given to every set sharing a payload is written in the payload itself
+    store.set_values("load_beta", {"LOAD_1": 4.0})
+    assert store.set_parameters[1] is store.set_parameters[4]
+    assert [param_set.get_value("load_beta") for param_set in store] == [None, 4.0, 2.5, 2.5, 4.0]
+
+    # A set added afterwards holds its own copy
+    store[4].add_parameter("load_gamma", DynawoParameterType.INT, 3)
+    assert "load_gamma" not in store[1].parameters
+    assert list(store[4].parameters) == ["load_alpha", "load_beta", "load_gamma"]
+    assert store.get_rows("load_gamma") == [4]
+
+
+def test_renamed_set_keeps_the_next_set_of_its_id(par_file):
+    store = DynawoParserPAR(par_file).parse()
+    store[1].id = "LOAD_0"
+    assert store.get_set("LOAD_1").row == 4
+    assert store.get_set("LOAD_0").row == 1
+
+    store[4].id = "LOAD_0"
+    assert store.get_set("LOAD_1") is None
+    assert store.get_set("LOAD_0").row == 1
+    store[1].id = "GEN"
+    assert store.get_set("GEN").row == 0
+    assert store.get_set("LOAD_0").row == 4
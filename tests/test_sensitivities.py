@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from cycosim.services.power_system.dc_power_flow import DCPowerFlow
+from cycosim.services.power_system.sensitivities import Sensitivities, OutageRanking, select_top
+
+# Low enough for the outages of the generated grid to overload some branches
+THRESHOLD = 0.08
+
+ALL_KINDS = ("line", "transformer", "generator")
+
+
+@pytest.fixture
+def sensitivities(tables) -> Sensitivities:
+    # A small block memory, so that the outages are split in several blocks
+    return Sensitivities(DCPowerFlow(tables), 200_000)
+
+
+def rate_resolved_outage(sensitivities: Sensitivities, excluded: int = -1) -> tuple:
+    """_summary_
+    Returns the OutageRanking and the dead load of a full DC power flow of the tables as they are,
+    its flows being put back in the order of the branches of the sensitivities.
+    """
+    power_flow = DCPowerFlow(sensitivities.power_flow.tables)
+    report = power_flow.screen()[0]
+    rows = {branch_id: branch for branch, branch_id in enumerate(power_flow.branch_ids)}
+    branch_ids = sensitivities.power_flow.branch_ids
+    flows = np.array([report.flows[rows[branch_id]] if branch_id in rows else 0.0 for branch_id in branch_ids])
+    ranking = OutageRanking("resolved", "resolved")
+    sensitivities.rate_flows([ranking], flows[:, None], np.array([excluded]), THRESHOLD)
+    return ranking, report.dead_load
+
+
+def check_ranking(ranking: OutageRanking, expected: OutageRanking):
+    assert ranking.severity == pytest.approx(expected.severity, abs=1e-6)
+    assert ranking.nbr_overloads == expected.nbr_overloads
+    assert np.nan_to_num(ranking.max_loading) == pytest.approx(np.nan_to_num(expected.max_loading), abs=1e-9)
+
+
+def test_distributed_ptdf_matches_solves(sensitivities):
+    power_flow = sensitivities.power_flow
+    injections = np.eye(power_flow.nbr_buses)
+    ptdf = sensitivities.get_ptdf(distributed=True)
+    assert np.allclose(ptdf, power_flow.solve(injections)[1])
+
+
+def test_branch_outages_match_resolves(sensitivities):
+    power_flow = sensitivities.power_flow
+    tables = power_flow.tables
+    rankings = sensitivities.rank_branch_outages(threshold=THRESHOLD)
+    assert any(ranking.islanding for ranking in rankings)
+    assert any(ranking.severity > 0.0 for ranking in rankings)
+
+    for branch, ranking in enumerate(rankings):
+        table = tables.tables[("line", "twoWindingsTransformer")[power_flow.branch_kinds[branch]]]
+        row = table.row(ranking.element_id)
+        bus = table["bus_1"][row]
+        table["bus_1"][row] = -1
+        expected, dead_load = rate_resolved_outage(sensitivities, branch)
+        table["bus_1"][row] = bus
+
+        check_ranking(ranking, expected)
+        assert ranking.lost_load == pytest.approx(dead_load, abs=1e-6)
+
+
+def test_generator_outages_match_resolves(sensitivities):
+    generators = sensitivities.power_flow.tables.generators
+    rankings = sensitivities.rank_generator_outages(threshold=THRESHOLD)
+    assert len(rankings) == len(generators)
+
+    for row, ranking in enumerate(rankings):
+        bus = generators["bus"][row]
+        generators["bus"][row] = -1
+        expected, dead_load = rate_resolved_outage(sensitivities)
+        generators["bus"][row] = bus
+
+        check_ranking(ranking, expected)
+        assert ranking.lost_load == pytest.approx(dead_load, abs=1e-6)
+
+
+def test_islanding_bounds_hold(sensitivities):
+    base_flows = sensitivities.get_base_flows()
+    outages = []
+    sensitivities.rank_branch_outages(None, THRESHOLD, base_flows, outages)
+    outages = np.array(outages)
+    rankings = sensitivities.rank_islanding_outages(outages, THRESHOLD, base_flows)
+    severities = np.array([ranking.severity for ranking in rankings])
+    loadings = np.nan_to_num([ranking.max_loading for ranking in rankings])
+
+    # The loose bounds, then the bounds refined by the PTDF rows of the branches above the given loading
+    for kth_loading in (np.inf, 0.1, 0.05):
+        bounds = sensitivities.get_islanding_bounds(outages, base_flows, THRESHOLD, kth_loading)
+        severity_bounds, loading_bounds = bounds
+        assert (severities <= severity_bounds + 1e-6).all()
+        assert (loadings <= np.maximum(loading_bounds, kth_loading) + 1e-9).all()
+
+
+@pytest.mark.parametrize("top_k", [0, 1, 3, 10, 1000])
+@pytest.mark.parametrize("threshold", [THRESHOLD, 1.0])
+def test_top_outages_match_the_full_ranking(sensitivities, top_k, threshold):
+    base_flows = sensitivities.get_base_flows()
+    rankings = sensitivities.rank_branch_outages(None, threshold, base_flows)
+    rankings += sensitivities.rank_generator_outages(None, threshold, base_flows)
+    expected = select_top(rankings, top_k)
+
+    top = sensitivities.get_top_outages(top_k, threshold, ALL_KINDS)
+    assert len(top) == min(top_k, len(rankings))
+    for ranking, expected_ranking in zip(top, expected):
+        assert ranking.severity == pytest.approx(expected_ranking.severity, abs=1e-6)
+        assert np.nan_to_num(ranking.max_loading) == pytest.approx(np.nan_to_num(expected_ranking.max_loading))
+
+    scores = [(ranking.severity, np.nan_to_num(ranking.max_loading)) for ranking in top]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_top_outages_of_given_elements(sensitivities):
+    element_ids = set(sensitivities.power_flow.branch_ids[:5]) | {sensitivities.power_flow.tables.generators.ids[0]}
+    top = sensitivities.get_top_outages(100, THRESHOLD, ALL_KINDS, element_ids)
+    assert {ranking.element_id for ranking in top} == element_ids
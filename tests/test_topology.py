@@ -0,0 +1,76 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+
+from cycosim.utils.union_find import union_edges, get_labels
+from cycosim.services.power_system.topology import Topology
+
+
+def get_reference_labels(nbr_nodes: int, nodes_1: np.ndarray, nodes_2: np.ndarray) -> tuple:
+    graph = sp.coo_matrix((np.ones(len(nodes_1)), (nodes_1, nodes_2)), shape=(nbr_nodes, nbr_nodes))
+    return connected_components(graph, directed=False)
+
+
+def test_union_edges_matches_connected_components():
+    rng = np.random.default_rng(0)
+    for nbr_nodes, nbr_edges in ((1, 0), (10, 0), (50, 30), (200, 150), (200, 400), (1000, 990)):
+        nodes_1 = rng.integers(0, nbr_nodes, nbr_edges)
+        nodes_2 = rng.integers(0, nbr_nodes, nbr_edges)
+        roots = union_edges(np.arange(nbr_nodes), nodes_1, nodes_2)
+
+        assert (roots[roots] == roots).all()
+        assert (roots <= np.arange(nbr_nodes)).all()
+        nbr_sets, labels = get_labels(roots)
+        nbr_components, components = get_reference_labels(nbr_nodes, nodes_1, nodes_2)
+        assert nbr_sets == nbr_components
+        assert (labels == components).all()
+
+
+def test_union_edges_from_merged_roots():
+    rng = np.random.default_rng(1)
+    nodes_1, nodes_2 = rng.integers(0, 300, 250), rng.integers(0, 300, 250)
+    roots = union_edges(np.arange(300), nodes_1[:100], nodes_2[:100])
+    roots = union_edges(roots, nodes_1[100:], nodes_2[100:])
+    nbr_sets, labels = get_labels(roots)
+    nbr_components, components = get_reference_labels(300, nodes_1, nodes_2)
+    assert nbr_sets == nbr_components
+    assert (labels == components).all()
+
+
+def test_long_chain_is_a_single_set():
+    nodes = np.random.default_rng(2).permutation(5000)
+    roots = union_edges(np.arange(5000), nodes[:-1], nodes[1:])
+    assert (roots == 0).all()
+
+
+def test_islands_of_the_generated_grid(tables):
+    topology = Topology(tables)
+    assert topology.nbr_islands == 1
+    assert topology.get_summary()["energized"].all()
+    assert (topology.get_degrees() > 0).all()
+
+    # Disconnecting a transformer isolates the bus of its load
+    transformers = tables.transformers
+    row = 0
+    load_bus = transformers["bus_2"][row]
+    transformers["bus_1"][row] = -1
+    topology = Topology(tables)
+
+    assert topology.nbr_islands == 2
+    island = topology.islands[load_bus]
+    assert (topology.islands == island).sum() == 1
+    summary = topology.get_summary()
+    assert not summary["energized"][island]
+    assert summary["loads"][island] == 1
+    assert topology.get_disconnected_buses() == [tables.buses.ids[load_bus]]
+
+
+def test_opened_switch_isolates_the_load_bus(tables):
+    # The load bus of a substation is only coupled to the other bus by its switch
+    switches = tables.switches
+    topology = Topology(tables)
+    switches["is_open"][0] = True
+    opened = Topology(tables)
+    assert len(opened) == len(topology) - 1
+    assert opened.nbr_islands == 2
+    assert opened.islands[switches["bus_1"][0]] != opened.islands[switches["bus_2"][0]]